@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""Benchmarks for arnoldos.py hot paths on synthetic or sample data (no Google access needed).
+
+Each benchmark runs the current implementation next to the straightforward
+reference it replaced, so a speedup never hides a behaviour change: conflicts
+must match exactly, and domain inference lists every capture whose answer moved.
+
+Usage:
+  python3 arnoldos-bench.py conflicts [--events 5000] [--days 30] [--buffer 0] [--seed 1]
+  python3 arnoldos-bench.py domains [--corpus FILE] [--repeat 200]
+
+domains --corpus takes one capture per line or a tasks cache (memory/cache/tasks.json);
+lines/titles starting with a [DOMAIN] tag are scored for accuracy against that tag.
+"""
+
+import sys, os, json, random, time
+from datetime import datetime, timedelta
+sys.path.insert(0, os.path.join(os.path.dirname(__file__)))
+from arnoldos import (CST, DOMAIN_KEYWORDS, PRIORITY_ORDER, TAG_PATTERN, detect_conflicts,
+                      flatten_events, infer_domain)
+
+
+# --- Conflicts ---
+def synthetic_calendars(n_events: int, days: int, seed: int) -> dict:
+    """Calendar API-shaped events spread over PRIORITY_ORDER: mostly 30–120 min
+    meetings in working hours, plus some all-day and multi-day entries."""
+    rng = random.Random(seed)
+    origin = datetime(2026, 3, 1, tzinfo=CST)
+    calendars = {name: [] for name in PRIORITY_ORDER}
+    for i in range(n_events):
+        domain = rng.choice(PRIORITY_ORDER)
+        day = origin + timedelta(days=rng.randrange(days))
+        kind = rng.random()
+        if kind < 0.03:
+            span = rng.choice([1, 1, 2, 3])
+            event = {"start": {"date": day.strftime("%Y-%m-%d")},
+                     "end": {"date": (day + timedelta(days=span)).strftime("%Y-%m-%d")}}
+        else:
+            start = day + timedelta(hours=rng.randrange(6, 21), minutes=rng.choice([0, 15, 30, 45]))
+            length = timedelta(hours=rng.randrange(20, 40)) if kind < 0.04 else timedelta(minutes=rng.choice([30, 45, 60, 90, 120]))
+            event = {"start": {"dateTime": start.isoformat()}, "end": {"dateTime": (start + length).isoformat()}}
+        event["summary"] = f"{domain} {i}"
+        calendars[domain].append(event)
+    return calendars
+
+
+def pairwise_conflicts(all_events: dict, buffer_minutes: int, include_all_day: bool) -> list:
+    """The original O(n²) check over every pair, extended with the buffer."""
+    buffer = timedelta(minutes=buffer_minutes)
+    flat = flatten_events(all_events, include_all_day)
+    conflicts = []
+    for i in range(len(flat)):
+        for j in range(i + 1, len(flat)):
+            a, b = flat[i], flat[j]
+            if a["domain"] == b["domain"]:
+                continue
+            if a["start"] < b["end"] + buffer and b["start"] < a["end"] + buffer:
+                conflicts.append((a, b))
+    return conflicts
+
+
+def pair_keys(conflicts: list) -> set:
+    return {frozenset((a["summary"], b["summary"])) for a, b in conflicts}
+
+
+def timed(fn, *args):
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, (time.perf_counter() - start) * 1000
+
+
+def bench_conflicts(n_events: int, days: int, buffer_minutes: int, seed: int):
+    calendars = synthetic_calendars(n_events, days, seed)
+    print(f"{n_events} events over {days} days, buffer {buffer_minutes} min")
+    for include_all_day in (False, True):
+        swept, sweep_ms = timed(detect_conflicts, calendars, buffer_minutes, include_all_day)
+        pairs, pair_ms = timed(pairwise_conflicts, calendars, buffer_minutes, include_all_day)
+        same = pair_keys(swept) == pair_keys(pairs) and len(swept) == len(pairs)
+        label = "timed+all-day" if include_all_day else "timed only"
+        print(f"  {label:14} {len(swept):6} conflicts  sweep {sweep_ms:8.1f} ms  "
+              f"pairwise {pair_ms:9.1f} ms  ({pair_ms / max(sweep_ms, 0.001):.0f}x)  "
+              f"{'match' if same else 'MISMATCH'}")
+        if not same:
+            sys.exit(1)
+
+
+# --- Domain inference ---
+SAMPLE_CAPTURES = [
+    "[CHAPEL] UCG Passover reminder March 31",
+    "[CHAPEL] Review liturgy for Sabbath service",
+    "[CHAPEL] Chaplain meeting at the correctional facility",
+    "[CHAPEL] Prep feast of tabernacles schedule",
+    "[CHAPEL] Systematic theology reading ch 4",
+    "[MINISTRY] finish sermon draft",
+    "[MINISTRY] Sermon prep: Feb 15",
+    "[MINISTRY] Write sermon outline",
+    "[MINISTRY] Review sermon notes",
+    "[MINISTRY] Email pastor about stone church bulletin",
+    "[MINISTRY] Brainstorm homily on Romans 8",
+    "[MINISTRY] Prayer list for Sunday congregation",
+    "[TRADING] review bitcoin chart Friday",
+    "[TRADING] Rebalance portfolio and DCA into BTC",
+    "[TRADING] Check glassnode data on exchange flows",
+    "[TRADING] TSLA position review after earnings",
+    "[TRADING] Update data on crypto market",
+    "[TRADING] Ask the trader group about entries",
+    "[TRADING] Feeling bullish into the weekend",
+    "[DEV] Fix bug",
+    "[DEV] fix dashboard cache bug",
+    "[DEV] Open PR for the calendar refactor",
+    "[DEV] Deploy clawdbot server update",
+    "[DEV] Write python script to parse data",
+    "[DEV] Merge branch and run tests",
+    "[FAMILY] dentist appointment Thursday",
+    "[FAMILY] Pick up groceries",
+    "[FAMILY] Call school about kids schedule",
+    "[FAMILY] Household repair — leaky faucet",
+    "[CONTENT] Record YouTube video on Romans",
+    "[CONTENT] Edit podcast audio",
+    "[CONTENT] Make thumbnail for channel upload",
+    "[PERSONAL] Gym workout",
+    "[PERSONAL] Book vacation travel",
+    "[PERSONAL] Birthday gift ideas",
+    "[PERSONAL] Read new book on prayer",
+    "[PERSONAL] Trim beard",
+]
+
+
+def legacy_infer_domain(text: str) -> tuple:
+    """infer_domain before the compiled matcher: a substring search per keyword."""
+    text_lower = text.lower()
+    matches = {}
+    for domain, keywords in DOMAIN_KEYWORDS.items():
+        matched = [kw for kw in keywords if kw in text_lower]
+        if matched:
+            matches[domain] = matched
+    if not matches:
+        return (None, "none", [])
+    if len(matches) == 1:
+        domain = list(matches.keys())[0]
+        return (domain, "high", matches[domain])
+    sorted_matches = sorted(matches.items(), key=lambda x: len(x[1]), reverse=True)
+    if len(sorted_matches[0][1]) >= len(sorted_matches[1][1]) + 2:
+        return (sorted_matches[0][0], "medium", sorted_matches[0][1])
+    return (None, "low", list(matches.keys()))
+
+
+def load_corpus(path: str) -> list:
+    """[(text, expected domain or None)] from a text file or tasks cache JSON."""
+    if path is None:
+        lines = SAMPLE_CAPTURES
+    elif path.endswith(".json"):
+        with open(path) as f:
+            data = json.load(f)
+        lines = [t["raw"] for tasks in data.get("domains", {}).values() for t in tasks]
+    else:
+        with open(path) as f:
+            lines = [line.strip() for line in f if line.strip()]
+    corpus = []
+    for line in lines:
+        tag = TAG_PATTERN.match(line)
+        if tag and tag.group(1).upper() in DOMAIN_KEYWORDS:
+            corpus.append((line[tag.end():].strip(), tag.group(1).upper()))
+        else:
+            corpus.append((line, None))
+    return corpus
+
+
+def bench_domains(path: str, repeat: int):
+    corpus = load_corpus(path)
+    print(f"{len(corpus)} captures from {path or 'built-in sample'}, x{repeat}")
+    texts = [text for text, _ in corpus] * repeat
+    labelled = [(text, want) for text, want in corpus if want]
+    for name, fn in (("substring", legacy_infer_domain), ("compiled", infer_domain)):
+        _, ms = timed(lambda: [fn(t) for t in texts])
+        line = f"  {name:10} {ms / len(texts) * 1000:6.1f} µs/capture"
+        if labelled:
+            results = [fn(text)[0] for text, _ in labelled]
+            right = sum(1 for got, (_, want) in zip(results, labelled) if got == want)
+            wrong = sum(1 for got, (_, want) in zip(results, labelled) if got and got != want)
+            line += f"  correct {right}/{len(labelled)}  wrong {wrong}  undecided {len(labelled) - right - wrong}"
+        print(line)
+    changed = [(text, legacy_infer_domain(text)[0], infer_domain(text)[0])
+               for text, _ in corpus if legacy_infer_domain(text)[0] != infer_domain(text)[0]]
+    for text, old, new in changed:
+        print(f"    {old or '-':>9} -> {new or '-':<9} {text}")
+
+
+def option(args: list, name: str, default: int) -> int:
+    if name in args:
+        return int(args[args.index(name) + 1])
+    return default
+
+
+if __name__ == "__main__":
+    args = sys.argv[1:]
+    if args and args[0] == "conflicts":
+        bench_conflicts(option(args, "--events", 5000), option(args, "--days", 30),
+                        option(args, "--buffer", 0), option(args, "--seed", 1))
+    elif args and args[0] == "domains":
+        corpus = args[args.index("--corpus") + 1] if "--corpus" in args else None
+        bench_domains(corpus, option(args, "--repeat", 200))
+    else:
+        print(__doc__)
+        sys.exit(1)
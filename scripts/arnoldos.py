@@ -13,6 +13,7 @@ Usage:
   python3 arnoldos.py tasks          # All incomplete tasks grouped by domain
   python3 arnoldos.py conflicts      # Check today for scheduling conflicts
   python3 arnoldos.py conflicts-week # Check this week for conflicts
+  python3 arnoldos.py conflicts --buffer 15 --all-day  # Include travel time / all-day events
   python3 arnoldos.py drive-inbox    # List files in Drive 00_Inbox
   python3 arnoldos.py brief          # Full morning brief output
   python3 arnoldos.py calendars      # List all calendar names/IDs
@@ -27,16 +28,34 @@ Usage:
   python3 arnoldos.py drive-upload <folder_key> <filename> <local_path>     # Upload file to Drive
   python3 arnoldos.py quick <text> [--domain DOMAIN]                         # Quick task with auto-domain
   python3 arnoldos.py quick-event <text> [--domain DOMAIN]                   # Quick event with auto-domain
+  python3 arnoldos.py quick --batch [FILE] [--domain DOMAIN]                 # One task per line (stdin default)
+  python3 arnoldos.py serve                       # Daemon: keep memory/cache/*.json fresh
+  python3 arnoldos.py refresh [today|tasks|week|preaching]  # Refresh caches now (via daemon if running)
+
+Add --json for machine-readable output, --stats for per-endpoint API latency on stderr.
 """
 
+import atexit
 import sys
+import heapq
 import json
 import os
+import random
 import re
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from difflib import SequenceMatcher
 from typing import Optional
+from urllib.parse import urlencode, urlsplit
 
 import requests
+import requests.adapters
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 
@@ -105,6 +124,31 @@ TAG_PATTERN = re.compile(r'^[\[\(](MINISTRY|CHAPEL|TRADING|DEV|FAMILY|PERSONAL|C
 
 
 # --- Auth ---
+def write_json_atomic(path: str, data, indent: int = 2, mode: int = 0o600):
+    """Write JSON via a temp file + rename so readers never see a partial file."""
+    fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+    try:
+        if mode != 0o600:
+            os.fchmod(fd, mode)
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=indent, default=str)
+        os.replace(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def save_token(creds: Credentials):
+    """Write a refreshed access token back to TOKEN_FILE atomically (mode 600)."""
+    with open(TOKEN_FILE) as f:
+        t = json.load(f)
+    t["token"] = creds.token
+    write_json_atomic(TOKEN_FILE, t)
+
+
 def get_creds() -> Credentials:
     """Load and refresh Google OAuth credentials."""
     if not os.path.exists(TOKEN_FILE):
@@ -126,10 +170,8 @@ def get_creds() -> Credentials:
 
     if creds.expired or not creds.valid:
         try:
-            creds.refresh(Request())
-            t["token"] = creds.token
-            with open(TOKEN_FILE, "w") as f:
-                json.dump(t, f, indent=2)
+            creds.refresh(Request(session=get_session()))
+            save_token(creds)
         except Exception as e:
             print(f"RE-AUTH NEEDED: Token refresh failed — {e}")
             print("Run: python3 ~/clawd/scripts/google-oauth.py auth")
@@ -138,22 +180,136 @@ def get_creds() -> Credentials:
     return creds
 
 
+_refresh_lock = threading.Lock()
+
+
+def refresh_creds(creds: Credentials, stale_token: str) -> bool:
+    """Refresh after a 401, once no matter how many threads saw the stale token.
+
+    Returns True if creds now hold a different token than stale_token.
+    """
+    with _refresh_lock:
+        if creds.token != stale_token:
+            return True  # another caller already refreshed
+        try:
+            creds.refresh(Request(session=get_session()))
+            save_token(creds)
+        except Exception:
+            return False
+        return True
+
+
+# --- HTTP Client ---
+# One pooled session for every Google call, so cron commands reuse TLS
+# connections instead of handshaking per request.
+MAX_RETRIES = 4
+BACKOFF_BASE = 0.5  # seconds; doubles per attempt, full jitter
+BACKOFF_CAP = 8.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# A POST that got a 5xx may still have been applied; only retry when Google says it wasn't
+POST_RETRY_STATUSES = {429, 503}
+IDEMPOTENT_METHODS = {"GET", "PATCH", "PUT", "DELETE"}
+# Upper bound on requests in flight at once from fan-out helpers
+MAX_CONCURRENT_REQUESTS = 6
+
+_session = None
+_session_lock = threading.Lock()
+_stats = {}  # endpoint -> counters, see api_stats()
+_stats_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    global _session
+    with _session_lock:
+        if _session is None:
+            _session = requests.Session()
+            adapter = requests.adapters.HTTPAdapter(pool_connections=4, pool_maxsize=16)
+            _session.mount("https://", adapter)
+        return _session
+
+
+def endpoint_name(method: str, url: str) -> str:
+    """Stats key for a request: path with IDs collapsed, e.g. 'GET calendar/v3/calendars/{id}/events'."""
+    path = urlsplit(url).path.strip("/")
+    parts = [p if re.fullmatch(r"[a-z]+|v\d+(\.\d+)?", p) else "{id}" for p in path.split("/")]
+    return f"{method} {'/'.join(parts)}"
+
+
+def record_call(endpoint: str, elapsed: float, retried: bool, failed: bool):
+    with _stats_lock:
+        s = _stats.setdefault(endpoint, {"calls": 0, "retries": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+        ms = elapsed * 1000
+        s["calls"] += 1
+        s["retries"] += retried
+        s["errors"] += failed
+        s["total_ms"] += ms
+        s["max_ms"] = max(s["max_ms"], ms)
+
+
+def api_stats() -> dict:
+    """Per-endpoint latency counters for every HTTP attempt made by this process."""
+    with _stats_lock:
+        return {
+            endpoint: {**s, "total_ms": round(s["total_ms"], 1), "max_ms": round(s["max_ms"], 1),
+                       "avg_ms": round(s["total_ms"] / s["calls"], 1)}
+            for endpoint, s in sorted(_stats.items())
+        }
+
+
+def backoff_delay(attempt: int, response=None) -> float:
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+    retry_after = response.headers.get("Retry-After") if response is not None else None
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, min(float(retry_after), BACKOFF_CAP * 4))
+    return delay
+
+
+def api_request(creds: Credentials, method: str, url: str, timeout: float = 15, **kwargs) -> requests.Response:
+    """Authenticated request through the shared session.
+
+    Refreshes the token once on 401 and retries 429/5xx and connection errors
+    with exponential backoff. Returns the final response; raises
+    requests.RequestException if the network never answered.
+    """
+    endpoint = endpoint_name(method, url)
+    retry_statuses = POST_RETRY_STATUSES if method == "POST" else RETRY_STATUSES
+    extra_headers = kwargs.pop("headers", {})
+    refreshed = False
+    attempt = 0
+    while True:
+        token = creds.token
+        headers = {"Authorization": f"Bearer {token}", **extra_headers}
+        start = time.monotonic()
+        try:
+            r = get_session().request(method, url, headers=headers, timeout=timeout, **kwargs)
+        except requests.RequestException as e:
+            # Connect failures never reached Google; read timeouts only retry if idempotent
+            retryable = isinstance(e, requests.ConnectionError) or (
+                isinstance(e, requests.Timeout) and method in IDEMPOTENT_METHODS)
+            record_call(endpoint, time.monotonic() - start, attempt > 0, True)
+            if not retryable or attempt >= MAX_RETRIES:
+                raise
+            time.sleep(backoff_delay(attempt))
+            attempt += 1
+            continue
+
+        failed = r.status_code >= 400
+        record_call(endpoint, time.monotonic() - start, attempt > 0, failed)
+        if r.status_code == 401 and not refreshed:
+            refreshed = True
+            if refresh_creds(creds, token):
+                continue
+        if r.status_code in retry_statuses and attempt < MAX_RETRIES:
+            time.sleep(backoff_delay(attempt, r))
+            attempt += 1
+            continue
+        return r
+
+
 def api_get(creds: Credentials, url: str, params: dict = None) -> Optional[dict]:
     """Make an authenticated GET request. Returns None on failure (graceful degradation)."""
     try:
-        r = requests.get(url, headers={"Authorization": f"Bearer {creds.token}"}, params=params, timeout=15)
-        if r.status_code == 401:
-            # Try one refresh
-            try:
-                creds.refresh(Request())
-                with open(TOKEN_FILE) as f:
-                    t = json.load(f)
-                t["token"] = creds.token
-                with open(TOKEN_FILE, "w") as f:
-                    json.dump(t, f, indent=2)
-                r = requests.get(url, headers={"Authorization": f"Bearer {creds.token}"}, params=params, timeout=15)
-            except Exception:
-                pass
+        r = api_request(creds, "GET", url, params=params)
         if r.status_code != 200:
             print(f"  ⚠️ API error ({r.status_code}) for {url.split('/')[-1]}")
             return None
@@ -163,23 +319,39 @@ def api_get(creds: Credentials, url: str, params: dict = None) -> Optional[dict]
         return None
 
 
+def api_pages(creds: Credentials, url: str, params: dict, first_page: dict = None):
+    """Yield (status, JSON body) for each page of a list endpoint, following nextPageToken.
+
+    first_page is an already-fetched first body (e.g. from a batch). The stream
+    ends after the last page, or right after a failed one (status 0 when the
+    API couldn't be reached, with the error printed). Stop iterating to end
+    early; no further pages are fetched.
+    """
+    params = dict(params)
+    page = first_page
+    while True:
+        if page is None:
+            try:
+                r = api_request(creds, "GET", url, params=params)
+            except requests.RequestException as e:
+                print(f"  ⚠️ Network error: {e}", file=sys.stderr)
+                yield 0, None
+                return
+            if r.status_code != 200:
+                yield r.status_code, None
+                return
+            page = r.json()
+        yield 200, page
+        if not page.get("nextPageToken"):
+            return
+        params["pageToken"] = page["nextPageToken"]
+        page = None
+
+
 def api_patch(creds: Credentials, url: str, body: dict) -> Optional[dict]:
     """Make an authenticated PATCH request. Returns None on failure."""
     try:
-        headers = {"Authorization": f"Bearer {creds.token}", "Content-Type": "application/json"}
-        r = requests.patch(url, headers=headers, json=body, timeout=15)
-        if r.status_code == 401:
-            try:
-                creds.refresh(Request())
-                with open(TOKEN_FILE) as f:
-                    t = json.load(f)
-                t["token"] = creds.token
-                with open(TOKEN_FILE, "w") as f:
-                    json.dump(t, f, indent=2)
-                headers["Authorization"] = f"Bearer {creds.token}"
-                r = requests.patch(url, headers=headers, json=body, timeout=15)
-            except Exception:
-                pass
+        r = api_request(creds, "PATCH", url, json=body)
         if r.status_code != 200:
             print(f"  ⚠️ API error ({r.status_code}) for PATCH {url.split('/')[-1]}")
             return None
@@ -191,20 +363,7 @@ def api_patch(creds: Credentials, url: str, body: dict) -> Optional[dict]:
 def api_post(creds: Credentials, url: str, body: dict) -> Optional[dict]:
     """Make an authenticated POST request. Returns None on failure."""
     try:
-        headers = {"Authorization": f"Bearer {creds.token}", "Content-Type": "application/json"}
-        r = requests.post(url, headers=headers, json=body, timeout=15)
-        if r.status_code == 401:
-            try:
-                creds.refresh(Request())
-                with open(TOKEN_FILE) as f:
-                    t = json.load(f)
-                t["token"] = creds.token
-                with open(TOKEN_FILE, "w") as f:
-                    json.dump(t, f, indent=2)
-                headers["Authorization"] = f"Bearer {creds.token}"
-                r = requests.post(url, headers=headers, json=body, timeout=15)
-            except Exception:
-                pass
+        r = api_request(creds, "POST", url, json=body)
         if r.status_code not in (200, 201):
             print(f"  ⚠️ API error ({r.status_code}) for POST {url.split('/')[-1]}: {r.text[:200]}")
             return None
@@ -214,34 +373,272 @@ def api_post(creds: Credentials, url: str, body: dict) -> Optional[dict]:
         return None
 
 
+# --- Batch Requests ---
+# Google's per-API /batch endpoints take up to BATCH_LIMIT independent calls
+# as one multipart/mixed POST, saving a round-trip per call.
+BATCH_URLS = {
+    "calendar": "https://www.googleapis.com/batch/calendar/v3",
+    "tasks": "https://www.googleapis.com/batch/tasks/v1",
+    "drive": "https://www.googleapis.com/batch/drive/v3",
+}
+BATCH_LIMIT = 50
+
+
+def api_batch(creds: Credentials, calls: list) -> list:
+    """Send independent calls to one API (calendar, tasks or drive) via /batch.
+
+    calls: [(method, url, params, body)]. Returns [(status, JSON body or None)]
+    in call order. Status 0 means the batch request itself failed, so callers
+    can fall back to sending that call on its own.
+    """
+    results = [(0, None)] * len(calls)
+    for i in range(0, len(calls), BATCH_LIMIT):
+        _send_batch(creds, calls, list(range(i, min(i + BATCH_LIMIT, len(calls)))), results)
+    return results
+
+
+def _send_batch(creds: Credentials, calls: list, indices: list, results: list):
+    """Run one batch, re-sending parts that hit 401 (after a refresh) or a retryable status."""
+    service = urlsplit(calls[indices[0]][1]).path.strip("/").split("/")[0]
+    refreshed = False
+    attempt = 0
+    while indices:
+        boundary = f"batch_{os.urandom(8).hex()}"
+        token = creds.token
+        try:
+            r = api_request(creds, "POST", BATCH_URLS[service],
+                            headers={"Content-Type": f"multipart/mixed; boundary={boundary}"},
+                            data=encode_batch(calls, indices, boundary))
+        except requests.RequestException:
+            return
+        if r.status_code != 200:
+            return
+        parts = decode_batch(r)
+
+        retry = []
+        for i in indices:
+            status, data = parts.get(i, (0, None))
+            results[i] = (status, data)
+            retryable = POST_RETRY_STATUSES if calls[i][0] == "POST" else RETRY_STATUSES
+            if (status == 401 and not refreshed) or status in retryable:
+                retry.append(i)
+        if not retry or attempt >= MAX_RETRIES:
+            return
+        if any(results[i][0] == 401 for i in retry):
+            refreshed = True
+            if not refresh_creds(creds, token):
+                return
+        else:
+            time.sleep(backoff_delay(attempt))
+        attempt += 1
+        indices = retry
+
+
+def encode_batch(calls: list, indices: list, boundary: str) -> bytes:
+    parts = []
+    for i in indices:
+        method, url, params, body = calls[i]
+        split = urlsplit(url)
+        target = split.path + ("?" + urlencode(params) if params else "")
+        part = (f"--{boundary}\r\n"
+                f"Content-Type: application/http\r\n"
+                f"Content-ID: <item{i}>\r\n\r\n"
+                f"{method} {target} HTTP/1.1\r\n")
+        if body is not None:
+            part += f"Content-Type: application/json; charset=UTF-8\r\n\r\n{json.dumps(body)}"
+        parts.append(part + "\r\n")
+    return ("".join(parts) + f"--{boundary}--\r\n").encode("utf-8")
+
+
+def decode_batch(r: requests.Response) -> dict:
+    """Parse a multipart/mixed batch response into {call index: (status, JSON body or None)}."""
+    match = re.search(r'boundary="?([^";]+)"?', r.headers.get("Content-Type", ""))
+    if not match:
+        return {}
+    results = {}
+    # The outer Content-Type carries no charset, so r.text would guess; the parts are UTF-8 JSON
+    for part in r.content.decode("utf-8").split(f"--{match.group(1)}"):
+        sections = re.split(r"\r?\n\r?\n", part.strip(), maxsplit=2)
+        if len(sections) < 2:
+            continue
+        content_id = re.search(r"Content-ID:\s*<response-item(\d+)>", sections[0], re.IGNORECASE)
+        status = re.match(r"HTTP/\S+\s+(\d{3})", sections[1])
+        if not content_id or not status:
+            continue
+        data = None
+        if len(sections) == 3 and sections[2].strip():
+            try:
+                data = json.loads(sections[2])
+            except ValueError:
+                pass
+        results[int(content_id.group(1))] = (int(status.group(1)), data)
+    return results
+
+
 
 
 # --- Calendar ---
-def get_events(creds, calendar_id: str, time_min: str, time_max: str) -> list:
-    """Get events from a specific calendar in a time range."""
-    data = api_get(creds, f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events", {
-        "timeMin": time_min,
-        "timeMax": time_max,
-        "singleEvents": "true",
-        "orderBy": "startTime",
-        "maxResults": 50,
-    })
-    if data is None:
-        return []
-    return data.get("items", [])
+def events_url(calendar_id: str) -> str:
+    return f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
 
 
-def get_all_events(creds, time_min: str, time_max: str) -> dict:
-    """Get events from all calendars, keyed by domain name."""
+EVENTS_PAGE_SIZE = 250  # API maximum is 2500
+
+
+# --- Event Store ---
+# Each calendar is mirrored to EVENT_STORE_DIR/<name>.json and kept current with
+# the Calendar API's incremental sync (syncToken), so repeated today/week/
+# preaching queries cost one small delta request instead of a full window pull.
+# A full sync covers [since, until); queries outside it, or a 410 Gone on the
+# sync token, trigger a fresh full sync. Delete the directory to force one.
+EVENT_STORE_DIR = os.path.expanduser("~/.config/clawd/calendar-store")
+EVENT_STORE_HORIZON_DAYS = 120
+
+
+def event_store_path(name: str) -> str:
+    return os.path.join(EVENT_STORE_DIR, re.sub(r"\W+", "-", name.lower()) + ".json")
+
+
+def new_event_store(name: str, since: str, until: str) -> dict:
+    return {"calendar_id": CALENDARS[name], "since": since, "until": until,
+            "sync_token": None, "synced_at": None, "events": {}}
+
+
+def load_event_store(name: str) -> dict:
+    """Load a calendar's store, or None if missing, unreadable or for a different calendar ID."""
+    try:
+        with open(event_store_path(name)) as f:
+            store = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if store.get("calendar_id") != CALENDARS[name] or not store.get("sync_token"):
+        return None
+    return store
+
+
+def save_event_store(name: str, store: dict):
+    os.makedirs(EVENT_STORE_DIR, exist_ok=True)
+    try:
+        write_json_atomic(event_store_path(name), store, indent=None)
+    except OSError as e:
+        print(f"  ⚠️ Could not save event store for {name}: {e}", file=sys.stderr)
+
+
+def event_time(when: dict) -> datetime:
+    """Parse an event start/end; all-day dates are taken as midnight CST."""
+    if when.get("dateTime"):
+        return datetime.fromisoformat(when["dateTime"])
+    return datetime.fromisoformat(when["date"]).replace(tzinfo=CST)
+
+
+def store_covers(store: dict, time_min: str, time_max: str) -> bool:
+    return (datetime.fromisoformat(store["since"]) <= datetime.fromisoformat(time_min)
+            and datetime.fromisoformat(time_max) <= datetime.fromisoformat(store["until"]))
+
+
+def sync_params(store: dict) -> dict:
+    # Incremental requests may not repeat timeMin/timeMax/orderBy, and every
+    # other parameter must match the full sync that issued the token.
+    params = {"singleEvents": "true", "maxResults": EVENTS_PAGE_SIZE}
+    if store["sync_token"]:
+        params["syncToken"] = store["sync_token"]
+    else:
+        params["timeMin"] = store["since"]
+        params["timeMax"] = store["until"]
+    return params
+
+
+def sync_calendar(creds, name: str, store: dict, page: dict = None) -> dict:
+    """Apply changes since the store's sync token (or do a full sync if it has none).
+
+    page is an already-fetched first response (e.g. from a batch). Returns the
+    updated store, or None if the API couldn't be reached.
+    """
+    for status, page in api_pages(creds, events_url(CALENDARS[name]), sync_params(store), page):
+        if status == 410 and store["sync_token"]:
+            # Token expired or invalidated: start over with a full sync
+            return sync_calendar(creds, name, new_event_store(name, store["since"], store["until"]))
+        if status != 200:
+            if status:
+                print(f"  ⚠️ API error {status} syncing {name}", file=sys.stderr)
+            return None
+        for ev in page.get("items", []):
+            if ev.get("status") == "cancelled":
+                store["events"].pop(ev["id"], None)
+            else:
+                store["events"][ev["id"]] = ev
+    # Only the last page carries the token for the next incremental sync
+    store["sync_token"] = page.get("nextSyncToken")
+    store["synced_at"] = datetime.now(timezone.utc).isoformat()
+    return store
+
+
+def query_event_store(store: dict, time_min: str, time_max: str) -> list:
+    """Events overlapping [time_min, time_max), ordered by start time like orderBy=startTime."""
+    t_min, t_max = datetime.fromisoformat(time_min), datetime.fromisoformat(time_max)
+    matched = []
+    for ev in store["events"].values():
+        try:
+            start, end = event_time(ev.get("start", {})), event_time(ev.get("end", {}))
+        except (KeyError, ValueError):
+            continue
+        if start < t_max and end > t_min:
+            matched.append((start, ev))
+    matched.sort(key=lambda pair: pair[0])
+    return [ev for _, ev in matched]
+
+
+def fetch_calendars(creds, names: list, time_min: str, time_max: str) -> dict:
+    """Get several calendars' events from the local store after syncing it.
+
+    The first sync request for every calendar goes out as one batch; follow-up
+    pages and full resyncs run concurrently. A calendar whose sync fails is
+    answered from its last stored state if that covers the window.
+    Returns {name: events} in the order of names.
+    """
+    if not names:
+        return {}
+    loaded, stores = {}, {}
+    for name in names:
+        loaded[name] = load_event_store(name)
+        if loaded[name] and store_covers(loaded[name], time_min, time_max):
+            stores[name] = loaded[name]
+        else:
+            until = max(datetime.fromisoformat(time_max),
+                        datetime.fromisoformat(time_min) + timedelta(days=EVENT_STORE_HORIZON_DAYS))
+            stores[name] = new_event_store(name, time_min, until.isoformat())
+
+    pages = {}
+    if len(names) > 1:
+        batch = api_batch(creds, [("GET", events_url(CALENDARS[name]), sync_params(stores[name]), None)
+                                  for name in names])
+        for name, (status, data) in zip(names, batch):
+            if status == 200 and data is not None:
+                pages[name] = data
+            elif status == 410:
+                stores[name] = new_event_store(name, stores[name]["since"], stores[name]["until"])
+
+    with ThreadPoolExecutor(max_workers=min(MAX_CONCURRENT_REQUESTS, len(names))) as pool:
+        futures = [pool.submit(sync_calendar, creds, name, stores[name], pages.get(name)) for name in names]
+        synced = {name: future.result() for name, future in zip(names, futures)}
+
     results = {}
-    for name in PRIORITY_ORDER:
-        cal_id = CALENDARS[name]
-        events = get_events(creds, cal_id, time_min, time_max)
-        if events:
-            results[name] = events
+    for name in names:
+        store = synced[name]
+        if store is not None:
+            save_event_store(name, store)
+        elif loaded[name] and store_covers(loaded[name], time_min, time_max):
+            store = loaded[name]
+        results[name] = query_event_store(store, time_min, time_max) if store else []
     return results
 
 
+def get_all_events(creds, time_min: str, time_max: str) -> dict:
+    """Get events from all calendars, keyed by domain name."""
+    fetched = fetch_calendars(creds, PRIORITY_ORDER, time_min, time_max)
+    return {name: events for name, events in fetched.items() if events}
+
+
 def format_event_time(event: dict) -> str:
     """Extract a human-readable time from an event."""
     start = event.get("start", {})
@@ -274,49 +671,68 @@ def get_time_range_week():
 
 
 # --- Conflict Detection ---
-def detect_conflicts(all_events: dict) -> list:
-    """Find overlapping events across different calendars."""
-    # Flatten all events with their domain
+def flatten_events(all_events: dict, include_all_day: bool = False) -> list:
+    """Timed (and optionally all-day) events as {"domain", "summary", "start", "end", "all_day"} dicts."""
     flat = []
     for domain, events in all_events.items():
         if domain == "US Holidays":
             continue
         for e in events:
-            start = e.get("start", {})
-            end_t = e.get("end", {})
-            dt_start = start.get("dateTime")
-            dt_end = end_t.get("dateTime")
-            if dt_start and dt_end:
+            start, end_t = e.get("start", {}), e.get("end", {})
+            all_day = "dateTime" not in start
+            if all_day and not include_all_day:
+                continue
+            try:
                 flat.append({
                     "domain": domain,
                     "summary": e.get("summary", "(no title)"),
-                    "start": datetime.fromisoformat(dt_start),
-                    "end": datetime.fromisoformat(dt_end),
+                    "start": event_time(start),
+                    "end": event_time(end_t),
+                    "all_day": all_day,
                 })
+            except (KeyError, ValueError):
+                continue
+    return flat
+
+
+def detect_conflicts(all_events: dict, buffer_minutes: int = 0, include_all_day: bool = False) -> list:
+    """Find overlapping events across different calendars.
+
+    Two events conflict when they overlap, or when fewer than buffer_minutes
+    separate them (travel time). All-day and multi-day events are compared on
+    their full span when include_all_day is set. Sweep line over start times:
+    O(n log n + k) for n events and k conflicting pairs.
+    Returns (a, b) pairs ordered by b's start, where a started no later than b.
+    """
+    buffer = timedelta(minutes=buffer_minutes)
+    flat = sorted(flatten_events(all_events, include_all_day), key=lambda ev: (ev["start"], ev["end"]))
 
-    # Check all pairs for overlap
     conflicts = []
-    for i in range(len(flat)):
-        for j in range(i + 1, len(flat)):
-            a, b = flat[i], flat[j]
-            if a["domain"] == b["domain"]:
+    active = {}    # domain -> {index: event} still open at the sweep position
+    expiry = []    # heap of (end + buffer, index, domain)
+    for i, ev in enumerate(flat):
+        while expiry and expiry[0][0] <= ev["start"]:
+            _, j, domain = heapq.heappop(expiry)
+            del active[domain][j]
+        for domain, open_events in active.items():
+            if domain == ev["domain"]:
                 continue
-            if a["start"] < b["end"] and b["start"] < a["end"]:
-                conflicts.append((a, b))
-
+            for other in open_events.values():
+                if other["start"] < ev["end"] + buffer and ev["start"] < other["end"] + buffer:
+                    conflicts.append((other, ev))
+        active.setdefault(ev["domain"], {})[i] = ev
+        heapq.heappush(expiry, (ev["end"] + buffer, i, ev["domain"]))
     return conflicts
 
 
+def conflict_json(a: dict, b: dict) -> dict:
+    return {side: {"domain": ev["domain"], "summary": ev["summary"], "all_day": ev["all_day"],
+                   "start": ev["start"].isoformat(), "end": ev["end"].isoformat()}
+            for side, ev in (("a", a), ("b", b))}
+
+
 # --- Tasks ---
-def get_tasks(creds, status: str = "needsAction") -> list:
-    """Get tasks from 00_Inbox list."""
-    data = api_get(creds, f"https://www.googleapis.com/tasks/v1/lists/{TASK_LIST_ID}/tasks", {
-        "showCompleted": "false" if status == "needsAction" else "true",
-        "maxResults": 100,
-    })
-    if data is None:
-        return []
-    return data.get("items", [])
+TASKS_PAGE_SIZE = 100  # API maximum
 
 
 def parse_task_tag(title: str) -> tuple:
@@ -330,8 +746,8 @@ def parse_task_tag(title: str) -> tuple:
 
 
 def get_tasks_by_domain(creds) -> dict:
-    """Get all incomplete tasks grouped by domain tag."""
-    tasks = get_tasks(creds)
+    """Get all incomplete tasks grouped by domain tag (from the synced task index)."""
+    tasks = indexed_tasks(creds)
     grouped = {}
     for t in tasks:
         title = t.get("title", "")
@@ -351,63 +767,213 @@ def get_tasks_by_domain(creds) -> dict:
 
 
 def complete_task(creds, search_title: str) -> bool:
-    """Mark a task as completed by searching for it by title (case-insensitive partial match)."""
-    tasks = get_tasks(creds)
-    search_lower = search_title.lower().strip()
+    """Mark a task as completed by fuzzy title match (see complete_task_json)."""
+    result = complete_task_json(creds, search_title)
+    if result["success"]:
+        print(f"✅ Completed: {result['task']['title']}")
+        return True
 
-    matches = []
-    for t in tasks:
-        title = t.get("title", "")
-        if not title.strip():
-            continue
-        # Match against both raw title and clean (tag-stripped) title
-        _, clean = parse_task_tag(title)
-        if search_lower in title.lower() or search_lower in clean.lower():
-            matches.append(t)
-
-    if len(matches) == 0:
-        print(f"❌ No task found matching: \"{search_title}\"")
-        return False
-
-    if len(matches) > 1:
-        print(f"⚠️ Multiple tasks match \"{search_title}\":")
-        for i, m in enumerate(matches, 1):
-            print(f"  {i}. {m.get('title', '')}")
+    print(f"❌ {result['error']}")
+    if result.get("matches"):
+        print("Closest matches:")
+        for i, m in enumerate(result["matches"], 1):
+            print(f"  {i}. {m['title']}  ({m['score']:.2f})")
         print("Be more specific.")
-        return False
+    return False
 
-    task = matches[0]
-    task_id = task["id"]
-    task_title = task.get("title", "")
 
-    result = api_patch(
-        creds,
-        f"https://www.googleapis.com/tasks/v1/lists/{TASK_LIST_ID}/tasks/{task_id}",
-        {"status": "completed"}
-    )
+# --- Task Index ---
+# Incomplete 00_Inbox tasks are mirrored to TASK_INDEX_FILE and kept current
+# with updatedMin deltas (completed/deleted tasks included so they drop out).
+# complete-task matches against the index and only syncs when it is older
+# than TASK_INDEX_MAX_AGE; a full re-list happens once a day.
+TASK_INDEX_FILE = os.path.expanduser("~/.config/clawd/task-index.json")
+TASK_INDEX_MAX_AGE = 120  # seconds
+TASK_INDEX_RESYNC_HOURS = 24
+TASK_SYNC_OVERLAP = timedelta(minutes=1)  # re-read a little before the last sync for clock skew
+TASK_MATCH_MIN_SCORE = 0.6
+TASK_MATCH_MARGIN = 0.15  # the best match must lead the runner-up by this much
 
-    if result:
-        print(f"✅ Completed: {task_title}")
-        return True
+
+def tasks_url() -> str:
+    return f"https://www.googleapis.com/tasks/v1/lists/{TASK_LIST_ID}/tasks"
+
+
+def load_task_index() -> dict:
+    try:
+        with open(TASK_INDEX_FILE) as f:
+            index = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return index if index.get("list_id") == TASK_LIST_ID else None
+
+
+def save_task_index(index: dict):
+    try:
+        write_json_atomic(TASK_INDEX_FILE, index, indent=None)
+    except OSError as e:
+        print(f"  ⚠️ Could not save task index: {e}", file=sys.stderr)
+
+
+def index_age(index: dict, key: str = "synced_at") -> float:
+    """Seconds since index[key]."""
+    return (datetime.now(timezone.utc) - datetime.fromisoformat(index[key])).total_seconds()
+
+
+def sync_task_index(creds, index: dict = None) -> dict:
+    """Bring the index up to date (full list if missing or a day old). Returns it, or None on API failure."""
+    started = datetime.now(timezone.utc)
+    full = index is None or index_age(index, "full_sync_at") > TASK_INDEX_RESYNC_HOURS * 3600
+    if full:
+        index = {"list_id": TASK_LIST_ID, "synced_at": None, "full_sync_at": None, "tasks": {}}
+        params = {"showCompleted": "false"}
     else:
-        print(f"❌ Failed to complete: {task_title}")
-        return False
+        since = datetime.fromisoformat(index["synced_at"]) - TASK_SYNC_OVERLAP
+        params = {"updatedMin": since.isoformat(), "showCompleted": "true",
+                  "showHidden": "true", "showDeleted": "true"}
+    params["maxResults"] = TASKS_PAGE_SIZE
+
+    for status, data in api_pages(creds, tasks_url(), params):
+        if status != 200:
+            if status:
+                print(f"  ⚠️ API error ({status}) for tasks")
+            return None
+        for t in data.get("items", []):
+            if t.get("deleted") or t.get("status") == "completed":
+                index["tasks"].pop(t["id"], None)
+            else:
+                index["tasks"][t["id"]] = t
+
+    index["synced_at"] = started.isoformat()
+    if full:
+        index["full_sync_at"] = started.isoformat()
+    save_task_index(index)
+    return index
+
+
+def indexed_tasks(creds, max_age: float = 0) -> list:
+    """Incomplete tasks from the index, synced first unless younger than max_age seconds.
+
+    If the sync fails the last indexed state is returned.
+    """
+    index = load_task_index()
+    if index is None or index_age(index) >= max_age:
+        index = sync_task_index(creds, index) or index
+    if index is None:
+        return []
+    return sorted(index["tasks"].values(), key=lambda t: t.get("position", ""))
+
+
+def update_task_index(tasks: list = (), remove_id: str = None):
+    """Record tasks this process just created, or drop one it completed."""
+    index = load_task_index()
+    if index is None:
+        return
+    for task in tasks:
+        index["tasks"][task["id"]] = task
+    if remove_id:
+        index["tasks"].pop(remove_id, None)
+    save_task_index(index)
+
+
+def task_tokens(text: str) -> list:
+    return [w for w in re.findall(r"[a-z0-9]+", text.casefold()) if w not in STOPWORDS]
+
+
+def token_similarity(q: str, t: str) -> float:
+    if q == t:
+        return 1.0
+    if len(q) >= 3 and t.startswith(q):
+        return 0.9
+    ratio = SequenceMatcher(None, q, t).ratio()
+    return ratio if ratio >= 0.75 else 0.0
+
+
+def task_match_score(query: str, title: str) -> float:
+    """0–1 score of a search string against a task title.
+
+    1.0 for the exact (tag-stripped) title, at least 0.9 when the query is a
+    substring of it, otherwise the mean best per-token similarity (exact,
+    prefix, or close spelling) with a small bonus for covering the title.
+    """
+    _, clean = parse_task_tag(title)
+    q_norm = " ".join(query.casefold().split())
+    if not q_norm:
+        return 0.0
+    if q_norm in (" ".join(clean.casefold().split()), " ".join(title.casefold().split())):
+        return 1.0
+    q_tokens, t_tokens = task_tokens(query), task_tokens(clean)
+    score = 0.0
+    if q_tokens and t_tokens:
+        best = [max(token_similarity(q, t) for t in t_tokens) for q in q_tokens]
+        covered = sum(1 for t in t_tokens if any(token_similarity(q, t) for q in q_tokens))
+        score = 0.85 * sum(best) / len(best) + 0.1 * covered / len(t_tokens)
+    if q_norm in title.casefold():
+        score = max(score, 0.9 + 0.05 * (len(q_norm) / max(len(clean), 1)))
+    return round(min(score, 0.99), 3)
+
+
+def covers_query(query: str, title: str) -> bool:
+    """True if every query word has a match (exact, prefix, or close spelling) in the title."""
+    _, clean = parse_task_tag(title)
+    q_tokens, t_tokens = task_tokens(query), task_tokens(clean)
+    return bool(q_tokens) and all(any(token_similarity(q, t) for t in t_tokens) for q in q_tokens)
+
+
+def rank_tasks(query: str, tasks: list) -> list:
+    """[(score, task)] for tasks scoring above zero, best first."""
+    ranked = []
+    for t in tasks:
+        title = t.get("title", "")
+        if not title.strip():
+            continue
+        score = task_match_score(query, title)
+        if score > 0:
+            ranked.append((score, t))
+    ranked.sort(key=lambda pair: -pair[0])
+    return ranked
 
 
 # --- Drive ---
-def list_drive_folder(creds, folder_id: str) -> list:
-    """List files in a Drive folder."""
-    data = api_get(creds, "https://www.googleapis.com/drive/v3/files", {
+def drive_list_params(folder_id: str, page_size: int = 20) -> dict:
+    return {
         "q": f"'{folder_id}' in parents and trashed = false",
-        "fields": "files(id,name,mimeType,modifiedTime)",
+        "fields": "nextPageToken,files(id,name,mimeType,modifiedTime)",
         "orderBy": "modifiedTime desc",
-        "pageSize": 20,
-    })
+        "pageSize": page_size,
+    }
+
+
+def list_drive_folder(creds, folder_id: str, page_size: int = 20) -> list:
+    """List files in a Drive folder."""
+    data = api_get(creds, "https://www.googleapis.com/drive/v3/files", drive_list_params(folder_id, page_size))
     if data is None:
         return []
     return data.get("files", [])
 
 
+def list_drive_folders(creds, folder_ids: list, page_size: int = 20) -> list:
+    """List several Drive folders in full, their first pages in one batch request.
+
+    Returns one file list per folder.
+    """
+    url = "https://www.googleapis.com/drive/v3/files"
+    params = [drive_list_params(fid, page_size) for fid in folder_ids]
+    batch = api_batch(creds, [("GET", url, p, None) for p in params])
+    listings = []
+    for folder_params, (status, data) in zip(params, batch):
+        first = data if status == 200 and data is not None else None
+        files = []
+        for status, page in api_pages(creds, url, folder_params, first):
+            if status != 200:
+                if status:
+                    print(f"  ⚠️ API error ({status}) for files")
+                break
+            files.extend(page.get("files", []))
+        listings.append(files)
+    return listings
+
+
 
 # --- Sermon Pipeline ---
 PREACHING_CALENDARS = ["Chapel", "Ministry"]
@@ -424,9 +990,8 @@ def find_preaching_events(creds, days: int = 30) -> list:
     """Find all events with PREACHING: in description from Chapel + Ministry calendars."""
     t_min, t_max = get_time_range_days(days)
     results = []
-    for cal_name in PREACHING_CALENDARS:
+    for cal_name, events in fetch_calendars(creds, PREACHING_CALENDARS, t_min, t_max).items():
         cal_id = CALENDARS[cal_name]
-        events = get_events(creds, cal_id, t_min, t_max)
         for ev in events:
             desc = ev.get("description", "")
             if desc.strip().startswith("PREACHING:"):
@@ -452,37 +1017,50 @@ def find_preaching_events(creds, days: int = 30) -> list:
     return results
 
 
-def check_drive_sermon_files(creds, date_prefix: str) -> dict:
-    """Check for existing brainstorm/sermon files matching a date prefix."""
-    found = {"brainstorm": None, "draft": None, "final": None}
-    brainstorm_id = DRIVE_SUBFOLDERS["Ministry/Brainstorm"]
-    if brainstorm_id:
-        files = list_drive_folder(creds, brainstorm_id)
-        for f in files:
-            if f["name"].startswith(date_prefix):
-                found["brainstorm"] = {"id": f["id"], "name": f["name"]}
-                break
+# Sermon prep folders list once per preaching-schedule run, not once per event
+SERMON_LISTING_PAGE_SIZE = 1000  # API maximum
 
-    sermons_id = DRIVE_SUBFOLDERS.get("Ministry/Sermons")
-    if sermons_id:
-        files = list_drive_folder(creds, sermons_id)
-        for f in files:
-            if f["name"].startswith(date_prefix):
-                if "final" in f["name"].lower():
-                    found["final"] = {"id": f["id"], "name": f["name"]}
-                elif "draft" in f["name"].lower():
-                    found["draft"] = {"id": f["id"], "name": f["name"]}
+
+def list_sermon_folders(creds) -> dict:
+    """List Ministry/Brainstorm and Ministry/Sermons together. Returns {"brainstorm": files, "sermons": files}."""
+    brainstorm, sermons = list_drive_folders(
+        creds, [DRIVE_SUBFOLDERS["Ministry/Brainstorm"], DRIVE_SUBFOLDERS["Ministry/Sermons"]],
+        page_size=SERMON_LISTING_PAGE_SIZE,
+    )
+    return {"brainstorm": brainstorm, "sermons": sermons}
+
+
+def check_drive_sermon_files(creds, date_prefix: str, listings: dict = None) -> dict:
+    """Check for existing brainstorm/sermon files matching a date prefix.
+
+    Pass listings from list_sermon_folders() to match in memory across many dates.
+    """
+    if listings is None:
+        listings = list_sermon_folders(creds)
+    found = {"brainstorm": None, "draft": None, "final": None}
+    for f in listings["brainstorm"]:
+        if f["name"].startswith(date_prefix):
+            found["brainstorm"] = {"id": f["id"], "name": f["name"]}
+            break
+
+    for f in listings["sermons"]:
+        if f["name"].startswith(date_prefix):
+            if "final" in f["name"].lower():
+                found["final"] = {"id": f["id"], "name": f["name"]}
+            elif "draft" in f["name"].lower():
+                found["draft"] = {"id": f["id"], "name": f["name"]}
     return found
 
 
 def preaching_schedule(creds, days: int = 30, target_date: str = None) -> dict:
     """Get preaching schedule with file status. Optionally filter to a specific date."""
     events = find_preaching_events(creds, days=max(days, 90) if target_date else days)
+    if target_date:
+        events = [ev for ev in events if ev["date"] == target_date]
+    listings = list_sermon_folders(creds) if events else None
     schedule = []
     for ev in events:
-        if target_date and ev["date"] != target_date:
-            continue
-        files = check_drive_sermon_files(creds, ev["date"])
+        files = check_drive_sermon_files(creds, ev["date"], listings)
         status = "not_started"
         if files["final"]:
             status = "final"
@@ -512,9 +1090,9 @@ def drive_read_file(creds, file_id: str) -> dict:
     # For Google Docs, export as plain text
     if mime == "application/vnd.google-apps.document":
         try:
-            r = requests.get(
+            r = api_request(
+                creds, "GET",
                 f"https://www.googleapis.com/drive/v3/files/{file_id}/export",
-                headers={"Authorization": f"Bearer {creds.token}"},
                 params={"mimeType": "text/plain"},
                 timeout=30
             )
@@ -530,9 +1108,9 @@ def drive_read_file(creds, file_id: str) -> dict:
     # For docx files, download and extract text
     if "wordprocessingml" in mime or name.endswith(".docx"):
         try:
-            r = requests.get(
+            r = api_request(
+                creds, "GET",
                 f"https://www.googleapis.com/drive/v3/files/{file_id}",
-                headers={"Authorization": f"Bearer {creds.token}"},
                 params={"alt": "media"},
                 timeout=30
             )
@@ -561,9 +1139,9 @@ def drive_read_file(creds, file_id: str) -> dict:
     # For text/markdown files
     if mime.startswith("text/") or name.endswith(".md") or name.endswith(".txt"):
         try:
-            r = requests.get(
+            r = api_request(
+                creds, "GET",
                 f"https://www.googleapis.com/drive/v3/files/{file_id}",
-                headers={"Authorization": f"Bearer {creds.token}"},
                 params={"alt": "media"},
                 timeout=30
             )
@@ -630,12 +1208,12 @@ def drive_upload_file(creds, folder_key: str, filename: str, content_bytes: byte
     ).encode('utf-8') + content_bytes + f"\r\n--{boundary}--".encode('utf-8')
     
     headers = {
-        "Authorization": f"Bearer {creds.token}",
         "Content-Type": f"multipart/related; boundary={boundary}"
     }
     
     try:
-        r = requests.post(
+        r = api_request(
+            creds, "POST",
             "https://www.googleapis.com/upload/drive/v3/files?uploadType=multipart",
             headers=headers,
             data=body,
@@ -772,20 +1350,29 @@ def print_tasks():
             print()
 
 
-def print_conflicts(all_events=None):
+def format_span(ev: dict) -> str:
+    if ev["all_day"]:
+        last_day = ev["end"] - timedelta(days=1)
+        if last_day.date() <= ev["start"].date():
+            return f"All Day {ev['start'].strftime('%a %b %-d')}"
+        return f"{ev['start'].strftime('%a %b %-d')}–{last_day.strftime('%a %b %-d')}"
+    return f"{ev['start'].strftime('%-I:%M %p')}–{ev['end'].strftime('%-I:%M %p')}"
+
+
+def print_conflicts(all_events=None, buffer_minutes: int = 0, include_all_day: bool = False):
     creds = get_creds()
     if all_events is None:
         t_min, t_max = get_time_range_today()
         all_events = get_all_events(creds, t_min, t_max)
 
-    conflicts = detect_conflicts(all_events)
+    conflicts = detect_conflicts(all_events, buffer_minutes, include_all_day)
     if not conflicts:
         print("  ✅ No scheduling conflicts detected.")
     else:
         print(f"  ⚠️ {len(conflicts)} conflict(s) detected:")
         for a, b in conflicts:
-            print(f"    ⚠️ {a['domain']}: {a['summary']} ({a['start'].strftime('%-I:%M %p')}–{a['end'].strftime('%-I:%M %p')})")
-            print(f"       ↔ {b['domain']}: {b['summary']} ({b['start'].strftime('%-I:%M %p')}–{b['end'].strftime('%-I:%M %p')})")
+            print(f"    ⚠️ {a['domain']}: {a['summary']} ({format_span(a)})")
+            print(f"       ↔ {b['domain']}: {b['summary']} ({format_span(b)})")
         print()
 
 
@@ -889,43 +1476,61 @@ def events_json(creds, time_min: str, time_max: str) -> dict:
     return result
 
 
-def complete_task_json(creds, search_title: str) -> dict:
-    """Complete a task and return structured result."""
-    tasks = get_tasks(creds)
-    search_lower = search_title.lower().strip()
+def today_json(creds) -> dict:
+    t_min, t_max = get_time_range_today()
+    now = datetime.now(CST)
+    return {"command": "today", "date": now.strftime("%Y-%m-%d"), "domains": events_json(creds, t_min, t_max)}
 
-    matches = []
-    for t in tasks:
-        title = t.get("title", "")
-        if not title.strip():
-            continue
-        _, clean = parse_task_tag(title)
-        if search_lower in title.lower() or search_lower in clean.lower():
-            matches.append(t)
 
-    if len(matches) == 0:
+def week_json(creds) -> dict:
+    t_min, t_max = get_time_range_week()
+    now = datetime.now(CST)
+    end = now + timedelta(days=7)
+    return {"command": "week", "startDate": now.strftime("%Y-%m-%d"),
+            "endDate": end.strftime("%Y-%m-%d"), "domains": events_json(creds, t_min, t_max)}
+
+
+def complete_task_json(creds, search_title: str, _refetched: bool = False) -> dict:
+    """Complete the best fuzzy title match from the task index and return a structured result.
+
+    Short of an exact title, the best match must account for every word of the
+    search and lead the runner-up by TASK_MATCH_MARGIN. Anything less
+    completes nothing and returns scored candidates.
+    """
+    ranked = rank_tasks(search_title, indexed_tasks(creds, max_age=TASK_INDEX_MAX_AGE))
+    candidates = [{"id": t["id"], "title": t.get("title", ""), "score": score} for score, t in ranked[:5]]
+
+    if not ranked or ranked[0][0] < TASK_MATCH_MIN_SCORE:
         return {"command": "complete-task", "success": False,
-                "error": f"No task found matching: \"{search_title}\"", "matches": []}
+                "error": f"No task found matching: \"{search_title}\"", "matches": candidates}
 
-    if len(matches) > 1:
+    runner_up = ranked[1][0] if len(ranked) > 1 else 0.0
+    exact = ranked[0][0] == 1.0 and runner_up < 1.0
+    if not exact and ranked[0][0] - runner_up < TASK_MATCH_MARGIN:
         return {"command": "complete-task", "success": False,
                 "error": f"Multiple tasks match \"{search_title}\"",
-                "matches": [{"id": m["id"], "title": m.get("title", "")} for m in matches]}
-
-    task = matches[0]
-    result = api_patch(
-        creds,
-        f"https://www.googleapis.com/tasks/v1/lists/{TASK_LIST_ID}/tasks/{task['id']}",
-        {"status": "completed"}
-    )
-    if result:
-        return {"command": "complete-task", "success": True,
-                "task": {"id": task["id"], "title": task.get("title", "")}}
-    else:
+                "matches": [c for c in candidates if c["score"] >= TASK_MATCH_MIN_SCORE]}
+    if not exact and not covers_query(search_title, ranked[0][1].get("title", "")):
         return {"command": "complete-task", "success": False,
-                "error": f"API call failed for: {task.get('title', '')}",
-                "task": {"id": task["id"], "title": task.get("title", "")}}
+                "error": f"No task confidently matches \"{search_title}\"", "matches": candidates}
 
+    task = ranked[0][1]
+    summary = {"id": task["id"], "title": task.get("title", ""), "score": ranked[0][0]}
+    try:
+        r = api_request(creds, "PATCH", f"{tasks_url()}/{task['id']}", json={"status": "completed"})
+    except requests.RequestException as e:
+        return {"command": "complete-task", "success": False, "error": f"Network error: {e}", "task": summary}
+
+    if r.status_code == 404 and not _refetched:
+        # Deleted since the index last synced: re-sync and match again
+        update_task_index(remove_id=task["id"])
+        sync_task_index(creds, load_task_index())
+        return complete_task_json(creds, search_title, _refetched=True)
+    if not r.ok:
+        return {"command": "complete-task", "success": False,
+                "error": f"API call failed for: {task.get('title', '')}", "task": summary}
+    update_task_index(remove_id=task["id"])
+    return {"command": "complete-task", "success": True, "task": summary}
 
 
 def create_task(creds, title: str, notes: str = None, due: str = None) -> dict:
@@ -939,34 +1544,40 @@ def create_task(creds, title: str, notes: str = None, due: str = None) -> dict:
     Returns:
         dict with success status and task details or error
     """
-    task_body = {"title": title}
-    
-    if notes:
-        task_body["notes"] = notes
-    if due:
-        # Tasks API expects RFC 3339 date format
-        task_body["due"] = f"{due}T00:00:00.000Z"
-    
-    url = f"https://www.googleapis.com/tasks/v1/lists/{TASK_LIST_ID}/tasks"
-    result = api_post(creds, url, task_body)
+    result = api_post(creds, tasks_url(), task_body(title, notes, due))
     
     if result:
-        return {
-            "command": "create-task",
-            "success": True,
-            "task": {
-                "id": result.get("id"),
-                "title": result.get("title"),
-                "notes": result.get("notes"),
-                "due": result.get("due"),
-                "status": result.get("status")
-            }
-        }
+        update_task_index(tasks=[result])
+        return created_task_result(result)
     else:
         return {"command": "create-task", "success": False, 
                 "error": "API call failed to create task"}
 
 
+def task_body(title: str, notes: str = None, due: str = None) -> dict:
+    body = {"title": title}
+    if notes:
+        body["notes"] = notes
+    if due:
+        # Tasks API expects RFC 3339 date format
+        body["due"] = f"{due}T00:00:00.000Z"
+    return body
+
+
+def created_task_result(result: dict) -> dict:
+    return {
+        "command": "create-task",
+        "success": True,
+        "task": {
+            "id": result.get("id"),
+            "title": result.get("title"),
+            "notes": result.get("notes"),
+            "due": result.get("due"),
+            "status": result.get("status")
+        }
+    }
+
+
 
 # --- Quick Capture ---
 
@@ -1010,46 +1621,111 @@ DOMAIN_KEYWORDS = {
 STOPWORDS = {"the", "a", "an", "to", "for", "and", "or", "on", "in", "at", "by", "with", "about"}
 
 
+# Keywords match as whole words, plus a plural, so "ta" no longer fires inside
+# "data" or "pr" inside "prayer". Other inflections are listed per keyword: a
+# shared suffix list also turns "bear" into "beard".
+KEYWORD_PLURAL = r"(?:s|es)?"
+KEYWORD_VARIANTS = {
+    "preach": ["preached", "preacher", "preachers", "preaching"],
+    "brainstorm": ["brainstormed", "brainstorming"],
+    "pastor": ["pastoral"],
+    "homily": ["homilies"],
+    "exegesis": ["exegetical"],
+    "congregation": ["congregational"],
+    "chaplain": ["chaplaincy"],
+    "incarcerated": ["incarceration"],
+    "trade": ["traded", "trader", "traders", "trading"],
+    "invest": ["invested", "investing", "investor", "investors", "investment", "investments"],
+    "bull": ["bullish"],
+    "bear": ["bearish"],
+    "chart": ["charted", "charting"],
+    "code": ["coded", "coding"],
+    "deploy": ["deployed", "deploying", "deployment", "deployments"],
+    "script": ["scripted", "scripting"],
+    "debug": ["debugged", "debugging"],
+    "refactor": ["refactored", "refactoring"],
+    "merge": ["merged", "merging"],
+    "test": ["tested", "testing"],
+    "repair": ["repaired", "repairing"],
+    "record": ["recorded", "recording", "recordings"],
+    "edit": ["edited", "editing", "editor"],
+    "upload": ["uploaded", "uploading"],
+    "film": ["filmed", "filming"],
+    "exercise": ["exercised", "exercising"],
+    "read": ["reading"],
+    "travel": ["traveled", "traveling", "travelled", "travelling"],
+}
+
+
+def keyword_weight(kw: str) -> float:
+    """Phrases are stronger evidence than single words; 1–2 letter abbreviations weaker."""
+    if len(kw) <= 2:
+        return 0.5
+    return float(len(kw.split()))
+
+
+def build_domain_matcher(domain_keywords: dict, variants: dict):
+    """Compile every keyword and variant into one alternation (longest first).
+
+    Returns (pattern, matched form -> (domain, keyword)).
+    """
+    form_keyword = {}
+    for domain, keywords in domain_keywords.items():
+        for kw in keywords:
+            for form in [kw, *variants.get(kw, [])]:
+                form_keyword.setdefault(form, (domain, kw))
+    alternation = "|".join(re.escape(form) for form in sorted(form_keyword, key=len, reverse=True))
+    pattern = re.compile(rf"(?<![a-z0-9])({alternation}){KEYWORD_PLURAL}(?![a-z0-9])")
+    return pattern, form_keyword
+
+
+DOMAIN_PATTERN, KEYWORD_DOMAIN = build_domain_matcher(DOMAIN_KEYWORDS, KEYWORD_VARIANTS)
+
+
+def domain_scores(text: str) -> dict:
+    """Weighted keyword score per domain in one pass over the text.
+
+    Returns {domain: {"score": float, "keywords": [...]}}, in DOMAIN_KEYWORDS order.
+    Each keyword counts once however often it appears.
+    """
+    found = {}
+    for m in DOMAIN_PATTERN.finditer(text.lower()):
+        domain, kw = KEYWORD_DOMAIN[m.group(1)]
+        found.setdefault(domain, {}).setdefault(kw, keyword_weight(kw))
+    return {
+        domain: {"score": sum(found[domain].values()), "keywords": list(found[domain])}
+        for domain in DOMAIN_KEYWORDS if domain in found
+    }
+
+
 def infer_domain(text: str) -> tuple:
-    """Infer domain from text using keyword matching.
+    """Infer domain from text using weighted keyword matching.
     
     Returns:
         tuple: (domain, confidence, matched_keywords)
         - domain: Best matching domain or None if ambiguous
-        - confidence: "high" (1 match), "medium" (multiple same domain), "low" (multiple domains), "none"
-        - matched_keywords: list of keywords that matched
+        - confidence: "high" (one domain), "medium" (clear winner by 2+ points), "low" (too close), "none"
+        - matched_keywords: keywords that matched (or candidate domains, best first, when "low")
     """
-    text_lower = text.lower()
-    matches = {}  # domain -> list of matched keywords
+    scores = domain_scores(text)
     
-    for domain, keywords in DOMAIN_KEYWORDS.items():
-        matched = []
-        for kw in keywords:
-            if kw in text_lower:
-                matched.append(kw)
-        if matched:
-            matches[domain] = matched
-    
-    if not matches:
+    if not scores:
         return (None, "none", [])
     
-    if len(matches) == 1:
-        domain = list(matches.keys())[0]
-        keywords = matches[domain]
-        confidence = "high" if len(keywords) >= 1 else "medium"
-        return (domain, confidence, keywords)
+    if len(scores) == 1:
+        domain, hit = next(iter(scores.items()))
+        return (domain, "high", hit["keywords"])
     
-    # Multiple domains matched — pick the one with most keyword matches
-    sorted_matches = sorted(matches.items(), key=lambda x: len(x[1]), reverse=True)
-    top_domain, top_keywords = sorted_matches[0]
-    second_domain, second_keywords = sorted_matches[1]
+    # Multiple domains matched — pick the highest score
+    ranked = sorted(scores.items(), key=lambda x: x[1]["score"], reverse=True)
+    top_domain, top = ranked[0]
     
-    # If clear winner (2+ more matches), use it with medium confidence
-    if len(top_keywords) >= len(second_keywords) + 2:
-        return (top_domain, "medium", top_keywords)
+    # If clear winner (2+ points ahead), use it with medium confidence
+    if top["score"] >= ranked[1][1]["score"] + 2:
+        return (top_domain, "medium", top["keywords"])
     
     # Too close to call
-    return (None, "low", list(matches.keys()))
+    return (None, "low", [domain for domain, _ in ranked])
 
 
 def parse_date_from_text(text: str) -> tuple:
@@ -1139,6 +1815,17 @@ def quick_capture(creds, text: str, force_domain: str = None) -> dict:
     Returns:
         dict with success status, created task, and inference details
     """
+    plan, failure = plan_quick_task(text, force_domain)
+    if failure:
+        return failure
+    return quick_task_result(plan, create_task(creds, plan["title"], notes=None, due=plan["due"]))
+
+
+def plan_quick_task(text: str, force_domain: str = None) -> tuple:
+    """Infer date and domain for a quick task without touching the API.
+
+    Returns (plan, None), or (None, failure result) when the domain can't be decided.
+    """
     # Parse date first
     due_date, cleaned_text = parse_date_from_text(text)
     
@@ -1153,7 +1840,7 @@ def quick_capture(creds, text: str, force_domain: str = None) -> dict:
     # Handle low/no confidence
     if confidence in ("none", "low"):
         if confidence == "none":
-            return {
+            return None, {
                 "command": "quick",
                 "success": False,
                 "error": "Could not determine domain. Please specify: --domain CHAPEL|MINISTRY|TRADING|DEV|FAMILY|CONTENT|PERSONAL",
@@ -1164,7 +1851,7 @@ def quick_capture(creds, text: str, force_domain: str = None) -> dict:
                 }
             }
         else:  # low confidence - multiple domains matched
-            return {
+            return None, {
                 "command": "quick",
                 "success": False,
                 "error": f"Ambiguous domain. Matched: {', '.join(matched)}. Please specify: --domain <DOMAIN>",
@@ -1175,23 +1862,29 @@ def quick_capture(creds, text: str, force_domain: str = None) -> dict:
                 }
             }
     
-    # Build task title
-    title = f"[{domain}] {cleaned_text}"
-    
-    # Create the task
-    result = create_task(creds, title, notes=None, due=due_date)
-    
+    return {
+        "title": f"[{domain}] {cleaned_text}",
+        "due": due_date,
+        "domain": domain,
+        "confidence": confidence,
+        "matched": matched,
+        "text": text,
+    }, None
+
+
+def quick_task_result(plan: dict, result: dict) -> dict:
+    """Combine a quick-task plan with the create_task() result."""
     if result["success"]:
         return {
             "command": "quick",
             "success": True,
             "task": result["task"],
             "inference": {
-                "domain": domain,
-                "confidence": confidence,
-                "matched_keywords": matched,
-                "parsed_date": due_date,
-                "original_text": text
+                "domain": plan["domain"],
+                "confidence": plan["confidence"],
+                "matched_keywords": plan["matched"],
+                "parsed_date": plan["due"],
+                "original_text": plan["text"]
             }
         }
     else:
@@ -1200,14 +1893,13 @@ def quick_capture(creds, text: str, force_domain: str = None) -> dict:
             "success": False,
             "error": result.get("error", "Failed to create task"),
             "inference": {
-                "domain": domain,
-                "confidence": confidence,
-                "matched_keywords": matched
+                "domain": plan["domain"],
+                "confidence": plan["confidence"],
+                "matched_keywords": plan["matched"]
             }
         }
 
 
-
 def parse_time_from_text(text: str) -> tuple:
     """Extract time from natural language text.
     
@@ -1286,6 +1978,18 @@ def quick_event(creds, text: str, force_domain: str = None) -> dict:
     Returns:
         dict with success status, created event, and inference details
     """
+    plan, failure = plan_quick_event(text, force_domain)
+    if failure:
+        return failure
+    result = create_calendar_event(creds, plan["calendar"], plan["summary"], plan["start"], plan["end"])
+    return quick_event_result(plan, result)
+
+
+def plan_quick_event(text: str, force_domain: str = None) -> tuple:
+    """Infer date, time and calendar for a quick event without touching the API.
+
+    Returns (plan, None), or (None, failure result) when no time is found.
+    """
     # Parse date first
     due_date, text_after_date = parse_date_from_text(text)
     
@@ -1294,7 +1998,7 @@ def quick_event(creds, text: str, force_domain: str = None) -> dict:
     
     # If no time found, can't create event
     if not start_time:
-        return {
+        return None, {
             "command": "quick-event",
             "success": False,
             "error": "No time found. Include a time like '2pm' or '14:00'. For tasks without time, use 'quick' instead.",
@@ -1306,7 +2010,6 @@ def quick_event(creds, text: str, force_domain: str = None) -> dict:
     
     # If no date, default to today
     if not due_date:
-        from datetime import datetime
         due_date = datetime.now(CST).strftime("%Y-%m-%d")
     
     # Infer domain
@@ -1327,30 +2030,39 @@ def quick_event(creds, text: str, force_domain: str = None) -> dict:
             domain = matched[0] if matched else "PERSONAL"
             confidence = "low-picked"
     
-    # Build datetime strings
-    start_dt = f"{due_date}T{start_time}:00"
-    end_dt = f"{due_date}T{end_time}:00"
-    
     # Map domain to calendar (CONTENT uses Personal calendar)
     # Calendar keys are title case: Chapel, Ministry, Trading, Dev, Family, Personal
     cal_domain = domain.title() if domain != "CONTENT" else "Personal"
     
-    # Create the event
-    result = create_calendar_event(creds, cal_domain, cleaned_text, start_dt, end_dt)
-    
+    return {
+        "summary": cleaned_text,
+        "start": f"{due_date}T{start_time}:00",
+        "end": f"{due_date}T{end_time}:00",
+        "domain": domain,
+        "calendar": cal_domain,
+        "confidence": confidence,
+        "matched": matched,
+        "date": due_date,
+        "time": f"{start_time}-{end_time}",
+        "text": text,
+    }, None
+
+
+def quick_event_result(plan: dict, result: dict) -> dict:
+    """Combine a quick-event plan with the create_calendar_event() result."""
     if result["success"]:
         return {
             "command": "quick-event",
             "success": True,
             "event": result["event"],
             "inference": {
-                "domain": domain,
-                "calendar": cal_domain,
-                "confidence": confidence,
-                "matched_keywords": matched,
-                "parsed_date": due_date,
-                "parsed_time": f"{start_time}-{end_time}",
-                "original_text": text
+                "domain": plan["domain"],
+                "calendar": plan["calendar"],
+                "confidence": plan["confidence"],
+                "matched_keywords": plan["matched"],
+                "parsed_date": plan["date"],
+                "parsed_time": plan["time"],
+                "original_text": plan["text"]
             }
         }
     else:
@@ -1359,13 +2071,68 @@ def quick_event(creds, text: str, force_domain: str = None) -> dict:
             "success": False,
             "error": result.get("error", "Failed to create event"),
             "inference": {
-                "domain": domain,
-                "confidence": confidence,
-                "matched_keywords": matched
+                "domain": plan["domain"],
+                "confidence": plan["confidence"],
+                "matched_keywords": plan["matched"]
             }
         }
 
 
+def quick_batch(creds, lines: list, kind: str = "task", force_domain: str = None):
+    """Capture many lines at once, yielding one result per non-blank line in input order.
+
+    All parsing and domain inference happens locally first; the creates then go
+    out as /batch requests of up to BATCH_LIMIT. A leading [DOMAIN] tag on a
+    line overrides inference for that line. kind is "task" or "event".
+    """
+    numbered = [(n, line.strip()) for n, line in enumerate(lines, 1) if line.strip()]
+    for start in range(0, len(numbered), BATCH_LIMIT):
+        chunk = numbered[start:start + BATCH_LIMIT]
+        results, pending = {}, []
+        for n, line in chunk:
+            text, domain = line, force_domain
+            tag = TAG_PATTERN.match(line)
+            if tag:
+                text, domain = line[tag.end():].strip(), tag.group(1)
+            if kind == "task":
+                plan, failure = plan_quick_task(text, domain)
+                if plan:
+                    call = ("POST", tasks_url(), None, task_body(plan["title"], due=plan["due"]))
+            else:
+                plan, failure = plan_quick_event(text, domain)
+                if plan and plan["calendar"] not in CALENDARS:
+                    plan, failure = None, {"command": "quick-event", "success": False,
+                                           "error": f"Unknown domain: {plan['calendar']}. Valid: {', '.join(CALENDARS.keys())}"}
+                if plan:
+                    call = ("POST", events_url(CALENDARS[plan["calendar"]]), None,
+                            event_body(plan["summary"], plan["start"], plan["end"]))
+            if failure:
+                results[n] = failure
+            else:
+                pending.append((n, plan, call))
+
+        created = []
+        for (n, plan, _), (status, data) in zip(pending, api_batch(creds, [call for _, _, call in pending])):
+            if status == 200 and data is not None:
+                if kind == "task":
+                    created.append(data)
+                    result = created_task_result(data)
+                else:
+                    result = created_event_result(plan["calendar"], data)
+            elif status == 0:
+                # The batch may or may not have been applied; re-sending could duplicate
+                result = {"success": False, "error": "Batch request failed — check before re-running this line"}
+            else:
+                message = (data or {}).get("error", {}).get("message", "") if isinstance(data, dict) else ""
+                result = {"success": False, "error": f"API error {status}: {message}".strip()}
+            results[n] = quick_task_result(plan, result) if kind == "task" else quick_event_result(plan, result)
+        if created:
+            update_task_index(tasks=created)
+
+        for n, line in chunk:
+            yield {"line": n, "input": line, **results[n]}
+
+
 def create_calendar_event(creds, domain: str, summary: str, start: str, end: str, 
                           description: str = None, location: str = None) -> dict:
     """Create a calendar event.
@@ -1385,49 +2152,51 @@ def create_calendar_event(creds, domain: str, summary: str, start: str, end: str
         return {"command": "create-event", "success": False, 
                 "error": f"Unknown domain: {domain}. Valid: {', '.join(CALENDARS.keys())}"}
     
-    calendar_id = CALENDARS[domain]
-    
-    # Determine if all-day event (date only) or timed event (datetime)
-    is_all_day = len(start) == 10  # YYYY-MM-DD format
+    result = api_post(creds, events_url(CALENDARS[domain]), event_body(summary, start, end, description, location))
     
-    event_body = {"summary": summary}
+    if result:
+        return created_event_result(domain, result)
+    else:
+        return {"command": "create-event", "success": False, 
+                "error": f"API call failed for calendar: {domain}"}
+
+
+def event_body(summary: str, start: str, end: str, description: str = None, location: str = None) -> dict:
+    body = {"summary": summary}
     
-    if is_all_day:
-        event_body["start"] = {"date": start}
-        event_body["end"] = {"date": end}
+    # Determine if all-day event (date only) or timed event (datetime)
+    if len(start) == 10:  # YYYY-MM-DD format
+        body["start"] = {"date": start}
+        body["end"] = {"date": end}
     else:
         # Ensure timezone
         if not start.endswith('Z') and '+' not in start and '-' not in start[-6:]:
             start = start + "-06:00"  # CST
         if not end.endswith('Z') and '+' not in end and '-' not in end[-6:]:
             end = end + "-06:00"  # CST
-        event_body["start"] = {"dateTime": start, "timeZone": "America/Chicago"}
-        event_body["end"] = {"dateTime": end, "timeZone": "America/Chicago"}
+        body["start"] = {"dateTime": start, "timeZone": "America/Chicago"}
+        body["end"] = {"dateTime": end, "timeZone": "America/Chicago"}
     
     if description:
-        event_body["description"] = description
+        body["description"] = description
     if location:
-        event_body["location"] = location
-    
-    url = f"https://www.googleapis.com/calendar/v3/calendars/{calendar_id}/events"
-    result = api_post(creds, url, event_body)
-    
-    if result:
-        return {
-            "command": "create-event",
-            "success": True,
-            "event": {
-                "id": result.get("id"),
-                "summary": result.get("summary"),
-                "start": result.get("start"),
-                "end": result.get("end"),
-                "htmlLink": result.get("htmlLink"),
-                "domain": domain
-            }
+        body["location"] = location
+    return body
+
+
+def created_event_result(domain: str, result: dict) -> dict:
+    return {
+        "command": "create-event",
+        "success": True,
+        "event": {
+            "id": result.get("id"),
+            "summary": result.get("summary"),
+            "start": result.get("start"),
+            "end": result.get("end"),
+            "htmlLink": result.get("htmlLink"),
+            "domain": domain
         }
-    else:
-        return {"command": "create-event", "success": False, 
-                "error": f"API call failed for calendar: {domain}"}
+    }
 
 
 def update_calendar_event(creds, domain: str, event_id: str, 
@@ -1509,6 +2278,163 @@ def update_calendar_event(creds, domain: str, event_id: str,
                 "error": f"API call failed updating event: {event_id}"}
 
 
+# --- Daemon ---
+#
+# `arnoldos.py serve` replaces the per-minute cache-*.sh crons with one warm
+# process: credentials, the pooled HTTP session and the event store stay loaded,
+# and each memory/cache/<name>.json is rewritten atomically on its own schedule.
+# Requests on SOCKET_FILE are one JSON line, {"refresh": ["today"]} ("all" for
+# every cache) or {"status": true}, answered with one JSON line of job status.
+# Jobs run one at a time between requests.
+CACHE_DIR = os.path.expanduser("~/clawd/memory/cache")
+SOCKET_FILE = os.path.expanduser("~/clawd/run/arnoldos.sock")
+
+# name -> (refresh interval in seconds, builder returning the same dict as `<command> --json`)
+CACHE_JOBS = {
+    "today": (60, today_json),
+    "tasks": (60, tasks_json),
+    "week": (300, week_json),
+    "preaching": (300, lambda creds: preaching_schedule(creds)),
+}
+
+
+def log(message: str):
+    print(f"{datetime.now(CST).strftime('%Y-%m-%d %H:%M:%S')} {message}", file=sys.stderr, flush=True)
+
+
+class CacheScheduler:
+    """Runs CACHE_JOBS when due and remembers how each run went."""
+
+    def __init__(self, creds: Credentials):
+        self.creds = creds
+        self.next_run = {name: 0.0 for name in CACHE_JOBS}
+        self.status = {name: {"last_run": None, "ok": None, "duration_ms": None, "error": None}
+                       for name in CACHE_JOBS}
+
+    def run(self, name: str) -> dict:
+        interval, builder = CACHE_JOBS[name]
+        start = time.perf_counter()
+        status = self.status[name]
+        try:
+            data = builder(self.creds)
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            write_json_atomic(os.path.join(CACHE_DIR, f"{name}.json"), data, mode=0o644)
+            status.update(ok=True, error=None)
+        except (Exception, SystemExit) as e:
+            # Keep the previous cache file; the dashboard prefers stale to missing
+            status.update(ok=False, error=str(e) or type(e).__name__)
+            log(f"serve: {name} refresh failed ({status['error']})")
+        status["last_run"] = datetime.now(CST).isoformat()
+        status["duration_ms"] = round((time.perf_counter() - start) * 1000, 1)
+        self.next_run[name] = time.monotonic() + interval
+        return status
+
+    def run_due(self):
+        now = time.monotonic()
+        for name, due in self.next_run.items():
+            if due <= now:
+                self.run(name)
+
+
+class ArnoldOSServer(socketserver.UnixStreamServer):
+    def __init__(self, path: str, scheduler: CacheScheduler):
+        self.scheduler = scheduler
+        super().__init__(path, ArnoldOSRequestHandler)
+
+    def service_actions(self):
+        # Called by serve_forever() between requests
+        self.scheduler.run_due()
+
+
+class ArnoldOSRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        scheduler = self.server.scheduler
+        try:
+            request = json.loads(self.rfile.readline())
+            names = request.get("refresh", [])
+            if names == "all":
+                names = list(CACHE_JOBS)
+            if not isinstance(names, list):
+                raise ValueError('refresh must be a list of cache names or "all"')
+            unknown = [n for n in names if n not in CACHE_JOBS]
+            if unknown:
+                raise ValueError(f"unknown cache(s) {unknown}; choose from {', '.join(CACHE_JOBS)}")
+        except (ValueError, TypeError, AttributeError) as e:
+            response = {"success": False, "error": f"Bad request: {e}"}
+        else:
+            for name in names:
+                scheduler.run(name)
+            response = {"success": all(scheduler.status[n]["ok"] for n in names),
+                        "jobs": scheduler.status, "api_stats": api_stats()}
+        self.wfile.write((json.dumps(response) + "\n").encode())
+
+
+def daemon_request(request: dict, timeout: float = 300) -> dict:
+    """Send one request to a running daemon. Returns its response, or None if none is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(1.0)
+    try:
+        sock.connect(SOCKET_FILE)
+    except OSError:
+        sock.close()
+        return None
+    with sock:
+        sock.settimeout(timeout)
+        sock.sendall((json.dumps(request) + "\n").encode())
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    try:
+        return json.loads(data)
+    except ValueError:
+        return {"success": False, "error": "arnoldos daemon closed the connection without a response"}
+
+
+def refresh_caches(names: list) -> dict:
+    """Refresh caches through the daemon, or in this process if none is running."""
+    response = daemon_request({"refresh": names})
+    if response is not None:
+        return {"command": "refresh", "via": "daemon", **response}
+    unknown = [n for n in names if n not in CACHE_JOBS]
+    if unknown:
+        return {"command": "refresh", "success": False,
+                "error": f"unknown cache(s) {unknown}; choose from {', '.join(CACHE_JOBS)}"}
+    scheduler = CacheScheduler(get_creds())
+    jobs = {name: scheduler.run(name) for name in names}
+    return {"command": "refresh", "via": "local", "success": all(j["ok"] for j in jobs.values()), "jobs": jobs}
+
+
+def serve():
+    """Run the cache daemon on SOCKET_FILE until interrupted."""
+    if daemon_request({"status": True}, timeout=5) is not None:
+        print(f"ERROR: An arnoldos daemon is already listening on {SOCKET_FILE}")
+        sys.exit(1)
+    os.makedirs(os.path.dirname(SOCKET_FILE), exist_ok=True)
+    if os.path.lexists(SOCKET_FILE):
+        os.unlink(SOCKET_FILE)
+
+    scheduler = CacheScheduler(get_creds())
+    old_umask = os.umask(0o177)
+    try:
+        server = ArnoldOSServer(SOCKET_FILE, scheduler)
+    finally:
+        os.umask(old_umask)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    log(f"serve: listening on {SOCKET_FILE}, caches in {CACHE_DIR}")
+    try:
+        server.serve_forever(poll_interval=0.5)
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if os.path.lexists(SOCKET_FILE):
+            os.unlink(SOCKET_FILE)
+        log("serve: stopped")
+
+
 # --- CLI ---
 if __name__ == "__main__":
     # Parse --json flag
@@ -1516,31 +2442,44 @@ if __name__ == "__main__":
     use_json = "--json" in args
     if use_json:
         args.remove("--json")
+    if "--stats" in args:
+        # Per-endpoint API latency counters on stderr, after the command's own output
+        args.remove("--stats")
+        atexit.register(lambda: print(json.dumps({"api_stats": api_stats()}, indent=2), file=sys.stderr))
 
     cmd = args[0] if args else "brief"
 
     if cmd == "today":
         if use_json:
-            creds = get_creds()
-            t_min, t_max = get_time_range_today()
-            now = datetime.now(CST)
-            data = events_json(creds, t_min, t_max)
-            json_output({"command": "today", "date": now.strftime("%Y-%m-%d"), "domains": data})
+            json_output(today_json(get_creds()))
         else:
             print_today()
 
     elif cmd == "week":
         if use_json:
-            creds = get_creds()
-            t_min, t_max = get_time_range_week()
-            now = datetime.now(CST)
-            end = now + timedelta(days=7)
-            data = events_json(creds, t_min, t_max)
-            json_output({"command": "week", "startDate": now.strftime("%Y-%m-%d"),
-                         "endDate": end.strftime("%Y-%m-%d"), "domains": data})
+            json_output(week_json(get_creds()))
         else:
             print_week()
 
+    elif cmd == "serve":
+        serve()
+
+    elif cmd == "refresh":
+        # refresh [today|tasks|week|preaching ...] — all caches when none given
+        names = args[1:] or list(CACHE_JOBS)
+        result = refresh_caches(names)
+        if use_json:
+            json_output(result)
+        jobs = result.get("jobs", {})
+        for name in names:
+            if name in jobs:
+                job = jobs[name]
+                print(f"{'✅' if job['ok'] else '❌'} {name} ({job['duration_ms']} ms)"
+                      + (f" — {job['error']}" if job["error"] else ""))
+        if "error" in result:
+            print(f"❌ {result['error']}")
+        sys.exit(0 if result["success"] else 1)
+
     elif cmd == "tasks":
         if use_json:
             creds = get_creds()
@@ -1548,38 +2487,28 @@ if __name__ == "__main__":
         else:
             print_tasks()
 
-    elif cmd == "conflicts":
-        if use_json:
-            creds = get_creds()
-            t_min, t_max = get_time_range_today()
-            all_events = get_all_events(creds, t_min, t_max)
-            conflicts = detect_conflicts(all_events)
-            json_output({"command": "conflicts", "count": len(conflicts),
-                         "conflicts": [{"a": {"domain": a["domain"], "summary": a["summary"],
-                                              "start": a["start"].isoformat(), "end": a["end"].isoformat()},
-                                        "b": {"domain": b["domain"], "summary": b["summary"],
-                                              "start": b["start"].isoformat(), "end": b["end"].isoformat()}}
-                                       for a, b in conflicts]})
-        else:
-            print_conflicts()
-
-    elif cmd == "conflicts-week":
+    elif cmd in ("conflicts", "conflicts-week"):
+        # Optional: --buffer <minutes> (travel time between events), --all-day
+        buffer_minutes = 0
+        include_all_day = "--all-day" in args
+        if "--buffer" in args:
+            idx = args.index("--buffer")
+            try:
+                buffer_minutes = int(args[idx + 1])
+            except (IndexError, ValueError):
+                if use_json:
+                    json_output({"command": cmd, "success": False, "error": "--buffer needs a number of minutes"})
+                print("Usage: arnoldos.py conflicts [--buffer <minutes>] [--all-day]")
+                sys.exit(1)
+        creds = get_creds()
+        t_min, t_max = get_time_range_today() if cmd == "conflicts" else get_time_range_week()
+        all_events = get_all_events(creds, t_min, t_max)
         if use_json:
-            creds = get_creds()
-            t_min, t_max = get_time_range_week()
-            all_events = get_all_events(creds, t_min, t_max)
-            conflicts = detect_conflicts(all_events)
-            json_output({"command": "conflicts-week", "count": len(conflicts),
-                         "conflicts": [{"a": {"domain": a["domain"], "summary": a["summary"],
-                                              "start": a["start"].isoformat(), "end": a["end"].isoformat()},
-                                        "b": {"domain": b["domain"], "summary": b["summary"],
-                                              "start": b["start"].isoformat(), "end": b["end"].isoformat()}}
-                                       for a, b in conflicts]})
+            conflicts = detect_conflicts(all_events, buffer_minutes, include_all_day)
+            json_output({"command": cmd, "count": len(conflicts), "buffer_minutes": buffer_minutes,
+                         "conflicts": [conflict_json(a, b) for a, b in conflicts]})
         else:
-            creds = get_creds()
-            t_min, t_max = get_time_range_week()
-            all_events = get_all_events(creds, t_min, t_max)
-            print_conflicts(all_events)
+            print_conflicts(all_events, buffer_minutes, include_all_day)
 
     elif cmd == "drive-inbox":
         if use_json:
@@ -1804,6 +2733,40 @@ if __name__ == "__main__":
             else:
                 print(f"❌ Failed: {result['error']}")
 
+    elif cmd in ("quick", "quick-event") and "--batch" in args:
+        # quick[-event] --batch [FILE|-] [--domain DOMAIN] — one capture per line, stdin by default
+        idx = args.index("--batch")
+        source = args[idx + 1] if idx + 1 < len(args) and not args[idx + 1].startswith("--") else "-"
+        force_domain = args[args.index("--domain") + 1] if "--domain" in args[:-1] else None
+        try:
+            if source == "-":
+                lines = sys.stdin.read().splitlines()
+            else:
+                with open(source) as f:
+                    lines = f.read().splitlines()
+        except OSError as e:
+            if use_json:
+                json_output({"command": cmd, "success": False, "error": str(e)})
+            print(f"❌ {e}")
+            sys.exit(1)
+
+        creds = get_creds()
+        all_ok = True
+        for result in quick_batch(creds, lines, "task" if cmd == "quick" else "event", force_domain):
+            all_ok = all_ok and result["success"]
+            if use_json:
+                # One JSON object per line, printed as each batch completes
+                print(json.dumps(result, default=str), flush=True)
+            elif result["success"] and cmd == "quick":
+                due = result["task"].get("due")
+                print(f"✅ {result['line']}: {result['task']['title']}" + (f" (due {due[:10]})" if due else ""))
+            elif result["success"]:
+                inf = result["inference"]
+                print(f"✅ {result['line']}: {result['event']['summary']} — {inf['calendar']} {inf['parsed_date']} {inf['parsed_time']}")
+            else:
+                print(f"❌ {result['line']}: {result['input']} — {result['error']}")
+        sys.exit(0 if all_ok else 1)
+
     elif cmd == "quick":
         # quick <natural language text> [--domain DOMAIN]
         if len(args) < 2:
@@ -4,6 +4,17 @@
 Syncs 01_ArnoldOS_Gemini and 02_ClawdBot folders with format conversion.
 Google Docs on Drive ↔ Markdown locally for AI readability.
 
+The first pull lists every mapped folder and indexes the Drive tree in the
+state file together with a Changes API page token. Later pulls only ask Drive
+for changes since that token and fetch the files that moved, so a sync where
+nothing changed costs a single API call. Push resolves existing Drive files
+from the same index instead of listing the folders again.
+
+Downloads and uploads run on a pool of MAX_WORKERS threads, backing off
+together when Drive reports a rate limit. Each synced file's size, mtime_ns
+and inode are kept in the state, and push only re-reads and re-hashes files
+whose stat changed.
+
 Usage:
   python3 drive-sync-unified.py pull              # Drive → Local
   python3 drive-sync-unified.py push              # Local → Drive
@@ -11,13 +22,20 @@ Usage:
   python3 drive-sync-unified.py status            # Show sync state
   python3 drive-sync-unified.py dry               # Dry run (show what would happen)
   python3 drive-sync-unified.py list-folders      # Show configured folder mappings
+  python3 drive-sync-unified.py watch [SECONDS]   # Sync every SECONDS (default 60), pushing
+                                                  # only files inotify saw change (needs pyinotify)
 """
 
 import sys
 import os
 import json
 import hashlib
+import random
 import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -25,6 +43,7 @@ from typing import Optional
 from google.oauth2.credentials import Credentials
 from google.auth.transport.requests import Request
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaIoBaseUpload, MediaIoBaseDownload
 import io
 
@@ -64,6 +83,37 @@ SYNC_EXTENSIONS = {'.md', '.txt', '.json', '.yaml', '.yml', '.py', '.sh', '.js'}
 GDOC_MIME = "application/vnd.google-apps.document"
 GSHEET_MIME = "application/vnd.google-apps.spreadsheet"
 GSLIDES_MIME = "application/vnd.google-apps.presentation"
+FOLDER_MIME = "application/vnd.google-apps.folder"
+
+# Fields requested from changes.list; file() matches what the tree index keeps
+CHANGE_FIELDS = ("nextPageToken,newStartPageToken,"
+                 "changes(fileId,removed,file(id,name,mimeType,modifiedTime,md5Checksum,parents,trashed))")
+# Fields returned by uploads, so pushed files go straight into the index
+UPLOAD_FIELDS = "id,name,mimeType,modifiedTime,md5Checksum"
+# Tree listing asks for the children of this many folders per files.list query
+FOLDERS_PER_QUERY = 40
+LIST_FIELDS = "nextPageToken,files(id,name,mimeType,modifiedTime,md5Checksum,parents)"
+
+# Transfers run on a bounded pool; each worker thread builds its own Drive
+# service because the underlying httplib2 connection is not thread-safe.
+MAX_WORKERS = 8
+# Files up to this size go up as a single multipart request; larger ones
+# use a resumable session (Drive's multipart limit is 5 MB)
+SIMPLE_UPLOAD_MAX = 5 * 1024 * 1024
+MAX_RETRIES = 5
+BACKOFF_BASE = 1.0  # seconds; doubles per attempt, full jitter
+BACKOFF_CAP = 32.0
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+# A create that got a 5xx may still have been applied; only retry when Drive says it wasn't
+CREATE_RETRY_STATUSES = {429, 503}
+# 403 reasons that mean "slow down" rather than "forbidden"
+RATE_LIMIT_REASONS = {"rateLimitExceeded", "userRateLimitExceeded"}
+
+# A stat signature this fresh is not recorded: a second write within the same
+# mtime tick would leave size and mtime unchanged
+STAT_SETTLE_NS = 1_000_000_000
+# Seconds between sync passes in watch mode
+WATCH_INTERVAL = 60
 
 # Skip patterns
 SKIP_PATTERNS = [
@@ -77,14 +127,18 @@ SKIP_PATTERNS = [
 ]
 
 
+_log_lock = threading.Lock()
+
+
 def log(msg: str, level: str = "INFO"):
     """Log message to file and stdout."""
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     line = f"[{timestamp}] [{level}] {msg}"
-    print(line)
-    Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
-    with open(LOG_FILE, "a") as f:
-        f.write(line + "\n")
+    with _log_lock:
+        print(line)
+        Path(LOG_FILE).parent.mkdir(parents=True, exist_ok=True)
+        with open(LOG_FILE, "a") as f:
+            f.write(line + "\n")
 
 
 def get_creds() -> Credentials:
@@ -127,10 +181,12 @@ def load_state() -> dict:
 
 
 def save_state(state: dict):
-    """Save sync state to file."""
+    """Save sync state to file (atomically — a torn write would lose the change token)."""
     Path(STATE_FILE).parent.mkdir(parents=True, exist_ok=True)
-    with open(STATE_FILE, "w") as f:
+    tmp_file = STATE_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
         json.dump(state, f, indent=2)
+    os.replace(tmp_file, STATE_FILE)
 
 
 def md5_hash(content: str) -> str:
@@ -145,6 +201,14 @@ def normalize_content(content: str) -> str:
     return normalized + '\n'
 
 
+def file_signature(path: Path) -> Optional[list]:
+    """[size, mtime_ns, inode] of a local file, or None if it changed too recently to trust."""
+    st = path.stat()
+    if time.time_ns() - st.st_mtime_ns < STAT_SETTLE_NS:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
 def should_skip(path: str) -> bool:
     """Check if path should be skipped."""
     for pattern in SKIP_PATTERNS:
@@ -158,86 +222,276 @@ def get_drive_service(creds):
     return build('drive', 'v3', credentials=creds)
 
 
-def list_drive_folder(service, folder_id: str, recursive: bool = True) -> list:
-    """List all files in a Drive folder, optionally recursively."""
-    results = []
-    
-    query = f"'{folder_id}' in parents and trashed = false"
-    response = service.files().list(
-        q=query,
-        fields="files(id,name,mimeType,modifiedTime,md5Checksum)",
-        pageSize=1000,
-    ).execute()
-    
-    files = response.get('files', [])
-    
-    for f in files:
-        f['parent_id'] = folder_id
-        
-        # If it's a folder and we're recursive, descend
-        if f['mimeType'] == 'application/vnd.google-apps.folder':
-            if recursive:
-                f['children'] = list_drive_folder(service, f['id'], recursive=True)
-            results.append(f)
-        else:
-            results.append(f)
-    
-    return results
+_worker = threading.local()
+_throttle_lock = threading.Lock()
+_throttle_until = 0.0  # monotonic time before which no worker sends a request
 
 
-def flatten_drive_files(files: list, path_prefix: str = "") -> list:
-    """Flatten recursive file list into flat list with paths."""
-    result = []
-    for f in files:
-        current_path = f"{path_prefix}/{f['name']}" if path_prefix else f['name']
-        
-        if f['mimeType'] == 'application/vnd.google-apps.folder':
-            # It's a folder - process children
-            if 'children' in f:
-                result.extend(flatten_drive_files(f['children'], current_path))
-        else:
-            f['rel_path'] = current_path
-            result.append(f)
-    
-    return result
+def worker_service(creds):
+    """The calling thread's own Drive service, built on first use."""
+    if getattr(_worker, 'service', None) is None:
+        _worker.service = get_drive_service(creds)
+    return _worker.service
 
 
-def mirror_folder_structure(service, drive_folder_id: str, local_path: Path):
-    """Create local folder structure to match Drive, including empty folders."""
-    local_path = Path(os.path.expanduser(str(local_path)))
-    local_path.mkdir(parents=True, exist_ok=True)
-    
-    def get_subfolders_recursive(folder_id: str, path_prefix: str = ""):
-        """Recursively get all subfolders."""
-        folders = []
-        query = f"'{folder_id}' in parents and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
-        try:
-            response = service.files().list(q=query, fields="files(id,name)", pageSize=1000).execute()
-            for f in response.get('files', []):
-                folder_path = f"{path_prefix}/{f['name']}" if path_prefix else f['name']
-                folders.append(folder_path)
-                folders.extend(get_subfolders_recursive(f['id'], folder_path))
-        except Exception as e:
-            log(f"Warning: Could not list subfolders: {e}", "WARN")
-        return folders
-    
+def is_rate_limited(e: HttpError) -> bool:
+    if e.resp.status == 429:
+        return True
+    if e.resp.status != 403:
+        return False
     try:
-        subfolders = get_subfolders_recursive(drive_folder_id)
-        for folder_rel_path in subfolders:
-            folder_path = local_path / folder_rel_path
-            folder_path.mkdir(parents=True, exist_ok=True)
-    except Exception as e:
-        log(f"Warning: Could not mirror folder structure: {e}", "WARN")
+        errors = json.loads(e.content).get('error', {}).get('errors', [])
+    except (ValueError, AttributeError):
+        return False
+    return any(err.get('reason') in RATE_LIMIT_REASONS for err in errors)
+
+
+def backoff_delay(attempt: int, e: Optional[HttpError] = None) -> float:
+    delay = random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * 2 ** attempt))
+    retry_after = e.resp.get('retry-after') if e is not None else None
+    if retry_after and retry_after.isdigit():
+        delay = max(delay, min(float(retry_after), BACKOFF_CAP * 2))
+    return delay
+
+
+def with_backoff(fn, idempotent: bool = True):
+    """Call fn(), retrying rate limits, 5xx and dropped connections.
+
+    A rate limit pauses every worker, not just the one that hit it, so the
+    pool backs off as a whole instead of each thread tripping over the quota
+    in turn. Non-idempotent calls (creates) only retry when Drive says the
+    request was not applied.
+    """
+    global _throttle_until
+    retry_statuses = RETRY_STATUSES if idempotent else CREATE_RETRY_STATUSES
+    attempt = 0
+    while True:
+        with _throttle_lock:
+            wait = _throttle_until - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        try:
+            return fn()
+        except HttpError as e:
+            rate_limited = is_rate_limited(e)
+            if attempt >= MAX_RETRIES or not (rate_limited or e.resp.status in retry_statuses):
+                raise
+            delay = backoff_delay(attempt, e)
+            if rate_limited:
+                with _throttle_lock:
+                    _throttle_until = max(_throttle_until, time.monotonic() + delay)
+        except (ConnectionError, socket.timeout):
+            if attempt >= MAX_RETRIES or not idempotent:
+                raise
+            delay = backoff_delay(attempt)
+        time.sleep(delay)
+        attempt += 1
+
+
+def execute(request, idempotent: bool = True):
+    """request.execute() with with_backoff() retries."""
+    return with_backoff(request.execute, idempotent)
+
+
+def run_transfers(creds, jobs: list, transfer):
+    """Run transfer(service, job) over jobs on the worker pool.
+
+    Yields (job, result) as each finishes; results are applied to state by
+    the caller, so only the main thread ever touches it.
+    """
+    if not jobs:
+        return
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(jobs))) as pool:
+        futures = {pool.submit(lambda job: transfer(worker_service(creds), job), job): job for job in jobs}
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+def list_drive_tree(service, folder_ids) -> dict:
+    """List everything under the given folders as tree index entries.
+
+    Walks the tree a level at a time. Each query covers up to
+    FOLDERS_PER_QUERY folders at once ('a' in parents or 'b' in parents ...)
+    and is paged to the end, so a sync of all mappings costs roughly one
+    query per tree level rather than one per folder.
+    """
+    items = {}
+    frontier = list(folder_ids)
+    while frontier:
+        next_frontier = []
+        for i in range(0, len(frontier), FOLDERS_PER_QUERY):
+            chunk = frontier[i:i + FOLDERS_PER_QUERY]
+            parents = set(chunk)
+            query = "(" + " or ".join(f"'{folder_id}' in parents" for folder_id in chunk) + ") and trashed = false"
+            page_token = None
+            while True:
+                response = execute(service.files().list(
+                    q=query,
+                    fields=LIST_FIELDS,
+                    pageSize=1000,
+                    pageToken=page_token,
+                ))
+                for f in response.get('files', []):
+                    if f['id'] in items:
+                        continue
+                    parent = next(p for p in f.get('parents', []) if p in parents)
+                    items[f['id']] = index_item(f, parent)
+                    if f['mimeType'] == FOLDER_MIME:
+                        next_frontier.append(f['id'])
+                page_token = response.get('nextPageToken')
+                if not page_token:
+                    break
+        frontier = next_frontier
+    return items
+
+
+def mapping_roots() -> dict:
+    """Map each configured Drive root folder ID to its local path."""
+    return {drive_id: Path(os.path.expanduser(local_path))
+            for drive_id, local_path, _ in FOLDER_MAPPINGS if "placeholder" not in drive_id}
+
+
+# Drive tree index: state["drive_items"] holds every file and folder under the
+# mapped roots as {id: {name, mimeType, modifiedTime, md5Checksum, parent}}.
+# A full listing builds it; after that it is kept current from the Changes API
+# feed, whose position is state["changes_token"].
+
+def index_item(f: dict, parent_id: str) -> dict:
+    """Tree index entry for a Drive file resource."""
+    return {
+        'name': f['name'],
+        'mimeType': f['mimeType'],
+        'modifiedTime': f.get('modifiedTime', ''),
+        'md5Checksum': f.get('md5Checksum', ''),
+        'parent': parent_id,
+    }
+
+
+def item_paths(items: dict, roots) -> dict:
+    """Resolve indexed items to {id: (root_id, rel_path)}.
+
+    Items whose parent chain does not reach one of `roots` (moved out of a
+    synced tree, or under a removed folder) are left out.
+    """
+    paths = {}
+
+    def resolve(item_id: str, depth: int = 0):
+        if item_id in paths:
+            return paths[item_id]
+        item = items.get(item_id)
+        if item is None or depth > 100:
+            return None
+        parent = item['parent']
+        if parent in roots:
+            result = (parent, item['name'])
+        else:
+            up = resolve(parent, depth + 1)
+            result = (up[0], f"{up[1]}/{item['name']}") if up else None
+        paths[item_id] = result
+        return result
+
+    for item_id in items:
+        resolve(item_id)
+    return {k: v for k, v in paths.items() if v}
+
+
+def has_ancestor(items: dict, item_id: str, folder_ids: set) -> bool:
+    """True if one of `folder_ids` is on the item's indexed parent chain."""
+    seen = set()
+    parent = items[item_id]['parent']
+    while parent in items and parent not in seen:
+        if parent in folder_ids:
+            return True
+        seen.add(parent)
+        parent = items[parent]['parent']
+    return parent in folder_ids
+
+
+def has_tree_index(state: dict, drive_folder_id: str) -> bool:
+    """True when the index in state covers this mapping."""
+    return bool(state.get('changes_token')) and drive_folder_id in state.get('drive_roots', [])
+
+
+def start_page_token(service) -> str:
+    """Current position of the Drive change feed."""
+    return execute(service.changes().getStartPageToken())['startPageToken']
+
+
+def list_changes(service, page_token: str) -> tuple:
+    """All changes since page_token. Returns (changes, new_start_page_token)."""
+    changes = []
+    while True:
+        response = execute(service.changes().list(
+            pageToken=page_token,
+            spaces='drive',
+            includeRemoved=True,
+            pageSize=1000,
+            fields=CHANGE_FIELDS,
+        ))
+        changes.extend(response.get('changes', []))
+        if 'newStartPageToken' in response:
+            return changes, response['newStartPageToken']
+        page_token = response['nextPageToken']
+
+
+def apply_changes(service, items: dict, roots: dict, changes: list) -> set:
+    """Update the tree index from a change feed. Returns the IDs to pull.
+
+    Removed or trashed files just leave the index; like a full pull, local
+    copies are never deleted. A folder that appears in a synced tree for the
+    first time (created, or moved in from elsewhere) is listed once, since the
+    feed does not repeat its existing contents. Renaming or moving a known
+    folder touches everything indexed under it, as their local paths change.
+    """
+    touched = set()
+    relocated = set()
+    pending = []
+    for change in changes:
+        f = change.get('file')
+        if change.get('removed') or not f or f.get('trashed'):
+            items.pop(change['fileId'], None)
+        else:
+            pending.append(f)
+
+    # Parents may arrive after their children, so place what we can and retry
+    while pending:
+        waiting = []
+        for f in pending:
+            parent = next((p for p in f.get('parents', []) if p in roots or p in items), None)
+            if parent is None:
+                waiting.append(f)
+                continue
+            old = items.get(f['id'])
+            items[f['id']] = index_item(f, parent)
+            touched.add(f['id'])
+            if f['mimeType'] != FOLDER_MIME:
+                continue
+            if old is None:
+                listing = list_drive_tree(service, [f['id']])
+                items.update(listing)
+                touched.update(listing)
+            elif (old['name'], old['parent']) != (f['name'], parent):
+                relocated.add(f['id'])
+        if len(waiting) == len(pending):
+            # Outside every synced tree (or moved out of one)
+            for f in waiting:
+                items.pop(f['id'], None)
+            break
+        pending = waiting
+
+    if relocated:
+        touched.update(item_id for item_id in items if has_ancestor(items, item_id, relocated))
+    return touched
 
 
 
 def download_gdoc_as_md(service, file_id: str) -> Optional[str]:
     """Download a Google Doc as plain text (markdown)."""
     try:
-        response = service.files().export(
+        response = execute(service.files().export(
             fileId=file_id,
             mimeType='text/plain'
-        ).execute()
+        ))
         
         if isinstance(response, bytes):
             return response.decode('utf-8')
@@ -249,22 +503,33 @@ def download_gdoc_as_md(service, file_id: str) -> Optional[str]:
 
 def download_file(service, file_id: str) -> Optional[bytes]:
     """Download a regular file from Drive."""
-    try:
+    def fetch():
         request = service.files().get_media(fileId=file_id)
         fh = io.BytesIO()
         downloader = MediaIoBaseDownload(fh, request)
         done = False
         while not done:
             status, done = downloader.next_chunk()
-        fh.seek(0)
-        return fh.read()
+        return fh.getvalue()
+
+    try:
+        return with_backoff(fetch)
     except Exception as e:
         log(f"Error downloading file {file_id}: {e}", "ERROR")
         return None
 
 
-def upload_md_as_gdoc(service, local_path: Path, folder_id: str, existing_id: Optional[str] = None) -> Optional[str]:
-    """Upload a markdown file as a Google Doc."""
+def media_upload(content: bytes, mimetype: str) -> MediaIoBaseUpload:
+    """Upload body: one multipart request for small files, resumable above SIMPLE_UPLOAD_MAX."""
+    return MediaIoBaseUpload(
+        io.BytesIO(content),
+        mimetype=mimetype,
+        resumable=len(content) > SIMPLE_UPLOAD_MAX
+    )
+
+
+def upload_md_as_gdoc(service, local_path: Path, folder_id: str, existing_id: Optional[str] = None) -> Optional[dict]:
+    """Upload a markdown file as a Google Doc. Returns the Drive file resource (UPLOAD_FIELDS)."""
     try:
         content = local_path.read_text(encoding='utf-8')
         
@@ -277,38 +542,27 @@ def upload_md_as_gdoc(service, local_path: Path, folder_id: str, existing_id: Op
         
         if existing_id:
             # Update existing
-            media = MediaIoBaseUpload(
-                io.BytesIO(content.encode('utf-8')),
-                mimetype='text/plain',
-                resumable=True
-            )
-            file = service.files().update(
+            return execute(service.files().update(
                 fileId=existing_id,
-                media_body=media
-            ).execute()
-            return file.get('id')
+                media_body=media_upload(content.encode('utf-8'), 'text/plain'),
+                fields=UPLOAD_FIELDS
+            ))
         else:
             # Create new
             file_metadata['parents'] = [folder_id]
-            media = MediaIoBaseUpload(
-                io.BytesIO(content.encode('utf-8')),
-                mimetype='text/plain',
-                resumable=True
-            )
-            file = service.files().create(
+            return execute(service.files().create(
                 body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
-            return file.get('id')
+                media_body=media_upload(content.encode('utf-8'), 'text/plain'),
+                fields=UPLOAD_FIELDS
+            ), idempotent=False)
             
     except Exception as e:
         log(f"Error uploading {local_path}: {e}", "ERROR")
         return None
 
 
-def upload_file(service, local_path: Path, folder_id: str, existing_id: Optional[str] = None) -> Optional[str]:
-    """Upload a regular file to Drive."""
+def upload_file(service, local_path: Path, folder_id: str, existing_id: Optional[str] = None) -> Optional[dict]:
+    """Upload a regular file to Drive. Returns the Drive file resource (UPLOAD_FIELDS)."""
     try:
         content = local_path.read_bytes()
         
@@ -330,41 +584,56 @@ def upload_file(service, local_path: Path, folder_id: str, existing_id: Optional
         mimetype = mime_map.get(ext, 'text/plain')
         
         if existing_id:
-            media = MediaIoBaseUpload(
-                io.BytesIO(content),
-                mimetype=mimetype,
-                resumable=True
-            )
-            file = service.files().update(
+            return execute(service.files().update(
                 fileId=existing_id,
-                media_body=media
-            ).execute()
-            return file.get('id')
+                media_body=media_upload(content, mimetype),
+                fields=UPLOAD_FIELDS
+            ))
         else:
             file_metadata['parents'] = [folder_id]
-            media = MediaIoBaseUpload(
-                io.BytesIO(content),
-                mimetype=mimetype,
-                resumable=True
-            )
-            file = service.files().create(
+            return execute(service.files().create(
                 body=file_metadata,
-                media_body=media,
-                fields='id'
-            ).execute()
-            return file.get('id')
+                media_body=media_upload(content, mimetype),
+                fields=UPLOAD_FIELDS
+            ), idempotent=False)
             
     except Exception as e:
         log(f"Error uploading {local_path}: {e}", "ERROR")
         return None
 
 
+def folder_cache(items: dict, drive_folder_id: str) -> dict:
+    """Path → folder ID for one mapping ('' is the mapping root), from the tree index."""
+    folders = {'': drive_folder_id}
+    for item_id, (_, rel_path) in item_paths(items, {drive_folder_id}).items():
+        if items[item_id]['mimeType'] == FOLDER_MIME:
+            folders[rel_path] = item_id
+    return folders
+
+
+def resolve_drive_folder(service, folders: dict, items: dict, rel_dir: str) -> str:
+    """Folder ID for a path inside a mapping, creating missing folders.
+
+    A dictionary lookup for any folder already in the index. Only folders the
+    index has never seen go to ensure_drive_folder, and are then added to the
+    index so later runs find them too.
+    """
+    if rel_dir in folders:
+        return folders[rel_dir]
+    parent_dir, _, name = rel_dir.rpartition('/')
+    parent_id = resolve_drive_folder(service, folders, items, parent_dir)
+    folder_id = ensure_drive_folder(service, parent_id, name)
+    folders[rel_dir] = folder_id
+    items[folder_id] = index_item({'name': name, 'mimeType': FOLDER_MIME}, parent_id)
+    return folder_id
+
+
 def ensure_drive_folder(service, parent_id: str, folder_name: str) -> str:
     """Ensure a folder exists in Drive, create if needed. Returns folder ID."""
     # Check if exists - escape apostrophes in folder name for query
     safe_name = folder_name.replace("'", "\\'")
     query = f"'{parent_id}' in parents and name = '{safe_name}' and mimeType = 'application/vnd.google-apps.folder' and trashed = false"
-    response = service.files().list(q=query, fields="files(id)").execute()
+    response = execute(service.files().list(q=query, fields="files(id)"))
     files = response.get('files', [])
     
     if files:
@@ -376,125 +645,160 @@ def ensure_drive_folder(service, parent_id: str, folder_name: str) -> str:
         'mimeType': 'application/vnd.google-apps.folder',
         'parents': [parent_id]
     }
-    folder = service.files().create(body=file_metadata, fields='id').execute()
+    folder = execute(service.files().create(body=file_metadata, fields='id'), idempotent=False)
     return folder.get('id')
 
 
-def pull_folder(service, drive_folder_id: str, local_path: Path, state: dict, dry_run: bool = False) -> dict:
-    """Pull files from Drive folder to local path."""
-    stats = {"downloaded": 0, "skipped": 0, "errors": 0}
+def pull_file(drive_folder_id: str, local_path: Path, f: dict, state: dict, stats: dict, dry_run: bool = False) -> Optional[dict]:
+    """Decide whether a Drive file (with rel_path set) needs downloading.
+
+    Returns a download job for download_job(), or None when it is skipped.
+    """
+    rel_path = f['rel_path']
+    mime = f['mimeType']
     
-    local_path = Path(os.path.expanduser(str(local_path)))
+    if should_skip(rel_path):
+        stats["skipped"] += 1
+        return None
     
-    if not dry_run:
-        local_path.mkdir(parents=True, exist_ok=True)
-        # Mirror folder structure including empty folders
-        mirror_folder_structure(service, drive_folder_id, local_path)
-    
-    # List Drive files
-    drive_files = list_drive_folder(service, drive_folder_id, recursive=True)
-    flat_files = flatten_drive_files(drive_files)
-    
-    for f in flat_files:
-        rel_path = f['rel_path']
-        file_id = f['id']
-        mime = f['mimeType']
-        
-        if should_skip(rel_path):
-            stats["skipped"] += 1
-            continue
-        
-        # Determine local filename
-        if mime == GDOC_MIME:
-            # Google Doc -> .md
-            local_file = local_path / (rel_path + ".md")
-        elif mime in (GSHEET_MIME, GSLIDES_MIME):
-            # Skip sheets/slides for now
-            stats["skipped"] += 1
-            continue
+    # Determine local filename
+    if mime == GDOC_MIME:
+        # Google Doc -> .md
+        local_file = local_path / (rel_path + ".md")
+    elif mime in (GSHEET_MIME, GSLIDES_MIME):
+        # Skip sheets/slides for now
+        stats["skipped"] += 1
+        return None
+    else:
+        local_file = local_path / rel_path
+    
+    # Check if we need to download
+    state_key = f"{drive_folder_id}:{rel_path}"
+    drive_modified = f.get('modifiedTime', '')
+    
+    if state_key in state.get('files', {}):
+        if state['files'][state_key].get('drive_modified') == drive_modified:
+            if local_file.exists():
+                stats["skipped"] += 1
+                return None
+    
+    if dry_run:
+        log(f"[DRY RUN] Would download: {rel_path} -> {local_file}")
+        stats["downloaded"] += 1
+        return None
+    
+    return {'state_key': state_key, 'file': f, 'local_file': local_file}
+
+
+def download_job(service, job: dict) -> Optional[dict]:
+    """Download one pull_file() job and write it atomically. Returns its state entry."""
+    f = job['file']
+    local_file = job['local_file']
+    
+    # Ensure parent directory exists
+    local_file.parent.mkdir(parents=True, exist_ok=True)
+    # Per-file temp name: a.json and a.txt may be written at the same time
+    tmp_file = local_file.with_name(local_file.name + '.tmp')
+    
+    if f['mimeType'] == GDOC_MIME:
+        content = download_gdoc_as_md(service, f['id'])
+        if not content:
+            return None
+        tmp_file.write_text(content, encoding='utf-8')
+        local_hash = md5_hash(normalize_content(content))
+    else:
+        content = download_file(service, f['id'])
+        if not content:
+            return None
+        tmp_file.write_bytes(content)
+        # Hash text the way push_folder does, so an unchanged file is not pushed back
+        if local_file.suffix.lower() in SYNC_EXTENSIONS:
+            local_hash = md5_hash(normalize_content(content.decode('utf-8', errors='replace')))
         else:
-            local_file = local_path / rel_path
-        
-        # Check if we need to download
-        state_key = f"{drive_folder_id}:{rel_path}"
-        drive_modified = f.get('modifiedTime', '')
-        
-        if state_key in state.get('files', {}):
-            if state['files'][state_key].get('drive_modified') == drive_modified:
-                if local_file.exists():
-                    stats["skipped"] += 1
-                    continue
-        
-        # Download
-        if dry_run:
-            log(f"[DRY RUN] Would download: {rel_path} -> {local_file}")
+            local_hash = f.get('md5Checksum', '')
+    tmp_file.rename(local_file)
+    
+    return {
+        'drive_id': f['id'],
+        'drive_modified': f.get('modifiedTime', ''),
+        'local_hash': local_hash,
+        'local_stat': file_signature(local_file),
+        'synced_at': datetime.now().isoformat(),
+    }
+
+
+def run_downloads(creds, jobs: list, state: dict, stats: dict):
+    """Download pull_file() jobs on the worker pool and record them in state."""
+    for job, entry in run_transfers(creds, jobs, download_job):
+        if entry:
+            state.setdefault('files', {})[job['state_key']] = entry
+            log(f"Downloaded: {job['file']['rel_path']} -> {job['local_file']}")
             stats["downloaded"] += 1
-            continue
-        
-        # Ensure parent directory exists
-        local_file.parent.mkdir(parents=True, exist_ok=True)
-        
-        if mime == GDOC_MIME:
-            content = download_gdoc_as_md(service, file_id)
-            if content:
-                # Atomic write
-                tmp_file = local_file.with_suffix('.tmp')
-                tmp_file.write_text(content, encoding='utf-8')
-                tmp_file.rename(local_file)
-                
-                state.setdefault('files', {})[state_key] = {
-                    'drive_id': file_id,
-                    'drive_modified': drive_modified,
-                    'local_hash': md5_hash(normalize_content(content)),
-                    'synced_at': datetime.now().isoformat(),
-                }
-                log(f"Downloaded: {rel_path} -> {local_file}")
-                stats["downloaded"] += 1
-            else:
-                stats["errors"] += 1
         else:
-            content = download_file(service, file_id)
-            if content:
-                tmp_file = local_file.with_suffix('.tmp')
-                tmp_file.write_bytes(content)
-                tmp_file.rename(local_file)
-                
-                state.setdefault('files', {})[state_key] = {
-                    'drive_id': file_id,
-                    'drive_modified': drive_modified,
-                    'local_hash': f.get('md5Checksum', ''),
-                    'synced_at': datetime.now().isoformat(),
-                }
-                log(f"Downloaded: {rel_path} -> {local_file}")
-                stats["downloaded"] += 1
-            else:
-                stats["errors"] += 1
-    
-    return stats
+            stats["errors"] += 1
+
 
+def pull_items(state: dict, roots: dict, item_ids, stats: dict, dry_run: bool = False) -> list:
+    """Download jobs for the given indexed items; folders are created locally.
 
-def push_folder(service, drive_folder_id: str, local_path: Path, state: dict, dry_run: bool = False) -> dict:
-    """Push local files to Drive folder."""
-    stats = {"uploaded": 0, "skipped": 0, "errors": 0}
+    A full pull passes every item in the index, a delta pull the ones
+    apply_changes touched.
+    """
+    jobs = []
+    items = state['drive_items']
+    paths = item_paths(items, roots)
     
+    for item_id in sorted(paths.keys() & set(item_ids), key=lambda i: paths[i]):
+        root_id, rel_path = paths[item_id]
+        item = items[item_id]
+        if item['mimeType'] == FOLDER_MIME:
+            if not dry_run:
+                (roots[root_id] / rel_path).mkdir(parents=True, exist_ok=True)
+            continue
+        job = pull_file(root_id, roots[root_id], dict(item, id=item_id, rel_path=rel_path), state, stats, dry_run)
+        if job:
+            jobs.append(job)
+    
+    return jobs
+
+
+def push_folder(service, drive_folder_id: str, local_path: Path, state: dict, stats: dict,
+                dry_run: bool = False, changed: Optional[set] = None) -> list:
+    """Find local files that changed and return upload jobs for them.
+
+    Walks the whole folder unless `changed` (absolute paths, from watch mode)
+    says which files to look at. Files whose stat signature matches the state
+    are skipped without being read. Missing Drive folders are created here,
+    one at a time, so parallel uploads never race to create the same folder.
+    """
+    jobs = []
     local_path = Path(os.path.expanduser(str(local_path)))
     
     if not local_path.exists():
         log(f"Local path does not exist: {local_path}", "WARN")
-        return stats
+        return jobs
     
-    # Build map of Drive files for lookup
-    drive_files = list_drive_folder(service, drive_folder_id, recursive=True)
-    flat_files = flatten_drive_files(drive_files)
+    if has_tree_index(state, drive_folder_id):
+        # Kept current by the last pull's change feed — no listing needed
+        items = state['drive_items']
+    else:
+        items = list_drive_tree(service, [drive_folder_id])
     
     # Map: relative_path (without .md for gdocs) -> file info
     drive_map = {}
-    for f in flat_files:
-        drive_map[f['rel_path']] = f
+    for item_id, (_, rel_path) in item_paths(items, {drive_folder_id}).items():
+        if items[item_id]['mimeType'] != FOLDER_MIME:
+            drive_map[rel_path] = dict(items[item_id], id=item_id)
+    folders = folder_cache(items, drive_folder_id)
+    
+    if changed is None:
+        candidates = local_path.rglob('*')
+    else:
+        candidates = sorted(p for p in changed if local_path in p.parents)
     
     # Walk local directory
-    for local_file in local_path.rglob('*'):
-        if local_file.is_dir():
+    for local_file in candidates:
+        if not local_file.is_file():
             continue
         
         rel_path = str(local_file.relative_to(local_path))
@@ -508,7 +812,28 @@ def push_folder(service, drive_folder_id: str, local_path: Path, state: dict, dr
             stats["skipped"] += 1
             continue
         
-        state_key = f"{drive_folder_id}:{rel_path}"
+        # Determine Drive path
+        if local_file.suffix.lower() == '.md':
+            # .md -> Google Doc (without .md extension)
+            drive_rel_path = rel_path[:-3]  # Remove .md
+            upload_as_gdoc = True
+        else:
+            drive_rel_path = rel_path
+            upload_as_gdoc = False
+        
+        # Keyed by Drive path, the same entry pull_file writes
+        state_key = f"{drive_folder_id}:{drive_rel_path}"
+        entry = state.get('files', {}).get(state_key)
+        
+        try:
+            local_stat = file_signature(local_file)
+        except OSError as e:
+            log(f"Error reading {local_file}: {e}", "ERROR")
+            stats["errors"] += 1
+            continue
+        if entry and local_stat and entry.get('local_stat') == local_stat:
+            stats["skipped"] += 1
+            continue
         
         # Read local content
         try:
@@ -532,32 +857,21 @@ def push_folder(service, drive_folder_id: str, local_path: Path, state: dict, dr
         else:
             local_hash = hashlib.md5(content).hexdigest()
         
-        # Check if changed
-        if state_key in state.get('files', {}):
-            if state['files'][state_key].get('local_hash') == local_hash:
-                stats["skipped"] += 1
-                continue
-        
-        # Determine Drive path
-        if local_file.suffix.lower() == '.md':
-            # .md -> Google Doc (without .md extension)
-            drive_rel_path = rel_path[:-3]  # Remove .md
-            upload_as_gdoc = True
-        else:
-            drive_rel_path = rel_path
-            upload_as_gdoc = False
+        # Check if changed (touched but identical: remember the new stat)
+        if entry and entry.get('local_hash') == local_hash:
+            if local_stat and not dry_run:
+                entry['local_stat'] = local_stat
+            stats["skipped"] += 1
+            continue
         
         # Find or create parent folder on Drive
-        path_parts = Path(drive_rel_path).parts
-        current_folder_id = drive_folder_id
-        
-        if len(path_parts) > 1:
-            # Need to navigate/create folders
-            for folder_name in path_parts[:-1]:
-                if dry_run:
-                    log(f"[DRY RUN] Would ensure folder: {folder_name}")
-                else:
-                    current_folder_id = ensure_drive_folder(service, current_folder_id, folder_name)
+        rel_dir = drive_rel_path.rpartition('/')[0]
+        current_folder_id = None
+        if dry_run:
+            if rel_dir not in folders:
+                log(f"[DRY RUN] Would ensure folder: {rel_dir}")
+        else:
+            current_folder_id = resolve_drive_folder(service, folders, items, rel_dir)
         
         # Check if file exists on Drive
         existing_id = None
@@ -570,59 +884,105 @@ def push_folder(service, drive_folder_id: str, local_path: Path, state: dict, dr
             stats["uploaded"] += 1
             continue
         
-        # Upload
-        if upload_as_gdoc:
-            result_id = upload_md_as_gdoc(service, local_file, current_folder_id, existing_id)
-        else:
-            result_id = upload_file(service, local_file, current_folder_id, existing_id)
-        
-        if result_id:
-            state.setdefault('files', {})[state_key] = {
-                'drive_id': result_id,
-                'local_hash': local_hash,
+        jobs.append({
+            'root_id': drive_folder_id,
+            'state_key': state_key,
+            'local_file': local_file,
+            'rel_path': rel_path,
+            'drive_rel_path': drive_rel_path,
+            'folder_id': current_folder_id,
+            'existing_id': existing_id,
+            'as_gdoc': upload_as_gdoc,
+            'local_hash': local_hash,
+            'local_stat': local_stat,
+        })
+    
+    return jobs
+
+
+def upload_job(service, job: dict) -> Optional[dict]:
+    """Upload one push_folder() job. Returns the Drive file resource."""
+    if job['as_gdoc']:
+        return upload_md_as_gdoc(service, job['local_file'], job['folder_id'], job['existing_id'])
+    return upload_file(service, job['local_file'], job['folder_id'], job['existing_id'])
+
+
+def run_uploads(creds, jobs: list, state: dict, stats: dict):
+    """Upload push_folder() jobs on the worker pool and record them in state."""
+    items = state.get('drive_items', {})
+    for job, result in run_transfers(creds, jobs, upload_job):
+        if result:
+            # Recording drive_modified lets the next pull recognise this upload
+            # in the change feed instead of downloading it straight back
+            state.setdefault('files', {})[job['state_key']] = {
+                'drive_id': result['id'],
+                'drive_modified': result.get('modifiedTime', ''),
+                'local_hash': job['local_hash'],
+                'local_stat': job['local_stat'],
                 'synced_at': datetime.now().isoformat(),
             }
-            log(f"Uploaded: {rel_path} -> Drive:{drive_rel_path}")
+            if has_tree_index(state, job['root_id']):
+                items[result['id']] = index_item(result, job['folder_id'])
+            log(f"Uploaded: {job['rel_path']} -> Drive:{job['drive_rel_path']}")
             stats["uploaded"] += 1
         else:
             stats["errors"] += 1
-    
-    return stats
 
 
 def cmd_pull(dry_run: bool = False):
-    """Pull all folders from Drive."""
+    """Pull all folders from Drive — from the change feed when the index is current."""
     creds = get_creds()
     service = get_drive_service(creds)
     state = load_state()
+    roots = mapping_roots()
     
     total_stats = {"downloaded": 0, "skipped": 0, "errors": 0}
+    jobs = []
     
-    for drive_id, local_path, recursive in FOLDER_MAPPINGS:
-        if "placeholder" in drive_id:
-            log(f"Skipping placeholder mapping: {local_path}", "WARN")
-            continue
-            
-        log(f"Pulling: {local_path}")
-        stats = pull_folder(service, drive_id, Path(local_path), state, dry_run)
-        
-        for k, v in stats.items():
-            total_stats[k] += v
+    changes = None
+    if state.get('changes_token') and sorted(state.get('drive_roots', [])) == sorted(roots):
+        try:
+            changes, new_token = list_changes(service, state['changes_token'])
+        except Exception as e:
+            log(f"Change feed unavailable, falling back to full listing: {e}", "WARN")
+    
+    if changes is None:
+        # Take the token before listing so edits made during the walk show up next time
+        new_token = start_page_token(service)
+        log(f"Listing {len(roots)} mapped folders")
+        state['drive_items'] = list_drive_tree(service, roots)
+        if not dry_run:
+            for local_root in roots.values():
+                local_root.mkdir(parents=True, exist_ok=True)
+        jobs = pull_items(state, roots, state['drive_items'], total_stats, dry_run)
+    elif changes:
+        items = state['drive_items']
+        touched = apply_changes(service, items, roots, changes)
+        paths = item_paths(items, roots)
+        state['drive_items'] = {k: v for k, v in items.items() if k in paths}
+        log(f"Drive changes: {len(changes)} since last sync, {len(touched)} in synced folders")
+        jobs = pull_items(state, roots, touched, total_stats, dry_run)
+    
+    # One pool across every mapping, so small folders don't leave workers idle
+    run_downloads(creds, jobs, state, total_stats)
     
     if not dry_run:
+        state['changes_token'] = new_token
+        state['drive_roots'] = sorted(roots)
         save_state(state)
     
     log(f"Pull complete: {total_stats['downloaded']} downloaded, {total_stats['skipped']} skipped, {total_stats['errors']} errors")
     return total_stats
 
 
-def cmd_push(dry_run: bool = False):
-    """Push all local folders to Drive."""
+def cmd_push(dry_run: bool = False, changed: Optional[set] = None):
+    """Push all local folders to Drive (only the `changed` paths, if given)."""
     creds = get_creds()
     service = get_drive_service(creds)
     state = load_state()
     
     total_stats = {"uploaded": 0, "skipped": 0, "errors": 0}
+    jobs = []
     
     for drive_id, local_path, recursive in FOLDER_MAPPINGS:
         if "placeholder" in drive_id:
@@ -630,10 +990,9 @@ def cmd_push(dry_run: bool = False):
             continue
             
         log(f"Pushing: {local_path}")
-        stats = push_folder(service, drive_id, Path(local_path), state, dry_run)
-        
-        for k, v in stats.items():
-            total_stats[k] += v
+        jobs += push_folder(service, drive_id, Path(local_path), state, total_stats, dry_run, changed)
+    
+    run_uploads(creds, jobs, state, total_stats)
     
     if not dry_run:
         save_state(state)
@@ -651,12 +1010,80 @@ def cmd_sync(dry_run: bool = False):
     return {"pull": pull_stats, "push": push_stats}
 
 
+def cmd_watch(interval: int = WATCH_INTERVAL):
+    """Sync every `interval` seconds; inotify queues changed paths in between.
+
+    Each pass pulls from the change feed and pushes only the queued paths, so
+    a quiet pass costs one API call and no local tree walk. The first pass,
+    and any pass after the inotify queue overflowed, walks everything.
+    """
+    try:
+        import pyinotify
+    except ImportError:
+        log("watch needs pyinotify: pip install pyinotify", "ERROR")
+        sys.exit(1)
+    
+    queued = set()
+    full_walk = [True]
+    
+    class QueueChanges(pyinotify.ProcessEvent):
+        def process_IN_Q_OVERFLOW(self, event):
+            full_walk[0] = True
+        
+        def process_default(self, event):
+            if not event.dir:
+                queued.add(Path(event.pathname))
+            elif event.mask & (pyinotify.IN_MOVED_TO | pyinotify.IN_CREATE):
+                # A directory moved in (or filled before its watch was added)
+                # raises no events for the files already inside it
+                queued.update(p for p in Path(event.pathname).rglob('*') if p.is_file())
+    
+    wm = pyinotify.WatchManager()
+    mask = pyinotify.IN_CLOSE_WRITE | pyinotify.IN_MOVED_TO | pyinotify.IN_ATTRIB
+    for local_root in mapping_roots().values():
+        local_root.mkdir(parents=True, exist_ok=True)
+        wm.add_watch(str(local_root), mask, rec=True, auto_add=True)
+    notifier = pyinotify.Notifier(wm, QueueChanges(), timeout=1000)
+    log(f"Watching {len(mapping_roots())} folders, syncing every {interval}s")
+    
+    next_pass = 0.0
+    try:
+        while True:
+            if notifier.check_events():
+                notifier.read_events()
+                notifier.process_events()
+            if time.monotonic() < next_pass:
+                continue
+            next_pass = time.monotonic() + interval
+            changed = None if full_walk[0] else set(queued)
+            full_walk[0] = False
+            queued.clear()
+            try:
+                cmd_pull()
+                if changed is None or changed:
+                    cmd_push(changed=changed)
+            except Exception as e:
+                log(f"Sync pass failed, will retry: {e}", "ERROR")
+                if changed is None:
+                    full_walk[0] = True
+                else:
+                    queued.update(changed)
+    except KeyboardInterrupt:
+        log("Watch stopped")
+    finally:
+        notifier.stop()
+
+
 def cmd_status():
     """Show sync status."""
     state = load_state()
     
     print(f"State file: {STATE_FILE}")
     print(f"Total tracked files: {len(state.get('files', {}))}")
+    if state.get('changes_token'):
+        print(f"Drive index: {len(state.get('drive_items', {}))} items, change token {state['changes_token']}")
+    else:
+        print("Drive index: none (next pull lists every folder)")
     print()
     
     # Group by folder
@@ -703,6 +1130,8 @@ def main():
         cmd_status()
     elif cmd == "list-folders":
         cmd_list_folders()
+    elif cmd == "watch":
+        cmd_watch(int(sys.argv[2]) if len(sys.argv) > 2 else WATCH_INTERVAL)
     else:
         print(f"Unknown command: {cmd}")
         print(__doc__)
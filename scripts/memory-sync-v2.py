@@ -6,6 +6,10 @@ to 02_ClawdBot/01_Memory/daily/context/ and .../todos/
 
 Excludes: training/, daily logs, cache/, logs/
 
+Pull lists both folders in one query and keeps each doc's modifiedTime and
+version in the state file; only docs that changed since the last sync are
+exported, several at a time.
+
 Usage:
   python3 memory-sync-v2.py pull     # Drive → Local (.md files)
   python3 memory-sync-v2.py push     # Local → Drive (Google Docs)
@@ -18,6 +22,9 @@ import sys
 import os
 import json
 import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -39,12 +46,21 @@ TODOS_FOLDER_ID = "1MPBBEytKJSSuKO1pSWKJTMMCpalf3-xv"
 
 LOCAL_ROOT = Path.home() / "clawd" / "memory"
 
+# Doc fields kept in state to tell whether a doc changed since the last sync
+DOC_FIELDS = "id, name, modifiedTime, version"
+
 # Folders to sync: Drive folder ID → local subfolder
 SYNC_FOLDERS = {
     CONTEXT_FOLDER_ID: "context",
     TODOS_FOLDER_ID: "todos",
 }
 
+# Concurrent doc exports during pull (each worker thread has its own Drive service)
+EXPORT_WORKERS = 6
+
+# See STAT_SETTLE_NS in drive-sync-unified.py
+STAT_SETTLE_NS = 1_000_000_000
+
 
 def log(msg: str):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -108,13 +124,40 @@ def hash_content(content: str) -> str:
     return hashlib.md5(normalize_content(content).encode()).hexdigest()
 
 
+def file_signature(path: Path) -> Optional[list]:
+    """Same as file_signature() in drive-sync-unified.py."""
+    st = path.stat()
+    if time.time_ns() - st.st_mtime_ns < STAT_SETTLE_NS:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
 class MemorySync:
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
         self.creds = get_creds()
         self.drive = build("drive", "v3", credentials=self.creds)
         self.state = load_state()
+        self.state.setdefault("drive", {})  # local_rel → {id, modifiedTime, version} at last sync
+        self._local = threading.local()
         
+    def _worker_drive(self):
+        """Drive service for the calling thread; httplib2 connections are not thread-safe."""
+        if getattr(self._local, "drive", None) is None:
+            self._local.drive = build("drive", "v3", credentials=self.creds)
+        return self._local.drive
+    
+    def _stat_unchanged(self, local_file: Path, local_rel: str) -> bool:
+        """True if the file's stat matches the last sync, so it needn't be read."""
+        sig = file_signature(local_file)
+        if sig is None or local_rel not in self.state["files"]:
+            return False
+        return self.state.setdefault("stat", {}).get(local_rel) == sig
+    
+    def _remember_stat(self, local_file: Path, local_rel: str):
+        if not self.dry_run:
+            self.state.setdefault("stat", {})[local_rel] = file_signature(local_file)
+    
     def _get_doc_id(self, name: str, parent_id: str) -> Optional[str]:
         q = f"name='{name}' and '{parent_id}' in parents and mimeType='application/vnd.google-apps.document' and trashed=false"
         results = self.drive.files().list(q=q, fields="files(id)").execute()
@@ -122,7 +165,7 @@ class MemorySync:
         return files[0]["id"] if files else None
     
     def _download_doc_as_text(self, file_id: str) -> str:
-        content = self.drive.files().export(fileId=file_id, mimeType="text/plain").execute()
+        content = self._worker_drive().files().export(fileId=file_id, mimeType="text/plain").execute()
         return content.decode("utf-8")
     
     def _upload_text_as_doc(self, name: str, content: str, parent_id: str, existing_id: Optional[str] = None):
@@ -133,58 +176,93 @@ class MemorySync:
         )
         
         if existing_id:
-            self.drive.files().update(fileId=existing_id, media_body=media).execute()
+            return self.drive.files().update(fileId=existing_id, media_body=media, fields=DOC_FIELDS).execute()
         else:
             metadata = {
                 "name": name,
                 "parents": [parent_id],
                 "mimeType": "application/vnd.google-apps.document"
             }
-            self.drive.files().create(body=metadata, media_body=media, fields="id").execute()
+            return self.drive.files().create(body=metadata, media_body=media, fields=DOC_FIELDS).execute()
+    
+    def _list_docs(self, folder_ids: list) -> list:
+        """Docs in all the given folders, from one paged query."""
+        parents = " or ".join(f"'{folder_id}' in parents" for folder_id in folder_ids)
+        q = f"({parents}) and mimeType='application/vnd.google-apps.document' and trashed=false"
+        docs = []
+        page_token = None
+        while True:
+            results = self.drive.files().list(
+                q=q, fields=f"nextPageToken, files({DOC_FIELDS}, parents)", pageSize=200, pageToken=page_token
+            ).execute()
+            docs.extend(results.get("files", []))
+            page_token = results.get("nextPageToken")
+            if not page_token:
+                return docs
+    
+    def _remember_doc(self, local_rel: str, doc: dict):
+        if not self.dry_run:
+            self.state["drive"][local_rel] = {k: doc.get(k) for k in ("id", "modifiedTime", "version")}
     
-    def _list_docs_in_folder(self, folder_id: str) -> list:
-        q = f"'{folder_id}' in parents and mimeType='application/vnd.google-apps.document' and trashed=false"
-        results = self.drive.files().list(q=q, fields="files(id, name)", pageSize=200).execute()
-        return results.get("files", [])
+    def _doc_unchanged(self, doc: dict, local_rel: str, local_file: Path) -> bool:
+        """True if the doc is the same revision we last synced and the local copy exists."""
+        known = self.state["drive"].get(local_rel)
+        return (known is not None and local_file.exists()
+                and known.get("id") == doc["id"]
+                and known.get("modifiedTime") == doc.get("modifiedTime")
+                and known.get("version") == doc.get("version"))
     
     def pull(self):
         """Pull from Drive → Local."""
         log("Starting PULL: Drive → Local")
         stats = {"transferred": 0, "skipped": 0, "errors": 0}
         
-        for folder_id, local_subdir in SYNC_FOLDERS.items():
-            log(f"  [{local_subdir}/]")
-            local_dir = LOCAL_ROOT / local_subdir
-            docs = self._list_docs_in_folder(folder_id)
-            
-            for doc in docs:
-                doc_name = doc["name"]
-                local_file = local_dir / f"{doc_name}.md"
-                local_rel = f"{local_subdir}/{doc_name}.md"
-                
-                try:
-                    content = self._download_doc_as_text(doc["id"])
-                    content_hash = hash_content(content)
-                    
-                    if local_file.exists():
-                        local_content = local_file.read_text()
-                        if hash_content(local_content) == content_hash:
-                            stats["skipped"] += 1
-                            continue
-                    
-                    if self.dry_run:
-                        log(f"    🔍 Would download: {doc_name} → {local_rel}")
-                    else:
-                        local_dir.mkdir(parents=True, exist_ok=True)
-                        local_file.write_text(normalize_content(content))
-                        self.state["files"][local_rel] = content_hash
-                        log(f"    ✅ {doc_name} → {local_rel}")
-                    
-                    stats["transferred"] += 1
-                    
-                except Exception as e:
-                    log(f"    ❌ {doc_name}: {e}")
-                    stats["errors"] += 1
+        # One listing for every folder; only docs whose revision moved get exported
+        changed = []
+        for doc in self._list_docs(list(SYNC_FOLDERS)):
+            folder_id = next(p for p in doc.get("parents", []) if p in SYNC_FOLDERS)
+            local_subdir = SYNC_FOLDERS[folder_id]
+            local_file = LOCAL_ROOT / local_subdir / f"{doc['name']}.md"
+            local_rel = f"{local_subdir}/{doc['name']}.md"
+            if self._doc_unchanged(doc, local_rel, local_file):
+                stats["skipped"] += 1
+            else:
+                changed.append((doc, local_file, local_rel))
+        
+        if changed:
+            log(f"  {len(changed)} changed on Drive, {stats['skipped']} unchanged")
+            with ThreadPoolExecutor(max_workers=min(EXPORT_WORKERS, len(changed))) as pool:
+                futures = {pool.submit(self._download_doc_as_text, doc["id"]): (doc, local_file, local_rel)
+                           for doc, local_file, local_rel in changed}
+                for future in as_completed(futures):
+                    doc, local_file, local_rel = futures[future]
+                    doc_name = doc["name"]
+                    try:
+                        content = future.result()
+                        content_hash = hash_content(content)
+                        
+                        if local_file.exists():
+                            local_content = local_file.read_text()
+                            if hash_content(local_content) == content_hash:
+                                self._remember_doc(local_rel, doc)
+                                stats["skipped"] += 1
+                                continue
+                        
+                        if self.dry_run:
+                            log(f"    🔍 Would download: {doc_name} → {local_rel}")
+                        else:
+                            local_file.parent.mkdir(parents=True, exist_ok=True)
+                            local_file.write_text(normalize_content(content))
+                            self.state["files"][local_rel] = content_hash
+                            self._remember_stat(local_file, local_rel)
+                            self._remember_doc(local_rel, doc)
+                            log(f"    ✅ {doc_name} → {local_rel}")
+                        
+                        stats["transferred"] += 1
+                        
+                    except Exception as e:
+                        log(f"    ❌ {doc_name}: {e}")
+                        stats["errors"] += 1
         
         if not self.dry_run:
             save_state(self.state)
@@ -209,10 +287,15 @@ class MemorySync:
                 local_rel = f"{local_subdir}/{local_file.name}"
                 
                 try:
+                    if self._stat_unchanged(local_file, local_rel):
+                        stats["skipped"] += 1
+                        continue
+                    
                     content = local_file.read_text()
                     content_hash = hash_content(content)
                     
                     if self.state["files"].get(local_rel) == content_hash:
+                        self._remember_stat(local_file, local_rel)
                         stats["skipped"] += 1
                         continue
                     
@@ -222,8 +305,11 @@ class MemorySync:
                         action = "update" if existing_id else "create"
                         log(f"    🔍 Would {action}: {local_rel} → {doc_name}")
                     else:
-                        self._upload_text_as_doc(doc_name, content, folder_id, existing_id)
+                        doc = self._upload_text_as_doc(doc_name, content, folder_id, existing_id)
                         self.state["files"][local_rel] = content_hash
+                        self._remember_stat(local_file, local_rel)
+                        # Our own upload is not a Drive-side change for the next pull
+                        self._remember_doc(local_rel, doc)
                         log(f"    ✅ {local_rel} → {doc_name}")
                     
                     stats["transferred"] += 1
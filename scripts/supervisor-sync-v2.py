@@ -16,6 +16,7 @@ import sys
 import os
 import json
 import hashlib
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -39,6 +40,9 @@ SUBFOLDERS = {
     "PRDs": "PRDs",
 }
 
+# See STAT_SETTLE_NS in drive-sync-unified.py
+STAT_SETTLE_NS = 1_000_000_000
+
 
 def log(msg: str):
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -103,6 +107,14 @@ def hash_content(content: str) -> str:
     return hashlib.md5(normalize_content(content).encode()).hexdigest()
 
 
+def file_signature(path: Path) -> Optional[list]:
+    """Same as file_signature() in drive-sync-unified.py."""
+    st = path.stat()
+    if time.time_ns() - st.st_mtime_ns < STAT_SETTLE_NS:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
 class SupervisorSync:
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
@@ -111,6 +123,17 @@ class SupervisorSync:
         self.state = load_state()
         self.folder_cache = {}
         
+    def _stat_unchanged(self, local_file: Path, local_rel: str) -> bool:
+        """True if the file's stat matches the last sync, so it needn't be read."""
+        sig = file_signature(local_file)
+        if sig is None or local_rel not in self.state["files"]:
+            return False
+        return self.state.setdefault("stat", {}).get(local_rel) == sig
+    
+    def _remember_stat(self, local_file: Path, local_rel: str):
+        if not self.dry_run:
+            self.state.setdefault("stat", {})[local_rel] = file_signature(local_file)
+    
     def _get_folder_id(self, folder_name: str, parent_id: str) -> Optional[str]:
         cache_key = f"{parent_id}/{folder_name}"
         if cache_key in self.folder_cache:
@@ -196,6 +219,7 @@ class SupervisorSync:
                         local_dir.mkdir(parents=True, exist_ok=True)
                         local_file.write_text(normalize_content(content))
                         self.state["files"][local_rel] = content_hash
+                        self._remember_stat(local_file, local_rel)
                         log(f"  ✅ {doc_name} → {local_rel}")
                     
                     stats["transferred"] += 1
@@ -214,11 +238,16 @@ class SupervisorSync:
                 local_rel = str(local_file.relative_to(LOCAL_DIR))
                 
                 try:
+                    # Check if unchanged: stat first, content only if the stat moved
+                    if self._stat_unchanged(local_file, local_rel):
+                        stats["skipped"] += 1
+                        continue
+                    
                     content = local_file.read_text()
                     content_hash = hash_content(content)
                     
-                    # Check if unchanged
                     if self.state["files"].get(local_rel) == content_hash:
+                        self._remember_stat(local_file, local_rel)
                         stats["skipped"] += 1
                         continue
                     
@@ -230,6 +259,7 @@ class SupervisorSync:
                     else:
                         self._upload_text_as_doc(doc_name, content, drive_folder_id, existing_id)
                         self.state["files"][local_rel] = content_hash
+                        self._remember_stat(local_file, local_rel)
                         log(f"  ✅ {local_rel} → {doc_name}")
                     
                     stats["transferred"] += 1
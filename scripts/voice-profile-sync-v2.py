@@ -16,6 +16,7 @@ import sys
 import os
 import json
 import hashlib
+import time
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
@@ -53,6 +54,9 @@ DIR_MAP = {
     "calibration-sessions": "memory/training/calibration-sessions",
 }
 
+# See STAT_SETTLE_NS in drive-sync-unified.py
+STAT_SETTLE_NS = 1_000_000_000
+
 CLAWD_ROOT = Path.home() / "clawd"
 
 
@@ -120,6 +124,14 @@ def hash_content(content: str) -> str:
     return hashlib.md5(normalize_content(content).encode()).hexdigest()
 
 
+def file_signature(path: Path) -> Optional[list]:
+    """Same as file_signature() in drive-sync-unified.py."""
+    st = path.stat()
+    if time.time_ns() - st.st_mtime_ns < STAT_SETTLE_NS:
+        return None
+    return [st.st_size, st.st_mtime_ns, st.st_ino]
+
+
 class VoiceProfileSync:
     def __init__(self, dry_run: bool = False):
         self.dry_run = dry_run
@@ -128,6 +140,17 @@ class VoiceProfileSync:
         self.state = load_state()
         self.folder_cache = {}
         
+    def _stat_unchanged(self, local_file: Path, local_rel: str) -> bool:
+        """True if the file's stat matches the last sync, so it needn't be read."""
+        sig = file_signature(local_file)
+        if sig is None or local_rel not in self.state["files"]:
+            return False
+        return self.state.setdefault("stat", {}).get(local_rel) == sig
+    
+    def _remember_stat(self, local_file: Path, local_rel: str):
+        if not self.dry_run:
+            self.state.setdefault("stat", {})[local_rel] = file_signature(local_file)
+    
     def _get_folder_id(self, folder_name: str, parent_id: str = VOICE_PROFILE_FOLDER_ID) -> Optional[str]:
         cache_key = f"{parent_id}/{folder_name}"
         if cache_key in self.folder_cache:
@@ -218,6 +241,7 @@ class VoiceProfileSync:
                     local_path.parent.mkdir(parents=True, exist_ok=True)
                     local_path.write_text(normalize_content(content))
                     self.state["files"][local_rel] = content_hash
+                    self._remember_stat(local_path, local_rel)
                     log(f"  ✅ {drive_path} → {local_rel}")
                 
                 stats["downloaded"] += 1
@@ -258,6 +282,7 @@ class VoiceProfileSync:
                         local_dir.mkdir(parents=True, exist_ok=True)
                         local_file.write_text(normalize_content(content))
                         self.state["files"][local_rel] = content_hash
+                        self._remember_stat(local_file, local_rel)
                         log(f"  ✅ {drive_dir}/{doc_name} → {local_rel}")
                     
                     stats["downloaded"] += 1
@@ -286,11 +311,16 @@ class VoiceProfileSync:
                     stats["errors"] += 1
                     continue
                 
+                # Check if unchanged from last sync: stat first, content only if the stat moved
+                if self._stat_unchanged(local_path, local_rel):
+                    stats["skipped"] += 1
+                    continue
+                
                 content = local_path.read_text()
                 content_hash = hash_content(content)
                 
-                # Check if unchanged from last sync
                 if self.state["files"].get(local_rel) == content_hash:
+                    self._remember_stat(local_path, local_rel)
                     stats["skipped"] += 1
                     continue
                 
@@ -315,6 +345,7 @@ class VoiceProfileSync:
                 else:
                     self._upload_text_as_doc(doc_name, content, folder_id, existing_id)
                     self.state["files"][local_rel] = content_hash
+                    self._remember_stat(local_path, local_rel)
                     log(f"  ✅ {local_rel} → {drive_path}")
                 
                 stats["uploaded"] += 1
@@ -339,10 +370,15 @@ class VoiceProfileSync:
                 for local_file in local_dir.glob("*.md"):
                     doc_name = local_file.stem
                     local_rel = f"{local_dir_rel}/{local_file.name}"
+                    if self._stat_unchanged(local_file, local_rel):
+                        stats["skipped"] += 1
+                        continue
+                    
                     content = local_file.read_text()
                     content_hash = hash_content(content)
                     
                     if self.state["files"].get(local_rel) == content_hash:
+                        self._remember_stat(local_file, local_rel)
                         stats["skipped"] += 1
                         continue
                     
@@ -354,6 +390,7 @@ class VoiceProfileSync:
                     else:
                         self._upload_text_as_doc(doc_name, content, folder_id, existing_id)
                         self.state["files"][local_rel] = content_hash
+                        self._remember_stat(local_file, local_rel)
                         log(f"  ✅ {local_rel} → {drive_dir}/{doc_name}")
                     
                     stats["uploaded"] += 1
@@ -11,10 +11,21 @@ Usage:
 
 import sys
 import os
+import io
+import hashlib
 import json
+import multiprocessing
 import re
+import signal
+import socket
+import socketserver
+import sqlite3
 import tempfile
+import time
+import unicodedata
 import argparse
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
 from datetime import datetime
 from pathlib import Path
 
@@ -22,6 +33,11 @@ from pathlib import Path
 
 KG_ROOT = Path.home() / "clawd" / "memory" / "context" / "kg"
 LOG_FILE = Path.home() / "clawd" / "logs" / "kg.log"
+# Derived index — lives with the other memory caches so it is never synced or mirrored
+INDEX_FILE = Path.home() / "clawd" / "memory" / "cache" / "kg-index.sqlite"
+INDEX_VERSION = 5
+SOCKET_FILE = Path.home() / "clawd" / "run" / "kg.sock"
+WATCH_INTERVAL = 2.0  # seconds between daemon mtime polls of KG_ROOT
 
 ENTITY_TYPES = ["person", "project", "concept", "organization", "resource", "event", "place"]
 RELATION_TYPES = [
@@ -34,6 +50,13 @@ FACT_CATEGORIES = [
 ]
 
 MAX_FACT_LENGTH = 500
+# Trigram similarity (0-1) at which names are reported as possible duplicates
+FUZZY_THRESHOLD = 0.5
+# With KG_FACT_LOG=1, fact writes append to facts.jsonl instead of rewriting
+# facts.json; a log past this size is folded back into the snapshot.
+FACT_LOG_COMPACT_BYTES = 64 * 1024
+# summarize renders in a process pool once a batch is at least this big
+PARALLEL_SUMMARY_MIN = 50
 
 # --- Utilities ---
 
@@ -66,20 +89,43 @@ def slugify(name: str) -> str:
     return s
 
 
+def alias_key(name: str) -> str:
+    """Normalize a name or alias for lookup: NFKC, casefolded, single-spaced."""
+    return " ".join(unicodedata.normalize("NFKC", name).casefold().split())
+
+
+def name_trigrams(key: str) -> set:
+    """Trigrams of each word in an alias_key, padded like pg_trgm."""
+    grams = set()
+    for word in key.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
 def validate_slug(slug: str) -> bool:
     return bool(re.match(r"^[a-z0-9][a-z0-9-]*[a-z0-9]$", slug)) or bool(re.match(r"^[a-z0-9]$", slug))
 
 
-def validate_entity_id(entity_id: str) -> tuple:
-    """Parse and validate 'type/slug'. Returns (type, slug) or raises."""
+def entity_id_problem(entity_id: str) -> str:
+    """Describe what is wrong with an entity ID, or return None if it is valid."""
     parts = entity_id.split("/")
     if len(parts) != 2:
-        error_out(f"Invalid entity ID '{entity_id}': must be type/slug")
+        return f"Invalid entity ID '{entity_id}': must be type/slug"
     etype, slug = parts
     if etype not in ENTITY_TYPES:
-        error_out(f"Invalid entity type '{etype}': must be one of {ENTITY_TYPES}")
+        return f"Invalid entity type '{etype}': must be one of {ENTITY_TYPES}"
     if not validate_slug(slug):
-        error_out(f"Invalid slug '{slug}': must be [a-z0-9-] only")
+        return f"Invalid slug '{slug}': must be [a-z0-9-] only"
+    return None
+
+
+def validate_entity_id(entity_id: str) -> tuple:
+    """Parse and validate 'type/slug'. Returns (type, slug) or raises."""
+    problem = entity_id_problem(entity_id)
+    if problem:
+        error_out(problem)
+    etype, slug = entity_id.split("/")
     return etype, slug
 
 
@@ -125,38 +171,182 @@ def atomic_write_text(path: Path, text: str):
         raise
 
 
+# Enabled by `serve`: path -> (stat signature, file text). Entries validate
+# themselves against a fresh stat, so outside edits are never served stale.
+_file_cache = None
+# Enabled by `serve`: entity IDs this process wrote since the watcher last looked
+_written_entities = None
+
+
+def note_written(entity_id: str):
+    if _written_entities is not None:
+        _written_entities.add(entity_id)
+
+
+def read_text(path: Path) -> str:
+    """Read a file, reusing the daemon's cached text when unchanged."""
+    if _file_cache is None:
+        return path.read_text()
+    st = path.stat()
+    sig = (st.st_mtime_ns, st.st_size, st.st_ino)
+    hit = _file_cache.get(path)
+    if hit is None or hit[0] != sig:
+        hit = (sig, path.read_text())
+        _file_cache[path] = hit
+    return hit[1]
+
+
+def read_json(path: Path):
+    return json.loads(read_text(path))
+
+
 def load_entity(entity_id: str) -> dict:
     """Load entity.json for given entity ID."""
     d = entity_dir(entity_id)
     path = d / "entity.json"
     if not path.exists():
         error_out(f"Entity '{entity_id}' not found")
-    with open(path) as f:
-        return json.load(f)
+    return read_json(path)
 
 
 def load_facts(entity_id: str) -> list:
-    """Load facts.json for given entity ID."""
+    """Load facts.json for given entity ID, replaying any facts.jsonl log over it."""
     d = entity_dir(entity_id)
     path = d / "facts.json"
-    if not path.exists():
-        return []
-    with open(path) as f:
-        return json.load(f)
+    facts = read_json(path) if path.exists() else []
+    log_path = d / "facts.jsonl"
+    if log_path.exists():
+        lines = read_text(log_path).splitlines()
+        ops = []
+        for i, line in enumerate(lines):
+            try:
+                ops.append(json.loads(line))
+            except ValueError:
+                if i < len(lines) - 1:
+                    raise
+                # Torn final line from an interrupted append; the write never happened
+        apply_fact_ops(facts, ops)
+    return facts
+
+
+def apply_fact_ops(facts: list, ops: list):
+    """Apply fact log records ({"op": "add"|"supersede", ...}) to a fact list in place.
+
+    Replays are idempotent, so a log left behind by an interrupted compaction
+    doesn't duplicate facts already in the snapshot.
+    """
+    by_id = {f["id"]: f for f in facts}
+    for op in ops:
+        if op["op"] == "add":
+            fact = op["fact"]
+            if fact["id"] not in by_id:
+                facts.append(fact)
+                by_id[fact["id"]] = fact
+        elif op["op"] == "supersede":
+            fact = by_id.get(op["id"])
+            if fact is not None and fact.get("status") != "superseded":
+                fact["status"] = "superseded"
+                fact["superseded_at"] = op["at"]
 
 
 def save_facts(entity_id: str, facts: list):
-    """Save facts.json for given entity ID."""
+    """Save facts.json for given entity ID, folding away any fact log."""
     d = entity_dir(entity_id)
+    conn = index_conn()
+    if conn is not None:
+        mark_dirty(conn, [entity_id], "facts")
+        index_put_facts(conn, entity_id, facts)
+    note_written(entity_id)
     atomic_write_json(d / "facts.json", facts)
+    # The snapshot now holds everything the log did
+    log_path = d / "facts.jsonl"
+    if log_path.exists():
+        log_path.unlink()
+
+
+# Set by the daemon for the length of a request whose client had KG_FACT_LOG on
+_request_fact_log = False
+
+
+def fact_log_enabled() -> bool:
+    return _request_fact_log or os.environ.get("KG_FACT_LOG", "") not in ("", "0")
+
+
+def record_facts(entity_id: str, new_facts: list, superseded: list = ()):
+    """Add facts and mark (fact_id, timestamp) pairs superseded for one entity.
+
+    With KG_FACT_LOG set this appends to facts.jsonl, so the cost doesn't grow
+    with the entity's fact count; otherwise facts.json is rewritten.
+    """
+    ops = [{"op": "supersede", "id": fid, "at": at} for fid, at in superseded]
+    ops += [{"op": "add", "fact": f} for f in new_facts]
+    if not fact_log_enabled():
+        facts = load_facts(entity_id)
+        apply_fact_ops(facts, ops)
+        save_facts(entity_id, facts)
+        return
+
+    d = entity_dir(entity_id)
+    conn = index_conn()
+    if conn is not None:
+        mark_dirty(conn, [entity_id], "facts")
+        index_append_facts(conn, entity_id, new_facts, superseded)
+    note_written(entity_id)
+    log_path = d / "facts.jsonl"
+    with open(log_path, "ab") as f:
+        if f.tell():
+            # Drop a torn final line left by an interrupted append before adding to it
+            with open(log_path, "rb") as r:
+                data = r.read()
+            if not data.endswith(b"\n"):
+                f.truncate(data.rfind(b"\n") + 1)
+        f.write("".join(json.dumps(op) + "\n" for op in ops).encode())
+    if log_path.stat().st_size > FACT_LOG_COMPACT_BYTES:
+        compact_facts(entity_id)
+
+
+def compact_facts(entity_id: str) -> bool:
+    """Fold facts.jsonl into facts.json. Returns False if there was no log."""
+    if not (entity_dir(entity_id) / "facts.jsonl").exists():
+        return False
+    save_facts(entity_id, load_facts(entity_id))
+    return True
 
 
 def save_entity(entity_id: str, entity: dict):
     """Save entity.json for given entity ID."""
     d = entity_dir(entity_id)
+    conn = index_conn()
+    if conn is not None:
+        note_entity_change(conn, entity)
+        index_put_entity(conn, entity)
+    note_written(entity_id)
     atomic_write_json(d / "entity.json", entity)
 
 
+def save_summary(entity_id: str, text: str):
+    """Save summary.md for given entity ID."""
+    d = entity_dir(entity_id)
+    conn = index_conn()
+    if conn is not None:
+        index_put_summary(conn, entity_id, text)
+        conn.execute("DELETE FROM dirty WHERE entity_id = ?", (entity_id,))
+    note_written(entity_id)
+    atomic_write_text(d / "summary.md", text)
+
+
+def summary_is_stale(entity_id: str, entity: dict) -> bool:
+    """mtime heuristic: no summary.md, or entity updated after it was written."""
+    summary_path = entity_dir(entity_id) / "summary.md"
+    if not summary_path.exists():
+        return True
+    updated_str = entity.get("updated", "")
+    if updated_str:
+        entity_mtime = datetime.fromisoformat(updated_str).timestamp()
+        return entity_mtime > summary_path.stat().st_mtime
+    return False
+
+
 def list_all_entity_ids() -> list:
     """Iterate KG_ROOT to find all entity IDs."""
     ids = []
@@ -177,25 +367,83 @@ def list_all_entity_ids() -> list:
 
 
 def find_by_alias(name: str, exclude_id: str = None) -> list:
-    """Scan all entities for name/alias collisions. Returns list of matching entity IDs."""
+    """Find name/alias/slug collisions. Returns list of matching entity IDs."""
     matches = []
-    name_lower = name.lower().strip()
+    key = alias_key(name)
     slug = slugify(name)
+    conn = index_conn()
+    if conn is not None:
+        rows = conn.execute(
+            "SELECT DISTINCT entity_id FROM alias_keys "
+            "WHERE (key = ? AND source != 'slug') OR (key = ? AND source = 'slug') ORDER BY 1",
+            (key, slug),
+        )
+        return [r[0] for r in rows if r[0] != exclude_id]
     for eid in list_all_entity_ids():
         if eid == exclude_id:
             continue
         entity = load_entity(eid)
-        if entity["name"].lower().strip() == name_lower:
+        if alias_key(entity["name"]) == key:
             matches.append(eid)
         elif slug == eid.split("/")[1]:
             matches.append(eid)
-        elif name_lower in [a.lower() for a in entity.get("aliases", [])]:
+        elif key in [alias_key(a) for a in entity.get("aliases", [])]:
             matches.append(eid)
     return matches
 
 
-def next_fact_id(facts: list, slug: str) -> str:
-    """Generate next fact ID based on max existing."""
+def fuzzy_candidates(name: str, exclude: set = (), limit: int = 5) -> list:
+    """Entities whose name or an alias is trigram-similar to name.
+
+    Returns [{"entity_id", "matched", "score"}], best first, one per entity.
+    With the index, only keys sharing enough trigrams with name are read.
+    """
+    grams = name_trigrams(alias_key(name))
+    if not grams:
+        return []
+    conn = index_conn()
+    if conn is not None:
+        # Jaccard >= t implies sharing at least t * |grams| trigrams
+        marks = ",".join("?" * len(grams))
+        rows = conn.execute(
+            f"SELECT entity_id, key, COUNT(*) FROM alias_trigrams WHERE gram IN ({marks}) "
+            f"GROUP BY entity_id, key HAVING COUNT(*) >= ?",
+            (*grams, FUZZY_THRESHOLD * len(grams)),
+        )
+        pairs = [(eid, key, shared) for eid, key, shared in rows]
+    else:
+        pairs = []
+        for entity in all_entities():
+            for key in {alias_key(n) for n in [entity["name"]] + entity.get("aliases", [])}:
+                pairs.append((entity["id"], key, len(grams & name_trigrams(key))))
+
+    best = {}
+    for eid, key, shared in pairs:
+        if eid in exclude:
+            continue
+        score = shared / (len(grams) + len(name_trigrams(key)) - shared)
+        if score >= FUZZY_THRESHOLD and score > best.get(eid, (0,))[0]:
+            best[eid] = (score, key)
+    ranked = sorted(best.items(), key=lambda item: (-item[1][0], item[0]))[:limit]
+    return [{"entity_id": eid, "matched": key, "score": round(score, 2)} for eid, (score, key) in ranked]
+
+
+def get_fact(entity_id: str, fact_id: str) -> dict:
+    """One fact by ID, or None."""
+    conn = index_conn()
+    if conn is not None:
+        row = conn.execute(
+            "SELECT data FROM facts WHERE entity_id = ? AND id = ?", (entity_id, fact_id)
+        ).fetchone()
+        return json.loads(row[0]) if row else None
+    for f in load_facts(entity_id):
+        if f["id"] == fact_id:
+            return f
+    return None
+
+
+def max_fact_number(facts: list) -> int:
+    """Highest numeric suffix among fact IDs (0 if none)."""
     max_num = 0
     for f in facts:
         fid = f.get("id", "")
@@ -205,13 +453,710 @@ def next_fact_id(facts: list, slug: str) -> str:
                 max_num = max(max_num, int(parts[1]))
             except ValueError:
                 pass
-    return f"{slug}-{max_num + 1:03d}"
+    return max_num
+
+
+def next_fact_id(entity: dict, facts: list = None) -> str:
+    """Allocate the entity's next fact ID from its stored fact_seq counter.
+
+    The counter lives in entity.json, so callers must save the entity. Entities
+    written before the counter existed get it seeded from a scan of facts
+    (loaded if not given).
+    """
+    seq = entity.get("fact_seq")
+    if seq is None:
+        seq = max_fact_number(load_facts(entity["id"]) if facts is None else facts)
+    entity["fact_seq"] = seq + 1
+    return f"{entity['id'].split('/')[1]}-{seq + 1:03d}"
 
 
 def now_iso() -> str:
     return datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
 
 
+# --- Index ---
+#
+# Optional SQLite index over the JSON files. The JSON files stay the source of
+# truth; the index only exists so read commands don't open every entity.
+# It is used when INDEX_FILE exists and matches INDEX_VERSION, otherwise every
+# read falls back to walking KG_ROOT. `kg.py reindex` (re)builds it.
+
+INDEX_SCHEMA = """
+CREATE TABLE entities (
+    id TEXT PRIMARY KEY,
+    type TEXT NOT NULL,
+    slug TEXT NOT NULL,
+    status TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+
+-- Duplicate detection and name resolution: alias_key() of each name and alias,
+-- plus the slug, so a collision check is one indexed lookup
+CREATE TABLE alias_keys (
+    key TEXT NOT NULL,
+    entity_id TEXT NOT NULL,
+    source TEXT NOT NULL  -- name, alias or slug
+);
+CREATE INDEX alias_keys_key ON alias_keys(key);
+CREATE INDEX alias_keys_entity ON alias_keys(entity_id);
+
+-- Word trigrams of each name/alias key, for near-duplicate candidates
+CREATE TABLE alias_trigrams (
+    gram TEXT NOT NULL,
+    key TEXT NOT NULL,
+    entity_id TEXT NOT NULL
+);
+CREATE INDEX alias_trigrams_gram ON alias_trigrams(gram);
+CREATE INDEX alias_trigrams_entity ON alias_trigrams(entity_id);
+
+CREATE TABLE domains (
+    entity_id TEXT NOT NULL,
+    domain_lower TEXT NOT NULL
+);
+CREATE INDEX domains_domain ON domains(domain_lower);
+CREATE INDEX domains_entity ON domains(entity_id);
+
+CREATE TABLE facts (
+    entity_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    status TEXT,
+    data TEXT NOT NULL,
+    PRIMARY KEY (entity_id, id)
+);
+
+CREATE TABLE relations (
+    entity_id TEXT NOT NULL,
+    fact_id TEXT NOT NULL,
+    type TEXT NOT NULL,
+    target TEXT NOT NULL,
+    status TEXT
+);
+CREATE INDEX relations_entity ON relations(entity_id);
+-- Reverse adjacency: inbound edges for an entity in O(degree)
+CREATE INDEX relations_target ON relations(target, status);
+
+-- Entities whose summary.md needs regenerating, written by every mutating command
+CREATE TABLE dirty (
+    entity_id TEXT PRIMARY KEY,
+    reason TEXT NOT NULL,
+    since TEXT NOT NULL
+);
+
+-- Full-text search: one row per entity, one column per searchable field.
+-- search_rows maps FTS rowids to entity IDs.
+CREATE TABLE search_rows (
+    rowid INTEGER PRIMARY KEY,
+    entity_id TEXT NOT NULL UNIQUE
+);
+CREATE VIRTUAL TABLE search_fts USING fts5(
+    name, alias, domain, fact, summary,
+    tokenize = 'unicode61 remove_diacritics 2',
+    prefix = '2 3'
+);
+"""
+
+# BM25 column weights, in search_fts column order
+SEARCH_FIELD_WEIGHTS = {"name": 10.0, "alias": 8.0, "domain": 4.0, "fact": 2.0, "summary": 1.0}
+SEARCH_FIELDS = list(SEARCH_FIELD_WEIGHTS)
+SEARCH_TERM_RE = re.compile(r'"([^"]*)"(\*?)|(\S+)')
+
+_index = None
+
+
+def index_conn():
+    """Return the open index connection, or None if there is no usable index."""
+    global _index
+    if _index is not None:
+        return _index
+    if not INDEX_FILE.exists():
+        return None
+    conn = sqlite3.connect(INDEX_FILE, isolation_level=None)
+    if conn.execute("PRAGMA user_version").fetchone()[0] != INDEX_VERSION:
+        conn.close()
+        log(f"index: version mismatch in {INDEX_FILE}, ignoring (run reindex)")
+        return None
+    _index = conn
+    return _index
+
+
+@contextmanager
+def kg_transaction():
+    """Wrap a command's writes in one index transaction.
+
+    save_entity/save_facts stage their index rows before the JSON write, so
+    if any JSON write fails the index rolls back with it. BEGIN IMMEDIATE
+    also serializes concurrent writers.
+    """
+    conn = index_conn()
+    if conn is None or conn.in_transaction:
+        yield
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield
+    except BaseException as e:
+        conn.execute("ROLLBACK")
+        if not isinstance(e, SystemExit):
+            log(f"index: rolled back after error ({e}); run reindex if JSON was partially written")
+        raise
+    conn.execute("COMMIT")
+
+
+def index_put_entity(conn, entity: dict):
+    """Replace the index rows for one entity's metadata."""
+    eid = entity["id"]
+    slug = eid.split("/")[1]
+    for table, col in (("entities", "id"), ("alias_keys", "entity_id"), ("alias_trigrams", "entity_id"),
+                       ("domains", "entity_id")):
+        conn.execute(f"DELETE FROM {table} WHERE {col} = ?", (eid,))
+    conn.execute(
+        "INSERT INTO entities (id, type, slug, status, data) VALUES (?, ?, ?, ?, ?)",
+        (eid, entity["type"], slug, entity.get("status", "active"), json.dumps(entity)),
+    )
+    keys = {alias_key(entity["name"]): "name"}
+    for a in entity.get("aliases", []):
+        keys.setdefault(alias_key(a), "alias")
+    conn.executemany(
+        "INSERT INTO alias_keys (key, entity_id, source) VALUES (?, ?, ?)",
+        [(key, eid, source) for key, source in keys.items()] + [(slug, eid, "slug")],
+    )
+    conn.executemany(
+        "INSERT INTO alias_trigrams (gram, key, entity_id) VALUES (?, ?, ?)",
+        [(gram, key, eid) for key in keys for gram in name_trigrams(key)],
+    )
+    conn.executemany(
+        "INSERT INTO domains (entity_id, domain_lower) VALUES (?, ?)",
+        [(eid, d.lower()) for d in entity.get("domains", [])],
+    )
+    index_put_search(conn, eid, name=entity["name"], alias="\n".join(entity.get("aliases", [])),
+                     domain="\n".join(entity.get("domains", [])))
+
+
+def index_put_facts(conn, entity_id: str, facts: list):
+    """Replace the index rows for one entity's facts and relations."""
+    conn.execute("DELETE FROM facts WHERE entity_id = ?", (entity_id,))
+    conn.execute("DELETE FROM relations WHERE entity_id = ?", (entity_id,))
+    conn.executemany(
+        "INSERT OR REPLACE INTO facts (entity_id, id, status, data) VALUES (?, ?, ?, ?)",
+        [(entity_id, f["id"], f.get("status"), json.dumps(f)) for f in facts],
+    )
+    conn.executemany(
+        "INSERT INTO relations (entity_id, fact_id, type, target, status) VALUES (?, ?, ?, ?, ?)",
+        [(entity_id, f["id"], f["relation"]["type"], f["relation"]["target"], f.get("status"))
+         for f in facts if "relation" in f],
+    )
+    active_text = "\n".join(f["text"] for f in facts if f.get("status") == "active")
+    index_put_search(conn, entity_id, fact=active_text)
+
+
+def index_append_facts(conn, entity_id: str, new_facts: list, superseded: list):
+    """Index rows for a fact log append, without rewriting the entity's other rows."""
+    for fid, at in superseded:
+        row = conn.execute(
+            "SELECT data FROM facts WHERE entity_id = ? AND id = ?", (entity_id, fid)
+        ).fetchone()
+        if row is None:
+            continue
+        fact = json.loads(row[0])
+        fact["status"] = "superseded"
+        fact["superseded_at"] = at
+        conn.execute(
+            "UPDATE facts SET status = 'superseded', data = ? WHERE entity_id = ? AND id = ?",
+            (json.dumps(fact), entity_id, fid),
+        )
+        conn.execute(
+            "UPDATE relations SET status = 'superseded' WHERE entity_id = ? AND fact_id = ?", (entity_id, fid)
+        )
+    conn.executemany(
+        "INSERT OR REPLACE INTO facts (entity_id, id, status, data) VALUES (?, ?, ?, ?)",
+        [(entity_id, f["id"], f.get("status"), json.dumps(f)) for f in new_facts],
+    )
+    conn.executemany(
+        "INSERT INTO relations (entity_id, fact_id, type, target, status) VALUES (?, ?, ?, ?, ?)",
+        [(entity_id, f["id"], f["relation"]["type"], f["relation"]["target"], f.get("status"))
+         for f in new_facts if "relation" in f],
+    )
+    rows = conn.execute(
+        "SELECT data FROM facts WHERE entity_id = ? AND status = 'active' ORDER BY rowid", (entity_id,)
+    )
+    index_put_search(conn, entity_id, fact="\n".join(json.loads(r[0])["text"] for r in rows))
+
+
+def index_put_summary(conn, entity_id: str, text: str):
+    index_put_search(conn, entity_id, summary=text)
+
+
+def index_put_search(conn, entity_id: str, **fields):
+    """Set some of an entity's full-text columns, creating its row if needed."""
+    row = conn.execute("SELECT rowid FROM search_rows WHERE entity_id = ?", (entity_id,)).fetchone()
+    if row is None:
+        rowid = conn.execute("INSERT INTO search_rows (entity_id) VALUES (?)", (entity_id,)).lastrowid
+        values = [fields.get(f, "") for f in SEARCH_FIELDS]
+        conn.execute(
+            f"INSERT INTO search_fts (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?)",
+            (rowid, *values),
+        )
+        return
+    assignments = ", ".join(f"{f} = ?" for f in fields)
+    conn.execute(f"UPDATE search_fts SET {assignments} WHERE rowid = ?", (*fields.values(), row[0]))
+
+
+def index_delete_entity(conn, entity_id: str):
+    conn.execute(
+        "DELETE FROM search_fts WHERE rowid IN (SELECT rowid FROM search_rows WHERE entity_id = ?)",
+        (entity_id,),
+    )
+    conn.execute("DELETE FROM search_rows WHERE entity_id = ?", (entity_id,))
+    for table, col in (("entities", "id"), ("alias_keys", "entity_id"), ("alias_trigrams", "entity_id"),
+                       ("domains", "entity_id"), ("facts", "entity_id"), ("relations", "entity_id")):
+        conn.execute(f"DELETE FROM {table} WHERE {col} = ?", (entity_id,))
+
+
+def mark_dirty(conn, entity_ids: list, reason: str):
+    """Add entities to the dirty set, keeping the earliest reason for each."""
+    now = now_iso()
+    conn.executemany(
+        "INSERT OR IGNORE INTO dirty (entity_id, reason, since) VALUES (?, ?, ?)",
+        [(eid, reason, now) for eid in entity_ids],
+    )
+
+
+def note_entity_change(conn, entity: dict):
+    """Mark an entity about to be re-indexed dirty, plus dependents if its name changed.
+
+    Summaries render relation targets by name, so a rename also stales every
+    summary with a relation pointing at this entity.
+    """
+    eid = entity["id"]
+    mark_dirty(conn, [eid], "entity")
+    row = conn.execute("SELECT data FROM entities WHERE id = ?", (eid,)).fetchone()
+    if row is not None and json.loads(row[0])["name"] != entity["name"]:
+        mark_dirty(conn, [s for s in referencing_entities(eid) if s != eid], f"target:{eid}")
+
+
+def note_entity_removed(conn, entity_id: str):
+    """Drop a deleted entity from the dirty set and stale everything that pointed at it."""
+    conn.execute("DELETE FROM dirty WHERE entity_id = ?", (entity_id,))
+    mark_dirty(conn, [s for s in referencing_entities(entity_id) if s != entity_id], f"target:{entity_id}")
+
+
+def index_entity_from_files(conn, entity_id: str) -> int:
+    """Re-read one entity's JSON files into the index. Returns its fact count."""
+    facts = load_facts(entity_id)
+    index_put_entity(conn, load_entity(entity_id))
+    index_put_facts(conn, entity_id, facts)
+    summary_path = entity_dir(entity_id) / "summary.md"
+    if summary_path.exists():
+        index_put_summary(conn, entity_id, summary_path.read_text())
+    return len(facts)
+
+
+def build_index(path: Path) -> dict:
+    """Build a fresh index from the JSON files at path. Returns row counts."""
+    conn = sqlite3.connect(path, isolation_level=None)
+    counts = {"entities": 0, "facts": 0}
+    try:
+        conn.executescript(INDEX_SCHEMA)
+        conn.execute("BEGIN")
+        for eid in list_all_entity_ids():
+            counts["facts"] += index_entity_from_files(conn, eid)
+            counts["entities"] += 1
+            # A fresh index has no change history, so seed the dirty set from mtimes
+            if summary_is_stale(eid, load_entity(eid)):
+                mark_dirty(conn, [eid], "reindex")
+        conn.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        conn.execute("COMMIT")
+    finally:
+        conn.close()
+    return counts
+
+
+def all_entities() -> list:
+    """Every entity dict, ordered by ID."""
+    conn = index_conn()
+    if conn is not None:
+        return [json.loads(r[0]) for r in conn.execute("SELECT data FROM entities ORDER BY id")]
+    return [load_entity(eid) for eid in list_all_entity_ids()]
+
+
+def fact_counts() -> dict:
+    """Map entity ID -> (total facts, active facts)."""
+    conn = index_conn()
+    if conn is not None:
+        rows = conn.execute(
+            "SELECT entity_id, COUNT(*), SUM(status = 'active') FROM facts GROUP BY entity_id"
+        )
+        return {eid: (total, active or 0) for eid, total, active in rows}
+    counts = {}
+    for eid in list_all_entity_ids():
+        facts = load_facts(eid)
+        counts[eid] = (len(facts), len([f for f in facts if f.get("status") == "active"]))
+    return counts
+
+
+def search_tokens(text: str) -> list:
+    """Tokenize like the FTS5 unicode61 tokenizer: casefolded, diacritics stripped."""
+    text = text.lower()
+    if not text.isascii():
+        text = unicodedata.normalize("NFKD", text)
+        text = "".join(c for c in text if not unicodedata.combining(c))
+    return re.findall(r"[^\W_]+", text)
+
+
+def parse_search_query(query: str) -> list:
+    """Split a search string into (tokens, is_prefix) terms.
+
+    Bare words match whole tokens, "quoted text" matches a phrase, and a
+    trailing * (on a word or after a closing quote) makes it a prefix match.
+    """
+    terms = []
+    for phrase, phrase_star, word in SEARCH_TERM_RE.findall(query):
+        if word:
+            prefix = word.endswith("*")
+            text = word.rstrip("*")
+        else:
+            prefix = bool(phrase_star)
+            text = phrase
+        tokens = search_tokens(text)
+        if tokens:
+            terms.append((tokens, prefix))
+    return terms
+
+
+def term_matches(term: tuple, tokens: list) -> bool:
+    """True if a parsed search term occurs in a token list."""
+    words, prefix = term
+    n = len(words)
+    for i in range(len(tokens) - n + 1):
+        if tokens[i:i + n - 1] != words[:-1]:
+            continue
+        last = tokens[i + n - 1]
+        if last == words[-1] or (prefix and last.startswith(words[-1])):
+            return True
+    return False
+
+
+def search_match(terms: list, entity: dict, facts: list, summary) -> tuple:
+    """Which fields of an entity the search terms hit, given its active facts.
+
+    Returns (match reasons in SEARCH_FIELDS order, matching facts).
+    """
+    fields = {
+        "name": [entity["name"]],
+        "alias": entity.get("aliases", []),
+        "domain": entity.get("domains", []),
+        "summary": [summary] if summary else [],
+    }
+    matching_facts = [
+        f for f in facts if any(term_matches(t, search_tokens(f["text"])) for t in terms)
+    ]
+    match_reasons = []
+    for field in SEARCH_FIELDS:
+        if field == "fact":
+            if matching_facts:
+                match_reasons.append(field)
+            continue
+        tokens = [search_tokens(v) for v in fields[field]]
+        if any(term_matches(t, toks) for t in terms for toks in tokens):
+            match_reasons.append(field)
+    return match_reasons, matching_facts
+
+
+def search_index(conn, query: str, include_archived: bool, limit: int, offset: int) -> tuple:
+    """BM25-ranked search over the FTS index. Returns (page of results, total matches).
+
+    Every term must match somewhere in the entity (name, alias, domain,
+    active fact or summary), not necessarily in the same field.
+    """
+    terms = parse_search_query(query)
+    if not terms:
+        error_out(f"Search query '{query}' has no searchable terms")
+    match = " ".join('"' + " ".join(words) + '"' + ("*" if prefix else "") for words, prefix in terms)
+
+    # Rank inside FTS5 and only join entity data for the requested page
+    archived_filter = "" if include_archived else """AND search_fts.rowid NOT IN (
+        SELECT r.rowid FROM search_rows r JOIN entities e ON e.id = r.entity_id
+        WHERE e.status = 'archived')"""
+    where = f"WHERE search_fts MATCH ? {archived_filter}"
+    total = conn.execute(f"SELECT COUNT(*) FROM search_fts {where}", (match,)).fetchone()[0]
+    weights = ", ".join(str(w) for w in SEARCH_FIELD_WEIGHTS.values())
+    page = conn.execute(
+        f"""SELECT rowid, bm25(search_fts, {weights}) AS score FROM search_fts {where}
+            ORDER BY score LIMIT ? OFFSET ?""",
+        (match, limit, offset),
+    ).fetchall()
+    if not page:
+        return [], total
+
+    rowids = [r[0] for r in page]
+    marks = ",".join("?" * len(rowids))
+    by_rowid = {}
+    for rowid, data, summary in conn.execute(
+        f"""SELECT r.rowid, e.data, s.summary FROM search_rows r
+            JOIN entities e ON e.id = r.entity_id
+            JOIN search_fts s ON s.rowid = r.rowid
+            WHERE r.rowid IN ({marks})""",
+        rowids,
+    ):
+        by_rowid[rowid] = (json.loads(data), summary)
+    active_facts = {}
+    for eid, data in conn.execute(
+        f"""SELECT entity_id, data FROM facts WHERE status = 'active' AND entity_id IN (
+                SELECT entity_id FROM search_rows WHERE rowid IN ({marks})
+            ) ORDER BY rowid""",
+        rowids,
+    ):
+        active_facts.setdefault(eid, []).append(json.loads(data))
+
+    results = []
+    for rowid, score in page:
+        entity, summary = by_rowid[rowid]
+        eid = entity["id"]
+        match_reasons, matching_facts = search_match(terms, entity, active_facts.get(eid, []), summary)
+        results.append({
+            "entity_id": eid,
+            "name": entity["name"],
+            "type": entity["type"],
+            # BM25 is negative with lower being better; flip so higher ranks first
+            "score": round(-score, 6),
+            "match_reasons": match_reasons,
+            "matching_facts": matching_facts[:5],
+        })
+    return results, total
+
+
+def inbound_relations(entity_id: str) -> list:
+    """Active relation facts on other entities that point at entity_id.
+
+    Returns (source entity ID, fact) pairs ordered by source ID, then fact order.
+    """
+    conn = index_conn()
+    if conn is not None:
+        rows = conn.execute(
+            """SELECT r.entity_id, f.data FROM relations r
+               JOIN facts f ON f.entity_id = r.entity_id AND f.id = r.fact_id
+               WHERE r.target = ? AND r.status = 'active' AND r.entity_id != ?
+               ORDER BY r.entity_id, f.rowid""",
+            (entity_id, entity_id),
+        )
+        return [(eid, json.loads(data)) for eid, data in rows]
+    inbound = []
+    for eid in list_all_entity_ids():
+        if eid == entity_id:
+            continue
+        for f in load_facts(eid):
+            if f.get("status") == "active" and "relation" in f:
+                if f["relation"]["target"] == entity_id:
+                    inbound.append((eid, f))
+    return inbound
+
+
+def referencing_entities(entity_id: str) -> list:
+    """IDs of entities with any relation fact (any status) targeting entity_id."""
+    conn = index_conn()
+    if conn is not None:
+        rows = conn.execute(
+            "SELECT DISTINCT entity_id FROM relations WHERE target = ? ORDER BY entity_id", (entity_id,)
+        )
+        return [r[0] for r in rows]
+    return [
+        eid for eid in list_all_entity_ids()
+        if any("relation" in f and f["relation"]["target"] == entity_id for f in load_facts(eid))
+    ]
+
+
+def iter_search_corpus():
+    """Yield (entity, facts, summary_text) for every entity, ordered by ID.
+
+    summary_text is None when the entity has no summary.md.
+    """
+    for eid in list_all_entity_ids():
+        summary_path = entity_dir(eid) / "summary.md"
+        summary_text = summary_path.read_text() if summary_path.exists() else None
+        yield load_entity(eid), load_facts(eid), summary_text
+
+
+# --- Graph Traversal ---
+
+DEFAULT_MAX_NODES = 10000
+
+
+def load_adjacency(relation_types: list = None) -> dict:
+    """Load every active relation once into an undirected adjacency map.
+
+    Returns {entity_id: [(neighbor, relation_type, edge)]} where edge is the
+    stored relation as (source, relation_type, target, fact_id), so callers
+    can walk either direction and still report which way the relation points.
+    """
+    conn = index_conn()
+    if conn is not None:
+        rows = conn.execute(
+            "SELECT entity_id, type, target, fact_id FROM relations WHERE status = 'active' ORDER BY rowid"
+        ).fetchall()
+    else:
+        rows = []
+        for eid in list_all_entity_ids():
+            for f in load_facts(eid):
+                if f.get("status") == "active" and "relation" in f:
+                    rows.append((eid, f["relation"]["type"], f["relation"]["target"], f["id"]))
+
+    adj = {}
+    for edge in rows:
+        source, rtype, target, _ = edge
+        if relation_types and rtype not in relation_types:
+            continue
+        adj.setdefault(source, []).append((target, rtype, edge))
+        adj.setdefault(target, []).append((source, rtype, edge))
+    return adj
+
+
+def edge_dict(edge: tuple) -> dict:
+    source, rtype, target, fact_id = edge
+    return {"source": source, "relation_type": rtype, "target": target, "fact_id": fact_id}
+
+
+def shortest_path(adj: dict, start: str, goal: str, max_nodes: int) -> tuple:
+    """Bidirectional BFS. Returns (nodes, edges, explored, truncated); nodes is None if no path."""
+    if start == goal:
+        return [start], [], 1, False
+    # node -> (previous node, edge) on each side; the start/goal map to None
+    parents = ({start: None}, {goal: None})
+    frontiers = ([start], [goal])
+    explored = 2
+
+    while frontiers[0] and frontiers[1]:
+        side = 0 if len(frontiers[0]) <= len(frontiers[1]) else 1
+        mine, other = parents[side], parents[1 - side]
+        next_frontier = []
+        for node in frontiers[side]:
+            for neighbor, _, edge in adj.get(node, ()):
+                if neighbor in mine:
+                    continue
+                mine[neighbor] = (node, edge)
+                if neighbor in other:
+                    return _join_paths(parents, neighbor) + (explored, False)
+                next_frontier.append(neighbor)
+                explored += 1
+                if explored >= max_nodes:
+                    return None, [], explored, True
+        frontiers = (next_frontier, frontiers[1]) if side == 0 else (frontiers[0], next_frontier)
+    return None, [], explored, False
+
+
+def _join_paths(parents: tuple, meet: str) -> tuple:
+    """Stitch the forward and backward BFS trees together at meet."""
+    nodes, edges = [meet], []
+    node = meet
+    while parents[0][node] is not None:
+        node, edge = parents[0][node]
+        nodes.insert(0, node)
+        edges.insert(0, edge)
+    node = meet
+    while parents[1][node] is not None:
+        node, edge = parents[1][node]
+        nodes.append(node)
+        edges.append(edge)
+    return nodes, edges
+
+
+def find_paths(adj: dict, start: str, goal: str, max_depth: int, limit: int, max_nodes: int) -> tuple:
+    """Breadth-first enumeration of simple paths, shortest first.
+
+    Returns (paths, explored, truncated) where each path is (nodes, edges).
+    """
+    paths = []
+    queue = [([start], [])]
+    explored = 0
+    truncated = False
+    while queue and len(paths) < limit:
+        next_queue = []
+        for nodes, edges in queue:
+            explored += 1
+            if explored >= max_nodes:
+                truncated = True
+                break
+            if len(edges) >= max_depth:
+                continue
+            for neighbor, _, edge in adj.get(nodes[-1], ()):
+                if neighbor in nodes:
+                    continue
+                if neighbor == goal:
+                    paths.append((nodes + [neighbor], edges + [edge]))
+                    if len(paths) >= limit:
+                        break
+                else:
+                    next_queue.append((nodes + [neighbor], edges + [edge]))
+            if len(paths) >= limit:
+                break
+        if truncated:
+            break
+        queue = next_queue
+    return paths, explored, truncated
+
+
+def neighborhood(adj: dict, start: str, depth: int, max_nodes: int) -> tuple:
+    """BFS out to depth hops. Returns (distances, edges, truncated)."""
+    distances = {start: 0}
+    frontier = [start]
+    truncated = False
+    for dist in range(1, depth + 1):
+        next_frontier = []
+        for node in frontier:
+            for neighbor, _, _ in adj.get(node, ()):
+                if neighbor in distances:
+                    continue
+                if len(distances) >= max_nodes:
+                    truncated = True
+                    break
+                distances[neighbor] = dist
+                next_frontier.append(neighbor)
+            if truncated:
+                break
+        frontier = next_frontier
+        if truncated or not frontier:
+            break
+
+    # Every relation between discovered nodes, once each
+    edges = {}
+    for node in distances:
+        for neighbor, _, edge in adj.get(node, ()):
+            if neighbor in distances:
+                edges[(edge[0], edge[3])] = edge
+    return distances, list(edges.values()), truncated
+
+
+def entity_names(entity_ids) -> dict:
+    """Map entity IDs to names, skipping IDs with no entity."""
+    ids = list(entity_ids)
+    conn = index_conn()
+    if conn is not None:
+        names = {}
+        for i in range(0, len(ids), 500):
+            chunk = ids[i:i + 500]
+            marks = ",".join("?" * len(chunk))
+            for eid, data in conn.execute(f"SELECT id, data FROM entities WHERE id IN ({marks})", chunk):
+                names[eid] = json.loads(data)["name"]
+        return names
+    names = {}
+    for eid in ids:
+        path = entity_dir(eid) / "entity.json"
+        if path.exists():
+            with open(path) as f:
+                names[eid] = json.load(f)["name"]
+    return names
+
+
+def parse_relation_types(value: str) -> list:
+    """Parse a comma-separated --relation-types value, validating each type."""
+    if not value:
+        return None
+    types = [t.strip() for t in value.split(",") if t.strip()]
+    for t in types:
+        if t not in RELATION_TYPES:
+            error_out(f"Invalid relation type '{t}': must be one of {RELATION_TYPES}")
+    return types
+
+
 # --- Commands ---
 
 
@@ -242,6 +1187,14 @@ def cmd_add_entity(args):
     domains = [x.strip() for x in args.domains.split(",")] if args.domains else []
     aliases = [x.strip() for x in args.aliases.split(",")] if args.aliases else []
 
+    # Near-misses ("Ben Cowen" vs "Benjamin Cowen") are reported, not refused
+    similar = {}
+    for n in [name] + aliases:
+        for c in fuzzy_candidates(n, exclude={entity_id}):
+            if c["score"] > similar.get(c["entity_id"], {}).get("score", 0):
+                similar[c["entity_id"]] = c
+    similar = sorted(similar.values(), key=lambda c: (-c["score"], c["entity_id"]))
+
     entity = {
         "id": entity_id,
         "type": etype,
@@ -255,12 +1208,17 @@ def cmd_add_entity(args):
     }
 
     d.mkdir(parents=True, exist_ok=True)
-    atomic_write_json(d / "entity.json", entity)
-    atomic_write_json(d / "facts.json", [])
-    atomic_write_text(d / "summary.md", f"# {name}\n\nNo facts recorded yet.\n")
+    with kg_transaction():
+        save_entity(entity_id, entity)
+        save_facts(entity_id, [])
+        save_summary(entity_id, f"# {name}\n\nNo facts recorded yet.\n")
 
     log(f"add-entity: {entity_id}")
-    output({"ok": True, "entity_id": entity_id, "entity": entity})
+    result = {"ok": True, "entity_id": entity_id, "entity": entity}
+    if similar:
+        names = entity_names(c["entity_id"] for c in similar)
+        result["possible_duplicates"] = [{"name": names.get(c["entity_id"]), **c} for c in similar]
+    output(result)
 
 
 def cmd_add_fact(args):
@@ -279,9 +1237,7 @@ def cmd_add_fact(args):
     if category not in FACT_CATEGORIES:
         error_out(f"Invalid category '{category}': must be one of {FACT_CATEGORIES}")
 
-    facts = load_facts(entity_id)
-    slug = entity_id.split("/")[1]
-    fact_id = next_fact_id(facts, slug)
+    fact_id = next_fact_id(entity)
 
     fact = {
         "id": fact_id,
@@ -292,12 +1248,11 @@ def cmd_add_fact(args):
         "source": args.source or "conversation",
     }
 
-    facts.append(fact)
-    save_facts(entity_id, facts)
-
     # Update entity timestamp
     entity["updated"] = now_iso()
-    save_entity(entity_id, entity)
+    with kg_transaction():
+        record_facts(entity_id, [fact])
+        save_entity(entity_id, entity)
 
     log(f"add-fact: {entity_id} {fact_id}")
     output({"ok": True, "entity_id": entity_id, "fact": fact})
@@ -312,13 +1267,7 @@ def cmd_supersede(args):
     if entity.get("status") == "archived":
         error_out(f"Entity '{entity_id}' is archived. Unarchive first.")
 
-    facts = load_facts(entity_id)
-    old_fact = None
-    for f in facts:
-        if f["id"] == old_fact_id:
-            old_fact = f
-            break
-
+    old_fact = get_fact(entity_id, old_fact_id)
     if not old_fact:
         error_out(f"Fact '{old_fact_id}' not found in '{entity_id}'")
     if old_fact.get("status") == "superseded":
@@ -328,13 +1277,8 @@ def cmd_supersede(args):
     if len(fact_text) > MAX_FACT_LENGTH:
         error_out(f"Fact too long ({len(fact_text)} chars, max {MAX_FACT_LENGTH})")
 
-    # Mark old fact as superseded
-    old_fact["status"] = "superseded"
-    old_fact["superseded_at"] = now_iso()
-
     # Create new fact inheriting category and relation
-    slug = entity_id.split("/")[1]
-    new_fact_id = next_fact_id(facts, slug)
+    new_fact_id = next_fact_id(entity)
     new_fact = {
         "id": new_fact_id,
         "text": fact_text,
@@ -347,11 +1291,11 @@ def cmd_supersede(args):
     if "relation" in old_fact:
         new_fact["relation"] = old_fact["relation"]
 
-    facts.append(new_fact)
-    save_facts(entity_id, facts)
-
     entity["updated"] = now_iso()
-    save_entity(entity_id, entity)
+    with kg_transaction():
+        # Marks the old fact superseded and appends the new one
+        record_facts(entity_id, [new_fact], superseded=[(old_fact_id, now_iso())])
+        save_entity(entity_id, entity)
 
     log(f"supersede: {entity_id} {old_fact_id} -> {new_fact_id}")
     output({"ok": True, "entity_id": entity_id, "old_fact_id": old_fact_id, "new_fact": new_fact})
@@ -382,9 +1326,7 @@ def cmd_add_relation(args):
     if len(fact_text) > MAX_FACT_LENGTH:
         error_out(f"Fact too long ({len(fact_text)} chars, max {MAX_FACT_LENGTH})")
 
-    facts = load_facts(entity_id)
-    slug = entity_id.split("/")[1]
-    fact_id = next_fact_id(facts, slug)
+    fact_id = next_fact_id(entity)
 
     fact = {
         "id": fact_id,
@@ -399,16 +1341,30 @@ def cmd_add_relation(args):
         },
     }
 
-    facts.append(fact)
-    save_facts(entity_id, facts)
-
     entity["updated"] = now_iso()
-    save_entity(entity_id, entity)
+    with kg_transaction():
+        record_facts(entity_id, [fact])
+        save_entity(entity_id, entity)
 
     log(f"add-relation: {entity_id} --{relation_type}--> {target_id}")
     output({"ok": True, "entity_id": entity_id, "fact": fact})
 
 
+def cmd_resolve(args):
+    """Resolve a name or alias to entity IDs, with near-duplicate candidates."""
+    name = args.name.strip()
+    matches = find_by_alias(name)
+    if entity_id_problem(name) is None and (KG_ROOT / name / "entity.json").exists() and name not in matches:
+        matches.insert(0, name)
+    candidates = fuzzy_candidates(name, exclude=set(matches), limit=args.limit)
+    names = entity_names(matches + [c["entity_id"] for c in candidates])
+    output({
+        "query": name,
+        "matches": [{"entity_id": eid, "name": names.get(eid)} for eid in matches],
+        "candidates": [{"name": names.get(c["entity_id"]), **c} for c in candidates],
+    })
+
+
 def cmd_query(args):
     """Return entity + active facts."""
     entity_id = args.entity_id
@@ -458,95 +1414,168 @@ def cmd_connections(args):
 
     if args.reverse:
         inbound = []
-        for eid in list_all_entity_ids():
-            if eid == entity_id:
-                continue
-            for f in load_facts(eid):
-                if f.get("status") == "active" and "relation" in f:
-                    if f["relation"]["target"] == entity_id:
-                        inbound.append({
-                            "fact_id": f["id"],
-                            "source_entity": eid,
-                            "relation_type": f["relation"]["type"],
-                            "text": f["text"],
-                        })
+        for eid, f in inbound_relations(entity_id):
+            inbound.append({
+                "fact_id": f["id"],
+                "source_entity": eid,
+                "relation_type": f["relation"]["type"],
+                "text": f["text"],
+            })
         result["inbound"] = inbound
 
     output(result)
 
 
-def cmd_search(args):
-    """Search all entities by text."""
-    query = args.query.lower().strip()
-    if not query:
-        error_out("Search query cannot be empty")
+def search_scan(query: str, include_archived: bool, limit: int, offset: int) -> tuple:
+    """Unranked search over the JSON files, used when there is no index.
 
+    Terms match whole tokens, phrases and prefixes exactly as in search_index,
+    so only the order of results differs. Returns (page of results, total matches).
+    """
+    terms = parse_search_query(query)
+    if not terms:
+        error_out(f"Search query '{query}' has no searchable terms")
     results = []
-    for eid in list_all_entity_ids():
-        entity = load_entity(eid)
-        if entity.get("status") == "archived" and not args.include_archived:
+    for entity, facts, summary_text in iter_search_corpus():
+        if entity.get("status") == "archived" and not include_archived:
             continue
 
-        matched = False
-        match_reasons = []
+        # Like the index, every term must match somewhere in the entity
+        active = [f for f in facts if f.get("status") == "active"]
+        texts = [entity["name"], *entity.get("aliases", []), *entity.get("domains", []),
+                 *(f["text"] for f in active), summary_text or ""]
+        token_lists = [search_tokens(t) for t in texts]
+        if not all(any(term_matches(t, toks) for toks in token_lists) for t in terms):
+            continue
 
-        # Match name
-        if query in entity["name"].lower():
-            matched = True
-            match_reasons.append("name")
+        match_reasons, matching_facts = search_match(terms, entity, active, summary_text)
+        results.append({
+            "entity_id": entity["id"],
+            "name": entity["name"],
+            "type": entity["type"],
+            "match_reasons": match_reasons,
+            "matching_facts": matching_facts[:5],
+        })
 
-        # Match aliases
-        for alias in entity.get("aliases", []):
-            if query in alias.lower():
-                matched = True
-                match_reasons.append("alias")
-                break
+    return results[offset:offset + limit], len(results)
 
-        # Match domains
-        for domain in entity.get("domains", []):
-            if query in domain.lower():
-                matched = True
-                match_reasons.append("domain")
-                break
 
-        # Match facts
-        matching_facts = []
-        for f in load_facts(eid):
-            if f.get("status") != "active":
-                continue
-            if query in f["text"].lower():
-                matching_facts.append(f)
-                if not matched:
-                    matched = True
-                    match_reasons.append("fact")
+def cmd_shortest_path(args):
+    """Shortest relation path between two entities (either direction)."""
+    _ = load_entity(args.source_id)
+    _ = load_entity(args.target_id)
+    adj = load_adjacency(parse_relation_types(args.relation_types))
 
-        # Match summary
-        summary_path = entity_dir(eid) / "summary.md"
-        if summary_path.exists():
-            summary_text = summary_path.read_text()
-            if query in summary_text.lower():
-                if not matched:
-                    matched = True
-                    match_reasons.append("summary")
-
-        if matched:
-            results.append({
-                "entity_id": eid,
-                "name": entity["name"],
-                "type": entity["type"],
-                "match_reasons": match_reasons,
-                "matching_facts": matching_facts[:5],
-            })
+    nodes, edges, explored, truncated = shortest_path(adj, args.source_id, args.target_id, args.max_nodes)
+    result = {
+        "source": args.source_id,
+        "target": args.target_id,
+        "found": nodes is not None,
+        "explored": explored,
+        "truncated": truncated,
+    }
+    if nodes is not None:
+        result["length"] = len(edges)
+        result["path"] = nodes
+        result["edges"] = [edge_dict(e) for e in edges]
+        result["names"] = entity_names(nodes)
+    output(result)
+
+
+def cmd_path(args):
+    """Enumerate relation paths between two entities, shortest first."""
+    _ = load_entity(args.source_id)
+    _ = load_entity(args.target_id)
+    if args.source_id == args.target_id:
+        error_out("Source and target are the same entity")
+    if args.max_depth < 1 or args.limit < 1:
+        error_out("--max-depth and --limit must be at least 1")
+    adj = load_adjacency(parse_relation_types(args.relation_types))
+
+    paths, explored, truncated = find_paths(
+        adj, args.source_id, args.target_id, args.max_depth, args.limit, args.max_nodes
+    )
+    seen = {n for nodes, _ in paths for n in nodes}
+    output({
+        "source": args.source_id,
+        "target": args.target_id,
+        "paths": [
+            {"length": len(edges), "path": nodes, "edges": [edge_dict(e) for e in edges]}
+            for nodes, edges in paths
+        ],
+        "count": len(paths),
+        "names": entity_names(seen),
+        "explored": explored,
+        "truncated": truncated,
+    })
+
+
+def cmd_neighborhood(args):
+    """Entities within N relation hops of an entity."""
+    entity_id = args.entity_id
+    _ = load_entity(entity_id)
+    if args.depth < 1:
+        error_out("--depth must be at least 1")
+    adj = load_adjacency(parse_relation_types(args.relation_types))
+
+    distances, edges, truncated = neighborhood(adj, entity_id, args.depth, args.max_nodes)
+    names = entity_names(distances)
+    nodes = [
+        {"entity_id": eid, "name": names.get(eid), "distance": dist}
+        for eid, dist in sorted(distances.items(), key=lambda kv: (kv[1], kv[0]))
+    ]
+    output({
+        "entity_id": entity_id,
+        "depth": args.depth,
+        "nodes": nodes,
+        "edges": [edge_dict(e) for e in edges],
+        "count": len(nodes) - 1,
+        "truncated": truncated,
+    })
+
+
+def cmd_search(args):
+    """Search all entities by text."""
+    query = args.query.lower().strip()
+    if not query:
+        error_out("Search query cannot be empty")
+    if args.limit < 1 or args.offset < 0:
+        error_out("--limit must be at least 1 and --offset cannot be negative")
 
-    output({"query": query, "results": results, "count": len(results)})
+    conn = index_conn()
+    if conn is not None:
+        results, total = search_index(conn, query, args.include_archived, args.limit, args.offset)
+    else:
+        results, total = search_scan(query, args.include_archived, args.limit, args.offset)
+
+    output({
+        "query": query,
+        "results": results,
+        "count": len(results),
+        "total": total,
+        "offset": args.offset,
+        "truncated": args.offset + len(results) < total,
+        "ranked": conn is not None,
+    })
 
 
 def cmd_domain(args):
     """Filter entities by domain."""
     domain = args.domain.lower().strip()
+    conn = index_conn()
+    if conn is not None:
+        rows = conn.execute(
+            "SELECT DISTINCT e.id, e.data FROM entities e JOIN domains d ON d.entity_id = e.id "
+            "WHERE d.domain_lower = ? ORDER BY e.id",
+            (domain,),
+        )
+        candidates = [json.loads(data) for _, data in rows]
+    else:
+        candidates = all_entities()
+
     results = []
-    for eid in list_all_entity_ids():
-        entity = load_entity(eid)
+    for entity in candidates:
+        eid = entity["id"]
         if entity.get("status") == "archived" and not args.include_archived:
             continue
         entity_domains = [d.lower() for d in entity.get("domains", [])]
@@ -564,14 +1593,14 @@ def cmd_domain(args):
 def cmd_list(args):
     """List all entities."""
     results = []
-    for eid in list_all_entity_ids():
-        entity = load_entity(eid)
+    counts = fact_counts()
+    for entity in all_entities():
+        eid = entity["id"]
         if entity.get("status") == "archived" and not args.include_archived:
             continue
         if args.type and entity["type"] != args.type:
             continue
-        facts = load_facts(eid)
-        active_count = len([f for f in facts if f.get("status") == "active"])
+        active_count = counts.get(eid, (0, 0))[1]
         results.append({
             "entity_id": eid,
             "name": entity["name"],
@@ -592,9 +1621,9 @@ def cmd_stats(args):
     total_facts = 0
     active_facts = 0
     archived_entities = 0
+    counts = fact_counts()
 
-    for eid in list_all_entity_ids():
-        entity = load_entity(eid)
+    for entity in all_entities():
         etype = entity["type"]
         by_type[etype] = by_type.get(etype, 0) + 1
 
@@ -604,9 +1633,9 @@ def cmd_stats(args):
         for d in entity.get("domains", []):
             by_domain[d] = by_domain.get(d, 0) + 1
 
-        facts = load_facts(eid)
-        total_facts += len(facts)
-        active_facts += len([f for f in facts if f.get("status") == "active"])
+        total, active = counts.get(entity["id"], (0, 0))
+        total_facts += total
+        active_facts += active
 
     total_entities = sum(by_type.values())
 
@@ -668,9 +1697,13 @@ def generate_summary(entity_id: str) -> str:
     if relation_facts:
         lines.append("## Relationships")
         lines.append("")
+        names = entity_names({f["relation"]["target"] for f in relation_facts})
         for f in relation_facts:
             rel = f["relation"]
-            lines.append(f"- {rel['type'].replace('_', ' ')} → {rel['target']}")
+            target = rel["target"]
+            if target in names:
+                target = f"{names[target]} ({target})"
+            lines.append(f"- {rel['type'].replace('_', ' ')} → {target}")
         lines.append("")
 
     # Footer
@@ -681,39 +1714,92 @@ def generate_summary(entity_id: str) -> str:
     return "\n".join(lines)
 
 
+def _summary_worker_init():
+    """Pool initializer: drop state inherited over fork so workers open their own."""
+    global _index, _file_cache
+    _index = None
+    _file_cache = None
+
+
+def render_summaries(entity_ids: list, workers: int) -> list:
+    """Render summary text for each entity, in a process pool for large batches."""
+    if workers <= 1 or len(entity_ids) < PARALLEL_SUMMARY_MIN:
+        return [generate_summary(eid) for eid in entity_ids]
+    chunksize = max(1, len(entity_ids) // (workers * 4))
+    # A forked daemon worker would inherit the listening socket and the SQLite connection
+    context = multiprocessing.get_context("spawn") if _written_entities is not None else None
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                             initializer=_summary_worker_init) as pool:
+        return list(pool.map(generate_summary, entity_ids, chunksize=chunksize))
+
+
+def summary_unchanged(entity_id: str, text: str) -> bool:
+    """True if summary.md already holds exactly this text."""
+    path = entity_dir(entity_id) / "summary.md"
+    try:
+        existing = path.read_bytes()
+    except FileNotFoundError:
+        return False
+    return hashlib.sha256(existing).digest() == hashlib.sha256(text.encode()).digest()
+
+
+def write_summaries(entity_ids: list, workers: int = 0) -> tuple:
+    """Regenerate summaries, writing only those that changed.
+
+    Returns (number written, per-phase timings in ms).
+    """
+    workers = workers if workers else min(8, os.cpu_count() or 1)
+    timings = {}
+
+    start = time.perf_counter()
+    texts = render_summaries(entity_ids, workers)
+    timings["render"] = time.perf_counter() - start
+
+    # Leave identical summaries alone so their mtimes don't trigger memory_search reindexing
+    start = time.perf_counter()
+    changed = [(eid, text) for eid, text in zip(entity_ids, texts) if not summary_unchanged(eid, text)]
+    timings["compare"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    with kg_transaction():
+        for eid, text in changed:
+            save_summary(eid, text)
+            log(f"summarize: {eid}")
+        conn = index_conn()
+        if conn is not None:
+            conn.executemany("DELETE FROM dirty WHERE entity_id = ?", [(eid,) for eid in entity_ids])
+    timings["write"] = time.perf_counter() - start
+
+    return len(changed), {phase: round(t * 1000, 1) for phase, t in timings.items()}
+
+
 def cmd_summarize(args):
     """Regenerate summary.md for one or all entities."""
     if args.all:
         entity_ids = list_all_entity_ids()
     elif args.dirty:
-        entity_ids = []
-        for eid in list_all_entity_ids():
-            entity = load_entity(eid)
-            summary_path = entity_dir(eid) / "summary.md"
-            if not summary_path.exists():
-                entity_ids.append(eid)
-                continue
-            updated_str = entity.get("updated", "")
-            if updated_str:
-                entity_mtime = datetime.fromisoformat(updated_str).timestamp()
-                summary_mtime = summary_path.stat().st_mtime
-                if entity_mtime > summary_mtime:
-                    entity_ids.append(eid)
+        conn = index_conn()
+        if conn is not None:
+            # Dirty set kept by the write commands — no scan needed
+            entity_ids = [r[0] for r in conn.execute("SELECT entity_id FROM dirty ORDER BY entity_id")]
+            entity_ids = [eid for eid in entity_ids if (entity_dir(eid) / "entity.json").exists()]
+        else:
+            entity_ids = [eid for eid in list_all_entity_ids() if summary_is_stale(eid, load_entity(eid))]
     elif args.entity_id:
+        _ = load_entity(args.entity_id)  # validate
         entity_ids = [args.entity_id]
     else:
         error_out("Specify an entity ID, --all, or --dirty")
 
-    summaries = []
-    for eid in entity_ids:
-        _ = load_entity(eid)  # validate
-        text = generate_summary(eid)
-        summary_path = entity_dir(eid) / "summary.md"
-        atomic_write_text(summary_path, text)
-        summaries.append(eid)
-        log(f"summarize: {eid}")
-
-    output({"ok": True, "summarized": summaries, "count": len(summaries)})
+    written, timings = write_summaries(entity_ids, args.workers)
+    output({
+        "ok": True,
+        "summarized": entity_ids,
+        "count": len(entity_ids),
+        "written": written,
+        "unchanged": len(entity_ids) - written,
+        "timings_ms": timings,
+    })
 
 
 def cmd_archive(args):
@@ -726,7 +1812,8 @@ def cmd_archive(args):
             error_out(f"Entity '{entity_id}' is not archived")
         entity["status"] = "active"
         entity["updated"] = now_iso()
-        save_entity(entity_id, entity)
+        with kg_transaction():
+            save_entity(entity_id, entity)
         log(f"unarchive: {entity_id}")
         output({"ok": True, "entity_id": entity_id, "status": "active"})
     else:
@@ -734,7 +1821,8 @@ def cmd_archive(args):
             error_out(f"Entity '{entity_id}' is already archived")
         entity["status"] = "archived"
         entity["updated"] = now_iso()
-        save_entity(entity_id, entity)
+        with kg_transaction():
+            save_entity(entity_id, entity)
         log(f"archive: {entity_id}")
         output({"ok": True, "entity_id": entity_id, "status": "archived"})
 
@@ -755,11 +1843,9 @@ def cmd_merge(args):
     source_facts = load_facts(source_id)
     target_facts = load_facts(target_id)
 
-    target_slug = target_id.split("/")[1]
-
     # Re-ID source facts with target's slug
     for f in source_facts:
-        new_id = next_fact_id(target_facts + source_facts, target_slug)
+        new_id = next_fact_id(target, target_facts)
         old_id = f["id"]
         f["id"] = new_id
         f["merged_from"] = f"{source_id}:{old_id}"
@@ -776,11 +1862,13 @@ def cmd_merge(args):
     source_aliases = source.get("aliases", [])
     target_aliases = target.get("aliases", [])
     # Add source name as alias if different from target name
-    if source["name"].lower() != target["name"].lower():
+    if alias_key(source["name"]) != alias_key(target["name"]):
         source_aliases.append(source["name"])
+    known = {alias_key(a) for a in target_aliases + [target["name"]]}
     for alias in source_aliases:
-        if alias not in target_aliases and alias.lower() != target["name"].lower():
+        if alias_key(alias) not in known:
             target_aliases.append(alias)
+            known.add(alias_key(alias))
     target["aliases"] = target_aliases
 
     # Merge domains
@@ -791,26 +1879,33 @@ def cmd_merge(args):
             target_domains.append(d)
     target["domains"] = target_domains
 
-    # Update cross-entity relation targets
-    for eid in list_all_entity_ids():
-        if eid == source_id:
-            continue
-        facts = load_facts(eid)
-        changed = False
-        for f in facts:
-            if "relation" in f and f["relation"]["target"] == source_id:
-                f["relation"]["target"] = target_id
-                changed = True
-        if changed:
-            save_facts(eid, facts)
-
     target["updated"] = now_iso()
-    save_entity(target_id, target)
-    save_facts(target_id, target_facts)
 
-    # Delete source directory
-    source_dir = entity_dir(source_id)
-    shutil.rmtree(source_dir)
+    with kg_transaction():
+        # Update cross-entity relation targets
+        for eid in referencing_entities(source_id):
+            if eid == source_id:
+                continue
+            facts = load_facts(eid)
+            changed = False
+            for f in facts:
+                if "relation" in f and f["relation"]["target"] == source_id:
+                    f["relation"]["target"] = target_id
+                    changed = True
+            if changed:
+                save_facts(eid, facts)
+
+        save_entity(target_id, target)
+        save_facts(target_id, target_facts)
+
+        # Delete source directory
+        conn = index_conn()
+        if conn is not None:
+            note_entity_removed(conn, source_id)
+            index_delete_entity(conn, source_id)
+        source_dir = entity_dir(source_id)
+        note_written(source_id)
+        shutil.rmtree(source_dir)
 
     log(f"merge: {source_id} -> {target_id}")
     output({
@@ -821,6 +1916,424 @@ def cmd_merge(args):
     })
 
 
+def cmd_compact(args):
+    """Fold fact logs into their facts.json snapshots."""
+    if args.all:
+        entity_ids = [eid for eid in list_all_entity_ids() if (KG_ROOT / eid / "facts.jsonl").exists()]
+    elif args.entity_id:
+        _ = load_entity(args.entity_id)  # validate
+        entity_ids = [args.entity_id]
+    else:
+        error_out("Specify an entity ID or --all")
+
+    with kg_transaction():
+        compacted = [eid for eid in entity_ids if compact_facts(eid)]
+    log(f"compact: {len(compacted)} entities")
+    output({"ok": True, "compacted": compacted, "count": len(compacted)})
+
+
+def cmd_reindex(args):
+    """Rebuild the SQLite index from the JSON files."""
+    global _index
+    if _index is not None:
+        _index.close()
+        _index = None
+
+    INDEX_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp = INDEX_FILE.with_suffix(".tmp")
+    if tmp.exists():
+        tmp.unlink()
+    try:
+        counts = build_index(tmp)
+        os.replace(tmp, INDEX_FILE)
+    except Exception:
+        if tmp.exists():
+            tmp.unlink()
+        raise
+
+    log(f"reindex: {counts['entities']} entities, {counts['facts']} facts")
+    output({"ok": True, "index": str(INDEX_FILE), **counts})
+
+
+# --- Import / Export ---
+#
+# NDJSON, one record per line:
+#   {"kind": "entity", "type": "person", "name": "...", "aliases": [...], "domains": [...]}
+#   {"kind": "fact", "entity": "<id, name or alias>", "text": "...", "category": "role"}
+#   {"kind": "relation", "entity": "<ref>", "target": "<ref>", "relation_type": "leads"}
+# export writes the same kinds with full stored fields (entity_id plus the fact
+# as saved), so its output imports back losslessly.
+
+IMPORT_KINDS = ("entity", "fact", "relation")
+MAX_REPORTED_ERRORS = 50
+
+
+class AliasMap:
+    """In-memory name/alias/slug lookup, loaded once per import."""
+
+    def __init__(self):
+        self.names = {}  # entity ID -> display name
+        self.by_name = {}  # lowercased name or alias -> set of entity IDs
+        self.by_slug = {}  # slug -> set of entity IDs
+
+    @classmethod
+    def load(cls) -> "AliasMap":
+        amap = cls()
+        for entity in all_entities():
+            amap.add(entity)
+        return amap
+
+    def add(self, entity: dict):
+        eid = entity["id"]
+        self.names[eid] = entity["name"]
+        for key in [entity["name"]] + entity.get("aliases", []):
+            self.by_name.setdefault(alias_key(key), set()).add(eid)
+        self.by_slug.setdefault(eid.split("/")[1], set()).add(eid)
+
+    def matches(self, name: str) -> set:
+        """Entity IDs colliding with name, using find_by_alias rules."""
+        return self.by_name.get(alias_key(name), set()) | self.by_slug.get(slugify(name), set())
+
+    def resolve(self, ref: str) -> tuple:
+        """Resolve an entity ID, name or alias. Returns (entity_id, problem)."""
+        if ref in self.names:
+            return ref, None
+        found = sorted(self.matches(ref))
+        if len(found) == 1:
+            return found[0], None
+        if not found:
+            return None, f"Unknown entity '{ref}'"
+        return None, f"Ambiguous entity '{ref}': matches {found}"
+
+
+def read_ndjson(path: str) -> tuple:
+    """Parse NDJSON from a file or '-' for stdin. Returns ([(line_no, record)], errors)."""
+    records, errors = [], []
+    stream = sys.stdin if path == "-" else open(path)
+    try:
+        for line_no, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except ValueError as e:
+                errors.append({"line": line_no, "error": f"Invalid JSON: {e}"})
+                continue
+            if not isinstance(record, dict) or record.get("kind") not in IMPORT_KINDS:
+                errors.append({"line": line_no, "error": f"Record kind must be one of {list(IMPORT_KINDS)}"})
+                continue
+            records.append((line_no, record))
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+    return records, errors
+
+
+def string_list(value) -> list:
+    """Accept a list of strings or a comma-separated string."""
+    if isinstance(value, str):
+        value = value.split(",")
+    return [v.strip() for v in value or [] if isinstance(v, str) and v.strip()]
+
+
+def plan_entity(record: dict, amap: AliasMap, plan: dict) -> str:
+    """Stage one entity record into plan. Returns a problem string or None."""
+    name = record.get("name")
+    if not isinstance(name, str) or not name.strip():
+        return "Entity record needs a name"
+    name = name.strip()
+    aliases = string_list(record.get("aliases"))
+    domains = string_list(record.get("domains"))
+
+    entity_id = record.get("id")
+    if entity_id is not None:
+        if not isinstance(entity_id, str):
+            return "Entity id must be a string"
+        problem = entity_id_problem(entity_id)
+        if problem:
+            return problem
+    else:
+        etype = record.get("type")
+        if etype not in ENTITY_TYPES:
+            return f"Invalid entity type '{etype}': must be one of {ENTITY_TYPES}"
+        slug = slugify(name)
+        if not validate_slug(slug):
+            return f"Name '{name}' produces invalid slug '{slug}'"
+        entity_id = f"{etype}/{slug}"
+        if entity_id not in amap.names:
+            # Same person under another slug: merge into them rather than duplicate
+            found = sorted(amap.matches(name))
+            if len(found) > 1:
+                return f"Ambiguous entity '{name}': matches {found}"
+            if found:
+                entity_id = found[0]
+
+    entity = plan["entities"].get(entity_id)
+    if entity is None and entity_id in amap.names:
+        entity = load_entity(entity_id)
+    if entity is None:
+        etype, slug = entity_id.split("/")
+        status = record.get("status", "active")
+        if status not in ("active", "archived"):
+            return f"Invalid entity status '{status}'"
+        entity = {
+            "id": entity_id,
+            "type": etype,
+            "name": name,
+            "slug": slug,
+            "aliases": aliases,
+            "domains": domains,
+            "status": status,
+            "created": record.get("created") or now_iso(),
+            "updated": now_iso(),
+        }
+        plan["entities"][entity_id] = entity
+        plan["created"].add(entity_id)
+        amap.add(entity)
+        return None
+
+    # Existing entity: only add what it doesn't already know
+    known = {alias_key(a) for a in entity.get("aliases", []) + [entity["name"]]}
+    new_aliases = list({alias_key(a): a for a in aliases + [name] if alias_key(a) not in known}.values())
+    new_domains = [d for d in domains if d not in entity.get("domains", [])]
+    if new_aliases or new_domains:
+        entity["aliases"] = entity.get("aliases", []) + new_aliases
+        entity["domains"] = entity.get("domains", []) + list(dict.fromkeys(new_domains))
+        plan["entities"][entity_id] = entity
+        amap.add(entity)
+    return None
+
+
+def plan_fact(record: dict, amap: AliasMap, plan: dict, source: str) -> str:
+    """Stage one fact or relation record into plan. Returns a problem string or None."""
+    ref = record.get("entity_id", record.get("entity"))
+    if not isinstance(ref, str):
+        return "Fact record needs an entity"
+    entity_id, problem = amap.resolve(ref)
+    if problem:
+        return problem
+
+    relation = None
+    if record["kind"] == "relation":
+        rel = record.get("relation") or {}
+        rtype = rel.get("type", record.get("relation_type"))
+        target_ref = rel.get("target", record.get("target"))
+        if rtype not in RELATION_TYPES:
+            return f"Invalid relation type '{rtype}': must be one of {RELATION_TYPES}"
+        if not isinstance(target_ref, str):
+            return "Relation record needs a target"
+        target_id, problem = amap.resolve(target_ref)
+        if problem:
+            return problem
+        relation = {"type": rtype, "target": target_id}
+
+    text = record.get("text")
+    if text is None and relation:
+        text = f"{amap.names[entity_id]} {relation['type'].replace('_', ' ')} {amap.names[relation['target']]}"
+    if not isinstance(text, str) or not text.strip():
+        return "Fact record needs text"
+    text = text.strip()
+    if len(text) > MAX_FACT_LENGTH:
+        return f"Fact too long ({len(text)} chars, max {MAX_FACT_LENGTH})"
+    category = record.get("category", "relationship" if relation else None)
+    if category not in FACT_CATEGORIES:
+        return f"Invalid category '{category}': must be one of {FACT_CATEGORIES}"
+    status = record.get("status", "active")
+    if status not in ("active", "superseded"):
+        return f"Invalid fact status '{status}'"
+
+    group = plan["facts"].get(entity_id)
+    if group is None:
+        existing = [] if entity_id in plan["created"] else load_facts(entity_id)
+        entity = plan["entities"].get(entity_id) or load_entity(entity_id)
+        group = {
+            "archived": entity_id not in plan["created"] and entity.get("status") == "archived",
+            "existing": existing,
+            "new": [],
+            "ids": {f["id"] for f in existing},
+            "keys": {fact_key(f) for f in existing},
+        }
+        plan["facts"][entity_id] = group
+
+    fact = {"id": record.get("id"), "text": text, "category": category, "status": status}
+    if relation:
+        fact["relation"] = relation
+    key = fact_key(fact)
+    if key in group["keys"]:
+        plan["skipped"] += 1
+        return None
+    if group["archived"]:
+        return f"Entity '{entity_id}' is archived. Unarchive first."
+
+    fact["created"] = record.get("created") or now_iso()
+    fact["source"] = record.get("source") or source
+    for extra in ("supersedes", "superseded_at", "merged_from"):
+        if record.get(extra):
+            fact[extra] = record[extra]
+    if relation:
+        # keep "relation" last, as add-relation writes it
+        fact["relation"] = fact.pop("relation")
+    group["keys"].add(key)
+    group["new"].append(fact)
+    return None
+
+
+def fact_key(fact: dict) -> tuple:
+    """Identity used to skip facts the entity already has."""
+    relation = fact.get("relation") or {}
+    return fact["text"], relation.get("type"), relation.get("target")
+
+
+def assign_fact_ids(entity: dict, group: dict) -> list:
+    """Give imported facts IDs, keeping the record's ID when it is free.
+
+    Counts on from the entity's fact_seq, advancing it past any kept IDs.
+    Returns the full fact list to save.
+    """
+    slug = entity["slug"]
+    seq = max(
+        entity.get("fact_seq", 0),
+        max_fact_number(group["existing"] + [f for f in group["new"] if isinstance(f["id"], str)]),
+    )
+    renamed = {}
+    for f in group["new"]:
+        old_id = f["id"]
+        if not isinstance(old_id, str) or not old_id or old_id in group["ids"]:
+            seq += 1
+            f["id"] = f"{slug}-{seq:03d}"
+            if old_id:
+                renamed[old_id] = f["id"]
+        group["ids"].add(f["id"])
+    for f in group["new"]:
+        if f.get("supersedes") in renamed:
+            f["supersedes"] = renamed[f["supersedes"]]
+    entity["fact_seq"] = seq
+    return group["existing"] + group["new"]
+
+
+def cmd_import(args):
+    """Bulk-load entities, facts and relations from NDJSON."""
+    timings = {}
+    start = time.perf_counter()
+    records, errors = read_ndjson(args.file)
+    timings["parse"] = time.perf_counter() - start
+
+    # Entities first so facts and relations can refer to ones defined later in the file
+    start = time.perf_counter()
+    amap = AliasMap.load()
+    plan = {"entities": {}, "created": set(), "facts": {}, "skipped": 0}
+    for line_no, record in records:
+        if record["kind"] == "entity":
+            problem = plan_entity(record, amap, plan)
+            if problem:
+                errors.append({"line": line_no, "error": problem})
+    for line_no, record in records:
+        if record["kind"] != "entity":
+            problem = plan_fact(record, amap, plan, args.source)
+            if problem:
+                errors.append({"line": line_no, "error": problem})
+    timings["validate"] = time.perf_counter() - start
+
+    if errors:
+        errors.sort(key=lambda e: e["line"])
+        output({
+            "error": f"{len(errors)} invalid record(s); nothing imported",
+            "errors": errors[:MAX_REPORTED_ERRORS],
+        })
+        sys.exit(1)
+
+    new_facts = [f for group in plan["facts"].values() for f in group["new"]]
+    # Entities whose files change; a file of pure duplicates touches nothing
+    touched = sorted(set(plan["entities"]) | {eid for eid, group in plan["facts"].items() if group["new"]})
+    result = {
+        "ok": True,
+        "dry_run": args.dry_run,
+        "records": len(records),
+        "entities_created": len(plan["created"]),
+        "entities_updated": len(touched) - len(plan["created"]),
+        "facts_added": len([f for f in new_facts if "relation" not in f]),
+        "relations_added": len([f for f in new_facts if "relation" in f]),
+        "duplicates_skipped": plan["skipped"],
+    }
+    if args.dry_run:
+        output(result)
+        return
+
+    # One entity.json and one facts.json write per touched entity
+    start = time.perf_counter()
+    with kg_transaction():
+        for eid in touched:
+            entity = plan["entities"].get(eid) or load_entity(eid)
+            if eid not in plan["created"]:
+                entity["updated"] = now_iso()
+            entity_dir(eid).mkdir(parents=True, exist_ok=True)
+            if plan["facts"].get(eid, {}).get("new"):
+                save_facts(eid, assign_fact_ids(entity, plan["facts"][eid]))
+            elif eid in plan["created"]:
+                save_facts(eid, [])
+            save_entity(eid, entity)
+    timings["write"] = time.perf_counter() - start
+    result["timings_ms"] = {phase: round(t * 1000, 1) for phase, t in timings.items()}
+
+    if args.no_summarize:
+        result["summaries_written"] = 0
+    else:
+        result["summaries_written"], summary_timings = write_summaries(touched, args.workers)
+        result["timings_ms"]["summarize"] = round(sum(summary_timings.values()), 1)
+
+    log(f"import: {result['entities_created']} created, {result['entities_updated']} updated, "
+        f"{result['facts_added']} facts, {result['relations_added']} relations")
+    output(result)
+
+
+def export_records():
+    """Yield NDJSON records: every entity first, then each entity's facts."""
+    entities = all_entities()
+    for entity in entities:
+        yield {"kind": "entity", **entity}
+    for entity in entities:
+        for f in load_facts(entity["id"]):
+            kind = "relation" if "relation" in f else "fact"
+            yield {"kind": kind, "entity_id": entity["id"], **f}
+
+
+def cmd_export(args):
+    """Stream the graph as NDJSON to stdout or a file."""
+    counts = {"entity": 0, "fact": 0, "relation": 0}
+
+    def write_all(stream):
+        for record in export_records():
+            counts[record["kind"]] += 1
+            stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+    if args.output == "-":
+        write_all(sys.stdout)
+        return
+
+    path = Path(args.output)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            write_all(f)
+        os.rename(tmp, path)
+    except Exception:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+    log(f"export: {counts['entity']} entities to {path}")
+    output({
+        "ok": True,
+        "file": str(path),
+        "entities": counts["entity"],
+        "facts": counts["fact"],
+        "relations": counts["relation"],
+    })
+
+
 # --- Seed Data ---
 
 SEED_DATA = {
@@ -1012,6 +2525,13 @@ def cmd_seed(args):
         if existing:
             error_out(f"KG already has {len(existing)} entities. Use --force to seed anyway.")
 
+    with kg_transaction():
+        result = _seed()
+    output(result)
+
+
+def _seed() -> dict:
+    """Write seed entities, relations and summaries. Returns the result payload."""
     created_entities = []
     created_facts = []
     created_relations = []
@@ -1039,11 +2559,10 @@ def cmd_seed(args):
         }
 
         d.mkdir(parents=True, exist_ok=True)
-        atomic_write_json(d / "entity.json", entity)
 
         facts = []
         for category, text in e.get("facts", []):
-            fact_id = next_fact_id(facts, slug)
+            fact_id = next_fact_id(entity, facts)
             fact = {
                 "id": fact_id,
                 "text": text,
@@ -1055,22 +2574,21 @@ def cmd_seed(args):
             facts.append(fact)
             created_facts.append(fact_id)
 
-        atomic_write_json(d / "facts.json", facts)
+        save_entity(entity_id, entity)
+        save_facts(entity_id, facts)
         created_entities.append(entity_id)
 
     # Add relations (resolve names to entity IDs)
     for src_name, src_type, tgt_name, tgt_type, rel_type, fact_text in SEED_DATA["relations"]:
         source_id = f"{src_type}/{slugify(src_name)}"
         target_id = f"{tgt_type}/{slugify(tgt_name)}"
-        source_slug = slugify(src_name)
-        facts = load_facts(source_id)
+        source_entity = load_entity(source_id)
 
         if not fact_text:
-            source_entity = load_entity(source_id)
             target_entity = load_entity(target_id)
             fact_text = f"{source_entity['name']} {rel_type.replace('_', ' ')} {target_entity['name']}"
 
-        fact_id = next_fact_id(facts, source_slug)
+        fact_id = next_fact_id(source_entity)
         fact = {
             "id": fact_id,
             "text": fact_text,
@@ -1083,24 +2601,227 @@ def cmd_seed(args):
                 "target": target_id,
             },
         }
-        facts.append(fact)
-        save_facts(source_id, facts)
+        record_facts(source_id, [fact])
+        save_entity(source_id, source_entity)
         created_relations.append(f"{source_id} --{rel_type}--> {target_id}")
 
     # Generate summaries for all
     for eid in created_entities:
-        text = generate_summary(eid)
-        summary_path = entity_dir(eid) / "summary.md"
-        atomic_write_text(summary_path, text)
+        save_summary(eid, generate_summary(eid))
 
     log(f"seed: {len(created_entities)} entities, {len(created_facts)} facts, {len(created_relations)} relations")
-    output({
+    return {
         "ok": True,
         "entities_created": len(created_entities),
         "facts_created": len(created_facts),
         "relations_created": len(created_relations),
         "entity_ids": created_entities,
-    })
+    }
+
+
+# --- Daemon ---
+#
+# `kg.py serve` keeps one process warm: the index connection stays open and
+# JSON files are cached by stat signature. Requests are one JSON line,
+# {"argv": ["query", "person/rick-arnold"]}, answered with one JSON line,
+# {"exit": 0, "result": {...}}. Requests run one at a time because commands
+# share module state and write to stdout.
+
+# Commands that must run in the caller's own process
+DIRECT_COMMANDS = {"serve", "import", "export"}
+
+
+class KGWatcher:
+    """Polls entity directory mtimes and re-indexes entities edited outside kg.py."""
+
+    def __init__(self, interval: float):
+        self.interval = interval
+        self.next_poll = time.monotonic() + interval
+        self.snapshot = self.scan()
+
+    @staticmethod
+    def signature(entity_id: str):
+        """Stat signature of an entity's source files, or None if it's gone.
+
+        summary.md is left out: it is derived from the other files, and
+        counting it would make every summarize look like an outside edit.
+        """
+        sig = []
+        try:
+            with os.scandir(KG_ROOT / entity_id) as it:
+                for entry in it:
+                    if entry.name == "summary.md" or entry.name.endswith(".tmp"):
+                        continue
+                    st = entry.stat()
+                    sig.append((entry.name, st.st_mtime_ns, st.st_size))
+        except FileNotFoundError:
+            return None
+        return tuple(sorted(sig))
+
+    def scan(self) -> dict:
+        """Map entity ID -> stat signature of its files."""
+        snapshot = {}
+        for eid in list_all_entity_ids():
+            sig = self.signature(eid)
+            if sig is not None:
+                snapshot[eid] = sig
+        return snapshot
+
+    def refresh_written(self):
+        """Re-take the snapshot for entities the daemon itself just wrote."""
+        for eid in _written_entities or ():
+            sig = self.signature(eid)
+            if sig is None:
+                self.snapshot.pop(eid, None)
+            else:
+                self.snapshot[eid] = sig
+        if _written_entities:
+            _written_entities.clear()
+
+    def poll(self):
+        if time.monotonic() < self.next_poll:
+            return
+        self.next_poll = time.monotonic() + self.interval
+        current = self.scan()
+        changed = [eid for eid, sig in current.items() if self.snapshot.get(eid) != sig]
+        removed = [eid for eid in self.snapshot if eid not in current]
+        self.snapshot = current
+        if not changed and not removed:
+            return
+        conn = index_conn()
+        if conn is None:
+            return
+        try:
+            with kg_transaction():
+                for eid in changed:
+                    note_entity_change(conn, load_entity(eid))
+                    index_entity_from_files(conn, eid)
+                for eid in removed:
+                    note_entity_removed(conn, eid)
+                    index_delete_entity(conn, eid)
+        except (Exception, SystemExit) as e:
+            log(f"serve: watcher re-index failed ({e})")
+            return
+        log(f"serve: re-indexed {len(changed)} changed, {len(removed)} removed")
+
+
+class KGServer(socketserver.UnixStreamServer):
+    def __init__(self, path: str, watcher: KGWatcher):
+        self.watcher = watcher
+        super().__init__(path, KGRequestHandler)
+
+    def service_actions(self):
+        # Called by serve_forever() between requests
+        self.watcher.poll()
+
+
+class KGRequestHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        try:
+            request = json.loads(self.rfile.readline())
+            argv = request["argv"]
+            if not isinstance(argv, list) or not all(isinstance(a, str) for a in argv):
+                raise ValueError("argv must be a list of strings")
+        except (ValueError, KeyError, TypeError) as e:
+            response = {"exit": 1, "result": {"error": f"Bad request: {e}"}}
+        else:
+            response = run_argv(argv, fact_log=bool(request.get("fact_log")))
+            # The daemon's own writes are already indexed; don't re-index them on the next poll
+            self.server.watcher.refresh_written()
+        self.wfile.write((json.dumps(response) + "\n").encode())
+
+
+def run_argv(argv: list, fact_log: bool = False) -> dict:
+    """Run one command in-process, capturing its output as a daemon response.
+
+    fact_log turns the fact log on for this command, as KG_FACT_LOG would.
+    """
+    global _request_fact_log
+    out, err = io.StringIO(), io.StringIO()
+    code = 0
+    _request_fact_log = fact_log
+    with redirect_stdout(out), redirect_stderr(err):
+        try:
+            args = build_parser().parse_args(argv)
+            if args.command in DIRECT_COMMANDS:
+                error_out(f"'{args.command}' can't run through the daemon")
+            run_command(args)
+        except SystemExit as e:
+            code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+        finally:
+            _request_fact_log = False
+
+    response = {"exit": code}
+    text = out.getvalue()
+    try:
+        response["result"] = json.loads(text)
+    except ValueError:
+        response["stdout"] = text
+    if err.getvalue():
+        response["stderr"] = err.getvalue()
+    return response
+
+
+def daemon_request(argv: list):
+    """Send argv to a running daemon. Returns its response, or None if none is listening."""
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(1.0)
+    try:
+        sock.connect(str(SOCKET_FILE))
+    except OSError:
+        sock.close()
+        return None
+    # Connected: from here on the daemon may act on the request, so never fall back
+    with sock:
+        sock.settimeout(300)
+        request = {"argv": argv}
+        if fact_log_enabled():
+            request["fact_log"] = True
+        sock.sendall((json.dumps(request) + "\n").encode())
+        data = b""
+        while not data.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data += chunk
+    try:
+        return json.loads(data)
+    except ValueError:
+        error_out("kg daemon closed the connection without a response")
+
+
+def cmd_serve(args):
+    """Run the daemon on a Unix socket until interrupted."""
+    global _file_cache, _written_entities
+    if daemon_request(["stats"]) is not None:
+        error_out(f"A kg daemon is already listening on {SOCKET_FILE}")
+    SOCKET_FILE.parent.mkdir(parents=True, exist_ok=True)
+    if SOCKET_FILE.exists() or SOCKET_FILE.is_symlink():
+        SOCKET_FILE.unlink()
+
+    # Warm the cache so the first request doesn't pay for a full walk
+    _file_cache = {}
+    for eid in list_all_entity_ids():
+        load_entity(eid)
+        load_facts(eid)
+
+    _written_entities = set()
+    old_umask = os.umask(0o177)
+    try:
+        server = KGServer(str(SOCKET_FILE), KGWatcher(args.watch_interval))
+    finally:
+        os.umask(old_umask)
+    signal.signal(signal.SIGTERM, lambda *_: sys.exit(0))
+    log(f"serve: listening on {SOCKET_FILE}")
+    try:
+        server.serve_forever(poll_interval=min(args.watch_interval, 0.5))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        if SOCKET_FILE.exists():
+            SOCKET_FILE.unlink()
+        log("serve: stopped")
 
 
 # --- Argument Parser ---
@@ -1148,15 +2869,45 @@ def build_parser():
     p.add_argument("entity_id", help="Entity ID (type/slug)")
     p.add_argument("--include-archived", action="store_true", help="Include archived facts")
 
+    # resolve
+    p = subparsers.add_parser("resolve", help="Find entities by name or alias, plus near matches")
+    p.add_argument("name", help="Name, alias or entity ID")
+    p.add_argument("--limit", type=int, default=5, help="Max near-match candidates (default: 5)")
+
     # connections
     p = subparsers.add_parser("connections", help="Show entity connections")
     p.add_argument("entity_id", help="Entity ID (type/slug)")
     p.add_argument("--reverse", action="store_true", help="Include inbound connections")
 
+    # path
+    p = subparsers.add_parser("path", help="Find relation paths between two entities")
+    p.add_argument("source_id", help="Start entity ID")
+    p.add_argument("target_id", help="End entity ID")
+    p.add_argument("--max-depth", type=int, default=4, help="Max hops per path (default: 4)")
+    p.add_argument("--limit", type=int, default=5, help="Max paths to return (default: 5)")
+    p.add_argument("--relation-types", default="", help="Comma-separated relation types to follow")
+    p.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES, help="Cap on explored nodes")
+
+    # shortest-path
+    p = subparsers.add_parser("shortest-path", help="Shortest relation path between two entities")
+    p.add_argument("source_id", help="Start entity ID")
+    p.add_argument("target_id", help="End entity ID")
+    p.add_argument("--relation-types", default="", help="Comma-separated relation types to follow")
+    p.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES, help="Cap on explored nodes")
+
+    # neighborhood
+    p = subparsers.add_parser("neighborhood", help="Entities within N relation hops")
+    p.add_argument("entity_id", help="Entity ID (type/slug)")
+    p.add_argument("--depth", type=int, default=2, help="Max hops (default: 2)")
+    p.add_argument("--relation-types", default="", help="Comma-separated relation types to follow")
+    p.add_argument("--max-nodes", type=int, default=DEFAULT_MAX_NODES, help="Cap on explored nodes")
+
     # search
     p = subparsers.add_parser("search", help="Search all entities")
-    p.add_argument("query", help="Search text")
+    p.add_argument("query", help='Search text — "exact phrase", prefix*')
     p.add_argument("--include-archived", action="store_true", help="Include archived entities")
+    p.add_argument("--limit", type=int, default=20, help="Max results (default: 20)")
+    p.add_argument("--offset", type=int, default=0, help="Skip this many results")
 
     # domain
     p = subparsers.add_parser("domain", help="Filter entities by domain")
@@ -1176,6 +2927,8 @@ def build_parser():
     p.add_argument("entity_id", nargs="?", default=None, help="Entity ID (or use --all/--dirty)")
     p.add_argument("--all", action="store_true", help="Summarize all entities")
     p.add_argument("--dirty", action="store_true", help="Summarize only entities with stale summaries")
+    p.add_argument("--workers", type=int, default=0,
+                   help=f"Render processes for batches of {PARALLEL_SUMMARY_MIN}+ (default: CPU count, max 8)")
 
     # archive
     p = subparsers.add_parser("archive", help="Archive or unarchive an entity")
@@ -1187,6 +2940,31 @@ def build_parser():
     p.add_argument("source_id", help="Source entity ID (will be deleted)")
     p.add_argument("target_id", help="Target entity ID (will receive facts)")
 
+    # import
+    p = subparsers.add_parser("import", help="Bulk-load entities, facts and relations from NDJSON")
+    p.add_argument("file", help="NDJSON file, or - for stdin")
+    p.add_argument("--source", default="import", help="Source for facts that don't name one (default: import)")
+    p.add_argument("--dry-run", action="store_true", help="Validate and report without writing")
+    p.add_argument("--no-summarize", action="store_true", help="Leave summaries for `summarize --dirty`")
+    p.add_argument("--workers", type=int, default=0, help="Summary render processes (see summarize)")
+
+    # export
+    p = subparsers.add_parser("export", help="Write the whole graph as NDJSON")
+    p.add_argument("--output", default="-", help="Output file (default: stdout)")
+
+    # compact
+    p = subparsers.add_parser("compact", help="Fold facts.jsonl logs into facts.json")
+    p.add_argument("entity_id", nargs="?", default=None, help="Entity ID (or use --all)")
+    p.add_argument("--all", action="store_true", help="Compact every entity with a fact log")
+
+    # reindex
+    p = subparsers.add_parser("reindex", help="Rebuild the SQLite index from the JSON files")
+
+    # serve
+    p = subparsers.add_parser("serve", help="Run the kg daemon on a Unix socket")
+    p.add_argument("--watch-interval", type=float, default=WATCH_INTERVAL,
+                   help=f"Seconds between checks for outside edits (default: {WATCH_INTERVAL})")
+
     # seed
     p = subparsers.add_parser("seed", help="Seed knowledge graph with built-in data")
     p.add_argument("--force", action="store_true", help="Seed even if entities exist")
@@ -1194,12 +2972,10 @@ def build_parser():
     return parser
 
 
-def main():
-    parser = build_parser()
-    args = parser.parse_args()
-
+def run_command(args):
+    """Dispatch parsed args to their command function."""
     if not args.command:
-        parser.print_help()
+        build_parser().print_help()
         sys.exit(1)
 
     commands = {
@@ -1208,7 +2984,11 @@ def main():
         "supersede": cmd_supersede,
         "add-relation": cmd_add_relation,
         "query": cmd_query,
+        "resolve": cmd_resolve,
         "connections": cmd_connections,
+        "path": cmd_path,
+        "shortest-path": cmd_shortest_path,
+        "neighborhood": cmd_neighborhood,
         "search": cmd_search,
         "domain": cmd_domain,
         "list": cmd_list,
@@ -1217,6 +2997,11 @@ def main():
         "archive": cmd_archive,
         "merge": cmd_merge,
         "seed": cmd_seed,
+        "import": cmd_import,
+        "export": cmd_export,
+        "compact": cmd_compact,
+        "reindex": cmd_reindex,
+        "serve": cmd_serve,
     }
 
     fn = commands.get(args.command)
@@ -1228,9 +3013,27 @@ def main():
         except Exception as e:
             error_out(f"Unexpected error: {e}")
     else:
-        parser.print_help()
+        build_parser().print_help()
         sys.exit(1)
 
 
+def main():
+    argv = sys.argv[1:]
+    args = build_parser().parse_args(argv)
+
+    # Thin client: hand the command to a running daemon, else run it here
+    if args.command and args.command not in DIRECT_COMMANDS and not os.environ.get("KG_NO_DAEMON"):
+        response = daemon_request(argv)
+        if response is not None:
+            if "result" in response:
+                output(response["result"])
+            else:
+                sys.stdout.write(response.get("stdout", ""))
+            sys.stderr.write(response.get("stderr", ""))
+            sys.exit(response["exit"])
+
+    run_command(args)
+
+
 if __name__ == "__main__":
     main()